@@ -31,12 +31,13 @@ Copyright (c) 2025 KoreawookDevTeam. All rights reserved.
 """
 
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, filedialog
 from PIL import Image, ImageTk, ImageDraw
 import sys
 import os
 import time
 import json
+import logging
 from datetime import datetime, timedelta
 import threading
 import urllib.request
@@ -49,6 +50,31 @@ import ctypes
 from ctypes import wintypes
 import random
 import glob
+import math
+import functools
+import itertools
+from break_scheduler import BreakScheduler
+from tick_timer import AlignedTicker, next_boundary
+from notification_queue import NotificationQueue
+from level_curve import make_curve
+from rest_journal import RestJournal
+from rest_analytics import SessionColumns
+from history_chart import HistoryChart
+from rest_archive import RestArchive, archive_cutoff, DEFAULT_KEEP_MONTHS
+from achievements import AchievementTracker, DEFAULT_DAILY_GOAL
+from write_behind import WriteBehindStore, DEFAULT_FLUSH_INTERVAL
+import json_store
+from sqlite_store import SqliteStore
+import app_log
+from span_tracer import tracer, TRACE_FILE_NAME
+import metrics
+from metrics import CallbackMetric, MetricsServer
+from stall_watchdog import StallWatchdog, STALL_FILE_NAME, HEARTBEAT_MS
+from diagnostics import slow_callbacks, pending_after, process_rss, thread_names, format_bytes
+
+# 로그 (app_log.setup() 후에는 백그라운드 스레드가 clockapp.log에 기록)
+log = app_log.get_logger()
+popup_log = app_log.get_logger("popup")
 
 # 강제 휴식 모드를 위한 Windows API 함수들
 user32 = ctypes.windll.user32
@@ -72,25 +98,104 @@ ssl_context.verify_mode = ssl.CERT_NONE
 WEATHER_CACHE_FILE = "weather_cache.json"
 WEATHER_CACHE_DURATION = 7200  # 2시간 (초 단위)
 
+# 지연 쓰기 상태 저장소 (설정/레벨 스냅샷/휴식 메시지/날씨 캐시를 모아서 주기적으로 기록)
+state_store = WriteBehindStore()
+
+# SQLite 저장소 (설정 파일의 "storage_backend": "sqlite"일 때만 사용, 기본은 JSON 파일)
+STATE_DB_FILE = "clock_state.db"
+state_db = None
+
+# 데드라인 스케줄러 최대 대기 시간 (초) - 시스템 시각 변경/절전 복귀 대비
+SCHEDULER_MAX_SLEEP = 60
+
 # 레벨업 팝업 전역 관리
 current_levelup_popup = None
 
+# 성능 지표 (설정 "metrics_port"가 0이 아니면 http://127.0.0.1:<port>/metrics 로 제공)
+POPUP_EVENTS = metrics.registry.counter(
+    "clockapp_popups_total", "알림 팝업 표시(shown)/닫힘(dismissed) 횟수", ("kind", "event"))
+WEATHER_FETCH_SECONDS = metrics.registry.histogram(
+    "clockapp_weather_fetch_seconds", "날씨 API 호출 시간 (초)", ("result",))
+WEATHER_CACHE_LOOKUPS = metrics.registry.counter(
+    "clockapp_weather_cache_lookups_total", "날씨 캐시 조회 결과 (hit/miss)", ("result",))
+TK_CALLBACK_SECONDS = metrics.registry.histogram(
+    "clockapp_tk_callback_seconds", "Tk 콜백 실행 시간 (초)", ("callback",))
+
+
+def tk_callback(name):
+    """Tk 콜백 실행 시간 기록 데코레이터 (지표 히스토그램 + 진단 창의 느린 콜백 목록)"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                TK_CALLBACK_SECONDS.observe(elapsed, callback=name)
+                slow_callbacks.record(name, elapsed)
+        return wrapper
+    return decorator
+
+
+def weather_cache_hit_ratio():
+    """날씨 캐시 적중률 (조회가 없으면 0)"""
+    hits = WEATHER_CACHE_LOOKUPS.value(result="hit")
+    total = hits + WEATHER_CACHE_LOOKUPS.value(result="miss")
+    return hits / total if total else 0.0
+
+
+def register_app_metrics(ticker, watchdog=None):
+    """다른 곳에서 이미 세고 있는 값을 수집 시점에 읽는 지표 등록"""
+    registry = metrics.registry
+    if watchdog is not None:
+        registry.register(CallbackMetric(
+            "clockapp_ui_stalls_total", "counter", "UI 멈춤 감지 횟수 (이번 실행)",
+            lambda: [("", {}, watchdog.stats["stalls"])]))
+    registry.register(CallbackMetric(
+        "clockapp_tick_lateness_seconds", "histogram", "시계 틱이 목표 시각보다 늦게 실행된 시간 (초)",
+        ticker.lateness.prometheus_samples))
+    registry.register(CallbackMetric(
+        "clockapp_weather_cache_hit_ratio", "gauge", "날씨 캐시 적중률",
+        lambda: [("", {}, weather_cache_hit_ratio())]))
+    registry.register(CallbackMetric(
+        "clockapp_file_writes_total", "counter", "상태 파일 쓰기 횟수",
+        lambda: [("", {}, json_store.stats["writes"])]))
+    registry.register(CallbackMetric(
+        "clockapp_file_written_bytes_total", "counter", "상태 파일에 쓴 바이트",
+        lambda: [("", {}, json_store.stats["bytes_written"])]))
+
+
+def start_metrics_server(port):
+    """지표 HTTP 서버 시작 (port가 0/없으면 시작하지 않음) - 서버 또는 None"""
+    if not port:
+        return None
+    try:
+        server = MetricsServer(metrics.registry, int(port))
+        server.start()
+        log.info("성능 지표 제공: http://127.0.0.1:%d/metrics", server.port)
+        return server
+    except (OSError, ValueError) as e:
+        log.warning("성능 지표 서버 시작 실패 (포트 %s): %s", port, e)
+        return None
+
 def load_weather_cache():
     """날씨 캐시 로드"""
     try:
-        if os.path.exists(WEATHER_CACHE_FILE):
-            with open(WEATHER_CACHE_FILE, 'r', encoding='utf-8') as f:
-                cache = json.load(f)
-                cache_time = datetime.fromisoformat(cache['timestamp'])
-                
-                # 2시간 이내 캐시인지 확인
-                if datetime.now() - cache_time < timedelta(seconds=WEATHER_CACHE_DURATION):
-                    print(f"날씨 캐시 사용 (저장 시각: {cache_time.strftime('%H:%M:%S')})")
-                    return cache['data']
-                else:
-                    print(f"날씨 캐시 만료 (저장 시각: {cache_time.strftime('%H:%M:%S')})")
+        cache = state_store.load(WEATHER_CACHE_FILE)
+        if cache:
+            cache_time = datetime.fromisoformat(cache['timestamp'])
+            
+            # 2시간 이내 캐시인지 확인
+            if datetime.now() - cache_time < timedelta(seconds=WEATHER_CACHE_DURATION):
+                log.info("날씨 캐시 사용 (저장 시각: %s)", cache_time.strftime('%H:%M:%S'))
+                WEATHER_CACHE_LOOKUPS.inc(result="hit")
+                return cache['data']
+            else:
+                log.info("날씨 캐시 만료 (저장 시각: %s)", cache_time.strftime('%H:%M:%S'))
     except Exception as e:
-        print(f"날씨 캐시 로드 실패: {e}")
+        log.warning("날씨 캐시 로드 실패: %s", e)
+    WEATHER_CACHE_LOOKUPS.inc(result="miss")
     return None
 
 def save_weather_cache(weather_data):
@@ -100,11 +205,10 @@ def save_weather_cache(weather_data):
             'timestamp': datetime.now().isoformat(),
             'data': weather_data
         }
-        with open(WEATHER_CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(cache, f, ensure_ascii=False, indent=2)
-        print(f"날씨 캐시 저장 완료: {datetime.now().strftime('%H:%M:%S')}")
+        state_store.put(WEATHER_CACHE_FILE, cache)
+        log.info("날씨 캐시 저장 완료: %s", datetime.now().strftime('%H:%M:%S'))
     except Exception as e:
-        print(f"날씨 캐시 저장 실패: {e}")
+        log.warning("날씨 캐시 저장 실패: %s", e)
 
 # 컬러풀한 아이콘 생성 함수 (이미지 파일 사용)
 def load_icon_image(icon_type, size=24):
@@ -115,10 +219,10 @@ def load_icon_image(icon_type, size=24):
             img = Image.open(filename)
             return ImageTk.PhotoImage(img)
         else:
-            print(f"아이콘 파일을 찾을 수 없음: {filename}")
+            log.warning("아이콘 파일을 찾을 수 없음: %s", filename)
             return None
     except Exception as e:
-        print(f"아이콘 로드 오류: {e}")
+        log.error("아이콘 로드 오류: %s", e)
         return None
 
 def create_weather_icon(weather_type, size=(32, 32)):
@@ -163,9 +267,9 @@ class StretchImageManager:
     def _load_available_images(self):
         """폴더 내의 모든 이미지 파일 로드"""
         try:
-            print(f"🔍 스트레칭 이미지 폴더 확인: {self.image_folder}")
+            log.info("🔍 스트레칭 이미지 폴더 확인: %s", self.image_folder)
             if not os.path.exists(self.image_folder):
-                print(f"❌ 스트레칭 이미지 폴더가 없습니다: {self.image_folder}")
+                log.error("❌ 스트레칭 이미지 폴더가 없습니다: %s", self.image_folder)
                 return []
             
             # 지원하는 이미지 확장자
@@ -177,17 +281,15 @@ class StretchImageManager:
                 found = glob.glob(pattern)
                 images.extend(found)
                 if found:
-                    print(f"  {ext}: {len(found)}개 발견")
+                    log.info("  %s: %s개 발견", ext, len(found))
             
             if images:
-                print(f"✅ 총 스트레칭 이미지 {len(images)}개 발견")
+                log.info("✅ 총 스트레칭 이미지 %s개 발견", len(images))
             else:
-                print(f"⚠️ 스트레칭 이미지가 없습니다 - 폴더: {self.image_folder}")
+                log.warning("⚠️ 스트레칭 이미지가 없습니다 - 폴더: %s", self.image_folder)
             return images
         except Exception as e:
-            print(f"❌ 이미지 로드 오류: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("❌ 이미지 로드 오류: %s", e)
             return []
     
     def get_random_image(self):
@@ -308,7 +410,7 @@ def create_clock_image(size=64):
         return img
 
     except Exception as e:
-        print(f"시계 이미지 생성 실패: {e}")
+        log.warning("시계 이미지 생성 실패: %s", e)
         return None
         
         draw.ellipse([
@@ -333,7 +435,7 @@ def create_clock_image(size=64):
 
         return img
     except Exception as e:
-        print(f"마우스 이미지 생성 실패: {e}")
+        log.warning("마우스 이미지 생성 실패: %s", e)
         return None
 
 def convert_png_to_ico(png_path, ico_path):
@@ -364,13 +466,13 @@ def convert_png_to_ico(png_path, ico_path):
         # ICO 파일로 저장
         if images:
             images[0].save(ico_path, format='ICO', sizes=[(img.size[0], img.size[1]) for img in images])
-            print(f"PNG를 ICO로 변환 성공: {png_path} -> {ico_path}")
+            log.info("PNG를 ICO로 변환 성공: %s -> %s", png_path, ico_path)
             return True
         else:
             return False
             
     except Exception as e:
-        print(f"PNG to ICO 변환 실패: {e}")
+        log.warning("PNG to ICO 변환 실패: %s", e)
         return False
 
 def get_icon_path():
@@ -381,13 +483,13 @@ def get_icon_path():
         # 1. clock_app.ico 확인 (최우선)
         clock_app_ico = os.path.join(base_dir, "clock_app.ico")
         if os.path.exists(clock_app_ico):
-            print("clock_app.ico 아이콘 사용")
+            log.info("clock_app.ico 아이콘 사용")
             return clock_app_ico
         
         # 2. clock_icon.ico 확인 (2순위)
         clock_icon_ico = os.path.join(base_dir, "clock_icon.ico")
         if os.path.exists(clock_icon_ico):
-            print("clock_icon.ico 아이콘 사용")
+            log.info("clock_icon.ico 아이콘 사용")
             return clock_icon_ico
         
         
@@ -399,7 +501,7 @@ def get_icon_path():
         return default_ico_path
         
     except Exception as e:
-        print(f"아이콘 경로 가져오기 실패: {e}")
+        log.warning("아이콘 경로 가져오기 실패: %s", e)
         return None
 
 def create_icon_file():
@@ -424,62 +526,61 @@ def create_icon_file():
             # ICO 파일로 저장
             icon_path = os.path.join(os.path.dirname(__file__), "clock_icon.ico")
             images[0].save(icon_path, format='ICO', sizes=[(img.size[0], img.size[1]) for img in images])    
-            print(f"아이콘 파일 생성 성공: {icon_path}")
+            log.info("아이콘 파일 생성 성공: %s", icon_path)
             return icon_path
         else:
-            print("아이콘 이미지 생성 실패")
+            log.warning("아이콘 이미지 생성 실패")
             return None
 
     except Exception as e:
-        print(f"아이콘 파일 생성 실패: {e}")
+        log.warning("아이콘 파일 생성 실패: %s", e)
         return None
 
-def get_settings_file_path():
-    """설정 파일 경로 반환 (권한 문제 해결을 위해 AppData 사용)"""
+@functools.lru_cache(maxsize=None)
+def get_data_dir():
+    """데이터 폴더 반환 (설정/레벨/휴식 메시지 공통, 처음 한 번만 확인하고 캐시)"""
     if getattr(sys, 'frozen', False):
-        # 패키징된 실행파일인 경우 사용자 AppData 폴더 사용
+        # 패키징된 실행파일인 경우 사용자 AppData 폴더 사용 (권한 문제 해결)
         appdata_path = os.path.expanduser("~\\AppData\\Roaming\\ClockApp-Ver2")
         if not os.path.exists(appdata_path):
             try:
-                os.makedirs(appdata_path)
-                print(f"설정 폴더 생성: {appdata_path}")
+                json_store.ensure_dir(appdata_path)
+                log.info("설정 폴더 생성: %s", appdata_path)
             except Exception as e:
-                print(f"설정 폴더 생성 실패: {e}")
-                # 실패 시 현재 폴더 사용
-                return os.path.join(os.path.dirname(sys.executable), "clock_settings_ver2.json")
-        return os.path.join(appdata_path, "clock_settings_ver2.json")
+                log.warning("설정 폴더 생성 실패: %s", e)
+                # 실패 시 실행파일 폴더 사용
+                return os.path.dirname(sys.executable)
+        return appdata_path
     else:
         # 개발 중에는 현재 스크립트 폴더 사용
-        return os.path.join(os.path.dirname(__file__), "clock_settings_ver2.json")
+        return os.path.dirname(__file__)
+
+def get_settings_file_path():
+    """설정 파일 경로 반환"""
+    return os.path.join(get_data_dir(), "clock_settings_ver2.json")
+
+def get_scheduler_state_file_path():
+    """스케줄러 상태 파일 경로 반환 (설정 파일과 같은 위치)"""
+    return os.path.join(get_data_dir(), "scheduler_state.json")
 
-def debug_log(message):
-    """전역 디버그 로그 함수"""
+def load_scheduler_state():
+    """스케줄러 상태 로드 (다음 데드라인, 오늘 식사 알림 표시 여부)"""
     try:
-        import datetime
-        debug_log_path = "level_data_debug.txt"
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        log_message = f"[{timestamp}] {message}\n"
-        with open(debug_log_path, "a", encoding="utf-8") as f:
-            f.write(log_message)
-        print(log_message.strip())
-    except:
-        print(message)
+        return state_store.load(get_scheduler_state_file_path())
+    except Exception as e:
+        log.warning("스케줄러 상태 로드 실패: %s", e)
+    return None
+
+def save_scheduler_state(state):
+    """스케줄러 상태 저장 (재시작 시 휴식 카운트다운 유지용, 공백 없는 JSON)"""
+    try:
+        state_store.put(get_scheduler_state_file_path(), state, compact=True)
+    except Exception as e:
+        log.warning("스케줄러 상태 저장 실패: %s", e)
 
 def get_rest_messages_file_path():
     """휴식 메시지 파일 경로 반환"""
-    if getattr(sys, 'frozen', False):
-        # 패키징된 실행파일인 경우 사용자 AppData 폴더 사용
-        appdata_path = os.path.expanduser("~\\AppData\\Roaming\\ClockApp-Ver2")
-        if not os.path.exists(appdata_path):
-            try:
-                os.makedirs(appdata_path)
-            except Exception as e:
-                print(f"휴식 메시지 폴더 생성 실패: {e}")
-                return os.path.join(os.path.dirname(sys.executable), "rest_messages.json")
-        return os.path.join(appdata_path, "rest_messages.json")
-    else:
-        # 개발 중에는 현재 스크립트 폴더 사용
-        return os.path.join(os.path.dirname(__file__), "rest_messages.json")
+    return os.path.join(get_data_dir(), "rest_messages.json")
 
 def create_default_rest_messages():
     """기본 휴식 메시지 JSON 파일 생성"""
@@ -513,12 +614,11 @@ def create_default_rest_messages():
     
     try:
         file_path = get_rest_messages_file_path()
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(default_messages, f, ensure_ascii=False, indent=2)
-        print(f"기본 휴식 메시지 파일 생성: {file_path}")
+        state_store.put(file_path, default_messages)
+        log.info("기본 휴식 메시지 파일 생성: %s", file_path)
         return True
     except Exception as e:
-        print(f"휴식 메시지 파일 생성 실패: {e}")
+        log.warning("휴식 메시지 파일 생성 실패: %s", e)
         return False
 
 def load_rest_messages():
@@ -526,12 +626,11 @@ def load_rest_messages():
     try:
         file_path = get_rest_messages_file_path()
         
-        # 파일이 없으면 기본 파일 생성
-        if not os.path.exists(file_path):
+        # 메모리 상태 (처음 한 번만 파일을 읽음), 파일이 없으면 기본 파일 생성
+        data = state_store.load(file_path)
+        if data is None:
             create_default_rest_messages()
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+            data = state_store.load(file_path)
             
         messages = data.get('messages', [])
         used_messages = data.get('used_messages', [])
@@ -547,7 +646,7 @@ def load_rest_messages():
         if not available_messages:
             available_messages = messages.copy()
             used_messages = []
-            print("모든 휴식 메시지를 사용했습니다. 목록을 초기화합니다.")
+            log.info("모든 휴식 메시지를 사용했습니다. 목록을 초기화합니다.")
         
         # 랜덤 선택
         selected_message = random.choice(available_messages)
@@ -555,126 +654,209 @@ def load_rest_messages():
         # 사용된 메시지 목록에 추가
         used_messages.append(selected_message)
         
-        # 업데이트된 정보를 파일에 저장
+        # 업데이트된 정보 저장 (지연 쓰기 - 다음 기록 주기에 파일로)
         data['used_messages'] = used_messages
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        state_store.put(file_path, data)
         
         return selected_message
         
     except Exception as e:
-        print(f"휴식 메시지 로드 실패: {e}")
+        log.warning("휴식 메시지 로드 실패: %s", e)
         # 실패 시 기본 메시지 반환
         return "눈을 감고 잠시 휴식을 취하세요"
 
 def get_level_data_file_path():
     """레벨 데이터 파일 경로 반환 (설정 파일과 같은 위치)"""
-    if getattr(sys, 'frozen', False):
-        # 패키징된 실행파일인 경우 사용자 AppData 폴더 사용
-        appdata_path = os.path.expanduser("~\\AppData\\Roaming\\ClockApp-Ver2")
-        if not os.path.exists(appdata_path):
-            try:
-                os.makedirs(appdata_path)
-            except Exception as e:
-                print(f"레벨 데이터 폴더 생성 실패: {e}")
-                return os.path.join(os.path.dirname(sys.executable), "rest_level_data.json")
-        return os.path.join(appdata_path, "rest_level_data.json")
-    else:
-        # 개발 중에는 현재 스크립트 폴더 사용
-        return os.path.join(os.path.dirname(__file__), "rest_level_data.json")
+    return os.path.join(get_data_dir(), "rest_level_data.json")
 
 def load_level_data():
     """레벨 데이터 로드"""
-    debug_log_path = "level_data_debug.txt"
-    
-    def debug_log(message):
-        try:
-            import datetime
-            timestamp = datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3]
-            log_message = f"[{timestamp}] {message}\n"
-            with open(debug_log_path, "a", encoding="utf-8") as f:
-                f.write(log_message)
-            print(log_message.strip())
-        except:
-            print(message)
-    
     try:
-        file_path = get_level_data_file_path()
-        debug_log(f"DEBUG: 레벨 데이터 파일 경로: {file_path}")
-        debug_log(f"DEBUG: 파일 존재 여부: {os.path.exists(file_path)}")
-        
-        if os.path.exists(file_path):
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                debug_log(f"레벨 데이터 로드: 레벨 {data.get('level', 1)}, 누적시간 {data.get('total_seconds', 0)}초")
-                debug_log(f"DEBUG: 로드된 데이터 타입: {type(data)}")
-                debug_log(f"DEBUG: 로드된 데이터: {data}")
-                return data
-        else:
-            debug_log("DEBUG: 레벨 데이터 파일이 존재하지 않음 - 기본값 사용")
+        if log.isEnabledFor(logging.DEBUG):  # 파일 존재 확인도 디버그 로그가 켜져 있을 때만
+            file_path = get_level_data_file_path()
+            log.debug("레벨 데이터 파일 경로: %s (존재: %s)", file_path, os.path.exists(file_path))
+        
+        # 스냅샷 + 이후 저널 기록으로 누적값 계산 (처음 한 번만 파일을 읽고,
+        # 이후에는 다른 프로세스가 추가한 줄만 반영)
+        journal = get_rest_journal()
+        journal.refresh()
+        data = {
+            "level": journal.level,
+            "total_seconds": journal.total_seconds
+        }
+        log.debug("레벨 데이터 로드: 레벨 %s, 누적시간 %s초 (세션 %s개)", data['level'], data['total_seconds'], journal.sessions)
+        return data
     except Exception as e:
-        debug_log(f"레벨 데이터 로드 실패: {e}")
-        import traceback
-        debug_log(f"DEBUG: 스택 트레이스: {traceback.format_exc()}")
+        log.exception("레벨 데이터 로드 실패: %s", e)
     
     # 기본값 반환
     default_data = {
         "level": 1,
         "total_seconds": 0
     }
-    debug_log(f"DEBUG: 기본값 반환: {default_data}")
+    log.debug("기본값 반환: %s", default_data)
     return default_data
 
-def save_level_data(level, total_seconds):
-    """레벨 데이터 저장"""
+def get_rest_journal_file_path():
+    """휴식 기록 저널 경로 반환 (레벨 데이터 파일과 같은 위치)"""
+    return os.path.join(get_data_dir(), "rest_journal.jsonl")
+
+# 휴식 기록 저널 (처음 사용할 때 스냅샷 + 저널 꼬리를 한 번 읽음)
+rest_journal = None
+
+def get_rest_journal():
+    """휴식 기록 저널 반환 - 레벨 데이터 파일이 스냅샷 역할 (처음 열 때 오래된 세션은 보관소로)"""
+    global rest_journal
+    if rest_journal is None:
+        level_func = lambda seconds: calculate_level_from_seconds(seconds)[0]
+        if state_db is not None:
+            journal = state_db.journal(level_func=level_func)
+        else:
+            journal = RestJournal(get_rest_journal_file_path(), get_level_data_file_path(),
+                                  level_func=level_func,
+                                  snapshot_writer=lambda path, data: state_store.put(path, data))
+        archive_old_rest_sessions(journal)
+        rest_journal = journal
+    return rest_journal
+
+# 오래된 휴식 기록 보관소 (월별 압축 조각, 통계를 열 때만 읽음)
+rest_archive = None
+
+def get_rest_archive():
+    """휴식 기록 보관소 반환 (데이터 폴더의 rest_archive)"""
+    global rest_archive
+    if rest_archive is None:
+        rest_archive = RestArchive(os.path.join(get_data_dir(), "rest_archive"))
+    return rest_archive
+
+def archive_old_rest_sessions(journal):
+    """설정한 개월 수(archive_keep_months)보다 오래된 세션을 보관소로 이동 (저널 첫 세션만 보고 빠르게 건너뜀)"""
     try:
-        file_path = get_level_data_file_path()
-        data = {
-            "level": level,
-            "total_seconds": total_seconds
-        }
-        
-        # 디버그 로그에 저장 내용 기록
-        debug_log(f"=== save_level_data 호출 ===")
-        debug_log(f"저장할 데이터: level={level}, total_seconds={total_seconds}")
-        debug_log(f"저장 경로: {file_path}")
-        
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        
-        debug_log(f"레벨 데이터 저장 성공")
-        print(f"레벨 데이터 저장: 레벨 {level}, 누적시간 {total_seconds}초")
-        return True
+        settings = state_store.load(get_settings_file_path()) or {}
+        cutoff = archive_cutoff(settings.get("archive_keep_months", DEFAULT_KEEP_MONTHS))
+        journal.compact(cutoff, get_rest_archive())
     except Exception as e:
-        debug_log(f"레벨 데이터 저장 실패: {e}")
-        print(f"레벨 데이터 저장 실패: {e}")
-        return False
+        log.warning("휴식 기록 보관 실패: %s", e)
+
+# 휴식 통계용 열 저장소 (통계를 처음 열 때 보관소 + 저널 전체를 한 번 읽고 이후에는 세션만 추가)
+rest_columns = None
+
+def get_rest_columns():
+    """휴식 세션 열 저장소 반환"""
+    global rest_columns
+    if rest_columns is None:
+        journal = get_rest_journal()
+        rest_columns = SessionColumns.from_records(itertools.chain(get_rest_archive().query(),
+                                                                   journal.iter_sessions()))
+    return rest_columns
+
+def configure_storage_backend():
+    """설정 파일에 "storage_backend": "sqlite"가 있으면 상태 저장을 SQLite 데이터베이스로 전환
+
+    처음 전환할 때 한 번만 기존 JSON 파일(설정, 레벨 데이터와 저널, 휴식 메시지, 날씨 캐시,
+    스케줄러 상태, SettingsManager 백업 폴더)을 가져온다. 전환 여부는 JSON 설정 파일에서 읽는다.
+    """
+    global state_store, state_db
+    settings = json_store.load(get_settings_file_path()) or {}
+    if settings.get("storage_backend") != "sqlite" or state_db is not None:
+        return
+    try:
+        state_db = SqliteStore(os.path.join(get_data_dir(), STATE_DB_FILE))
+        appdata = os.getenv('APPDATA')
+        state_db.import_json(
+            [get_settings_file_path(), get_rest_messages_file_path(), WEATHER_CACHE_FILE,
+             get_scheduler_state_file_path()],
+            journal_path=get_rest_journal_file_path(),
+            snapshot_path=get_level_data_file_path(),
+            backup_dir=os.path.join(appdata, "ClockApp", "backup") if appdata else None)
+        state_store = WriteBehindStore(state_store.interval, writer=state_db.save, reader=state_db.load,
+                                       batch_writer=state_db.save_many)
+        log.info("SQLite 저장소 사용: %s", state_db.db_path)
+    except Exception as e:
+        log.warning("SQLite 저장소 사용 실패, JSON 파일 사용: %s", e)
+        state_db = None
+
+def get_achievements_file_path():
+    """업적/연속 기록 상태 파일 경로 반환 (레벨 데이터 파일과 같은 위치)"""
+    return os.path.join(get_data_dir(), "rest_achievements.json")
+
+# 업적/연속 기록 (처음 사용할 때 상태 파일을 읽고, 이후에는 세션마다 카운터만 갱신)
+achievements = None
+
+def get_achievements():
+    """업적 추적기 반환 - 상태 파일이 없거나 저널과 어긋나면 (다른 프로세스 기록 등) 기록에서 한 번 다시 계산"""
+    global achievements
+    if achievements is None:
+        journal = get_rest_journal()
+        settings = state_store.load(get_settings_file_path()) or {}
+        daily_goal = settings.get("daily_rest_goal", DEFAULT_DAILY_GOAL)
+        tracker = AchievementTracker.from_state(state_store.load(get_achievements_file_path()), daily_goal)
+        if tracker is None or tracker.journal_sessions != journal.sessions:
+            log.info("업적 상태를 휴식 기록에서 다시 계산")
+            tracker = AchievementTracker.rebuild(
+                itertools.chain(get_rest_archive().query(), journal.iter_sessions()), daily_goal)
+            tracker.journal_sessions = journal.sessions
+            state_store.put(get_achievements_file_path(), tracker.export_state(), compact=True)
+        achievements = tracker
+    return achievements
+
+def record_rest_session(start, duration, meal=False, early=False):
+    """휴식 세션 기록 (저널에 한 줄 추가 + 업적 카운터 갱신) - 기록 후 (레벨, 누적 초) 반환"""
+    global achievements
+    journal = get_rest_journal()
+    try:
+        tracker = get_achievements()  # 저널에 추가하기 전에 (다시 계산할 때 이번 세션이 두 번 반영되지 않도록)
+    except Exception as e:
+        log.warning("업적 로드 실패: %s", e)
+        tracker = None
+    if journal.append(start, duration, meal=meal, early=early):
+        log.debug("휴식 세션 기록: %s초 (식사시간 %s, 일찍 닫음 %s)", duration, meal, early)
+        if rest_columns is not None:
+            rest_columns.append(start, duration, meal, early)
+        if tracker is not None:
+            for achievement in tracker.record(start, duration, meal=meal, early=early):
+                log.info("🏆 업적 달성: %s", achievement['title'])
+            if journal.sessions == tracker.journal_sessions + 1:
+                tracker.journal_sessions = journal.sessions
+                state_store.put(get_achievements_file_path(), tracker.export_state(), compact=True)
+            else:
+                # 다른 프로세스가 추가한 세션이 있음 - 다음에 기록에서 다시 계산 (알릴 업적은 유지)
+                pending = tracker.take_unannounced()
+                achievements = None
+                get_achievements().unannounced.extend(pending)
+    return journal.level, journal.total_seconds
+
+def save_level_data():
+    """레벨 데이터 저장 - 저널 스냅샷 (레벨, 누적 시간, 반영한 저널 위치)"""
+    journal = get_rest_journal()
+    if journal.flush():
+        log.info("레벨 데이터 저장: 레벨 %s, 누적시간 %s초", journal.level, journal.total_seconds)
+        return True
+    return False
+
+# 레벨 곡선 (누적 시간 기준표를 미리 계산해두고 bisect로 조회)
+level_curve = make_curve()
+
+def configure_level_curve(config=None):
+    """설정의 level_curve로 레벨 곡선 교체 (기준표는 여기서 한 번만 계산)"""
+    global level_curve
+    level_curve = make_curve(config)
+    log.info("레벨 곡선: %s (%s레벨 기준표)", level_curve.name, len(level_curve))
 
 def calculate_level_from_seconds(total_seconds):
-    """누적 시간으로 레벨 계산
+    """누적 시간으로 레벨 계산 - (레벨, 현재 레벨 시작 누적 시간)
+    기본 2배 곡선:
     레벨 1: 30초
     레벨 2: 60초 (30 + 30)
     레벨 3: 120초 (60 + 60)
     레벨 4: 240초 (120 + 120)
     ...
     """
-    level = 1
-    required_seconds = 30  # 레벨 1은 30초
-    accumulated_seconds = 0
-    
-    while accumulated_seconds + required_seconds <= total_seconds:
-        accumulated_seconds += required_seconds
-        level += 1
-        required_seconds *= 2  # 다음 레벨은 2배
-    
-    return level, accumulated_seconds
+    return level_curve.level_for(total_seconds)
 
 def get_next_level_required_seconds(current_level):
     """다음 레벨까지 필요한 총 시간 계산"""
-    required = 30
-    for _ in range(current_level - 1):
-        required *= 2
-    return required
+    return level_curve.required_for(current_level)
 
 def format_time_display(seconds):
     """초를 분:초 형식으로 변환"""
@@ -714,56 +896,53 @@ def load_settings():
     
     try:
         settings_file = get_settings_file_path()
-        print(f"설정 파일 경로: {settings_file}")
+        log.info("설정 파일 경로: %s", settings_file)
         
-        if os.path.exists(settings_file):
-            with open(settings_file, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
-                print(f"설정 불러오기 성공: {settings}")
-                return settings
+        settings = state_store.load(settings_file)
+        if settings is not None:
+            log.info("설정 불러오기 성공: %s", settings)
+            return settings
         else:
-            print("설정 파일이 없어서 기본값 사용")
+            log.info("설정 파일이 없어서 기본값 사용")
             return default_settings
     except Exception as e:
-        print(f"설정 불러오기 실패, 기본값 사용: {e}")
+        log.warning("설정 불러오기 실패, 기본값 사용: %s", e)
         return default_settings
 
 def load_settings_from_file():
     """설정 파일에서 설정값 로드"""
     try:
         settings_file = get_settings_file_path()
-        print(f"설정 파일 경로: {settings_file}")
+        log.info("설정 파일 경로: %s", settings_file)
         
-        if os.path.exists(settings_file):
-            with open(settings_file, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
-            print(f"설정 로드 성공: {settings}")
+        settings = state_store.load(settings_file)
+        if settings is not None:
+            log.info("설정 로드 성공: %s", settings)
             return settings
         else:
-            print("설정 파일이 없습니다. 기본값 사용.")
+            log.info("설정 파일이 없습니다. 기본값 사용.")
             return None
     except Exception as e:
-        print(f"설정 로드 실패: {e}")
+        log.warning("설정 로드 실패: %s", e)
         return None
 
 def save_settings_to_file(settings):
     """설정값을 파일에 저장"""
     try:
         settings_file = get_settings_file_path()
-        print(f"설정 저장 경로: {settings_file}")
-        
-        # 설정 폴더가 없으면 생성
-        settings_dir = os.path.dirname(settings_file)
-        if not os.path.exists(settings_dir):
-            os.makedirs(settings_dir)
-            print(f"설정 폴더 생성: {settings_dir}")
-        
-        with open(settings_file, 'w', encoding='utf-8') as f:
-            json.dump(settings, f, indent=4, ensure_ascii=False)
-        print(f"설정 저장 성공: {settings}")
+        log.info("설정 저장 경로: %s", settings_file)
+        
+        # 사용자가 직접 저장한 설정은 기록 주기를 기다리지 않고 바로 파일로 (설정 폴더는 기록할 때 생성)
+        state_store.put(settings_file, settings, indent=4)
+        state_store.flush(settings_file)
+        if state_store.is_dirty(settings_file):
+            # 기록 실패 - 변경은 남겨 두고 다음 주기에 다시 시도
+            log.warning("설정 저장 실패: 파일에 기록하지 못함 (%s)", settings_file)
+            return False
+        log.info("설정 저장 성공: %s", settings)
         return True
     except Exception as e:
-        print(f"설정 저장 실패: {e}")
+        log.warning("설정 저장 실패: %s", e)
         return False
 
 def check_startup_registry():
@@ -784,7 +963,7 @@ def check_startup_registry():
             return False
             
     except Exception as e:
-        print(f"시작 프로그램 확인 실패: {e}")
+        log.warning("시작 프로그램 확인 실패: %s", e)
         return False
 
 def add_to_startup():
@@ -810,11 +989,11 @@ def add_to_startup():
         winreg.SetValueEx(key, "MouseClock", 0, winreg.REG_SZ, exe_path_quoted)
         winreg.CloseKey(key)
         
-        print(f"시작 프로그램 등록 성공: {exe_path_quoted}")
+        log.info("시작 프로그램 등록 성공: %s", exe_path_quoted)
         return True
         
     except Exception as e:
-        print(f"시작 프로그램 등록 실패: {e}")
+        log.warning("시작 프로그램 등록 실패: %s", e)
         return False
 
 def remove_from_startup():
@@ -829,15 +1008,15 @@ def remove_from_startup():
             # MouseClock 값 삭제
             winreg.DeleteValue(key, "MouseClock")
             winreg.CloseKey(key)
-            print("시작 프로그램에서 제거 성공")
+            log.info("시작 프로그램에서 제거 성공")
             return True
         except FileNotFoundError:
             winreg.CloseKey(key)
-            print("시작 프로그램에 등록되어 있지 않음")
+            log.info("시작 프로그램에 등록되어 있지 않음")
             return True
             
     except Exception as e:
-        print(f"시작 프로그램 제거 실패: {e}")
+        log.warning("시작 프로그램 제거 실패: %s", e)
         return False
 
 def add_to_startup_alternative():
@@ -856,14 +1035,14 @@ def add_to_startup_alternative():
         result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
         
         if result.returncode == 0:
-            print("작업 스케줄러로 시작 프로그램 등록 성공")
+            log.info("작업 스케줄러로 시작 프로그램 등록 성공")
             return True
         else:
-            print(f"작업 스케줄러 등록 실패: {result.stderr}")
+            log.warning("작업 스케줄러 등록 실패: %s", result.stderr)
             return False
             
     except Exception as e:
-        print(f"작업 스케줄러 등록 실패: {e}")
+        log.warning("작업 스케줄러 등록 실패: %s", e)
         return False
 
 def remove_from_startup_alternative():
@@ -875,14 +1054,14 @@ def remove_from_startup_alternative():
         result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
         
         if result.returncode == 0:
-            print("작업 스케줄러에서 제거 성공")
+            log.info("작업 스케줄러에서 제거 성공")
             return True
         else:
-            print(f"작업 스케줄러 제거 실패: {result.stderr}")
+            log.warning("작업 스케줄러 제거 실패: %s", result.stderr)
             return True  # 이미 없는 경우도 성공으로 처리
             
     except Exception as e:
-        print(f"작업 스케줄러 제거 실패: {e}")
+        log.warning("작업 스케줄러 제거 실패: %s", e)
         return False
 
 def get_current_location():
@@ -909,7 +1088,7 @@ def get_current_location():
         return location
         
     except Exception as e:
-        print(f"위치 정보 가져오기 실패: {e}")
+        log.warning("위치 정보 가져오기 실패: %s", e)
         return "판교동"
 
 def get_weather_data(location="Seoul", force_refresh=False):
@@ -920,7 +1099,9 @@ def get_weather_data(location="Seoul", force_refresh=False):
         if cached_data:
             return cached_data
     
-    print("날씨 API 호출 중...")
+    log.info("날씨 API 호출 중...")
+    fetch_started = time.perf_counter()
+    fetch_result = "error"
     try:
         # wttr.in API 사용 (무료, API 키 불필요)
         try:
@@ -996,17 +1177,20 @@ def get_weather_data(location="Seoul", force_refresh=False):
                 
                 # 캐시 저장
                 save_weather_cache(weather_result)
+                fetch_result = "ok"
                 return weather_result
                 
         except Exception as e:
-            print(f"실제 날씨 API 호출 실패: {e}")
+            log.warning("실제 날씨 API 호출 실패: %s", e)
             
         # API 실패 시 기본값 반환
         return get_default_weather_data()
         
     except Exception as e:
-        print(f"날씨 데이터 가져오기 전체 실패: {e}")
+        log.warning("날씨 데이터 가져오기 전체 실패: %s", e)
         return get_default_weather_data()
+    finally:
+        WEATHER_FETCH_SECONDS.observe(time.perf_counter() - fetch_started, result=fetch_result)
 
 def get_weather_icon(description):
     """날씨 설명에 따른 아이콘 반환"""
@@ -1063,13 +1247,26 @@ def get_default_weather_data():
         'location': '판교동'
     }
 
+def notify_popup_closed(popup):
+    """팝업의 on_close 콜백을 한 번만 호출"""
+    on_close = getattr(popup, 'on_close', None)
+    if on_close:
+        popup.on_close = None
+        try:
+            on_close(popup)
+        except Exception as e:
+            log.error("팝업 종료 콜백 오류: %s", e)
+
 class LevelUpPopup:
     """레벨업 축하 팝업 클래스 - 레트로 픽셀 아트 스타일"""
-    def __init__(self, level):
+    def __init__(self, level, on_close=None, achievements=None, title="Level Up"):
         global current_levelup_popup
         self.level = level
+        self.on_close = on_close  # 팝업이 닫힐 때 호출 (알림 큐에 다음 알림 요청)
+        self.achievements = achievements or []  # 함께 표시할 새 업적 (하루 목표, 연속 기록, 마일스톤)
+        self.title_text = title
         self.popup = tk.Toplevel()
-        self.popup.title("Level Up!")
+        self.popup.title(f"{title}!")
         
         # 전역 참조 저장
         current_levelup_popup = self
@@ -1113,9 +1310,16 @@ class LevelUpPopup:
         self.popup.update_idletasks()
         screen_width = self.popup.winfo_screenwidth()
         screen_height = self.popup.winfo_screenheight()
+        height = 350 + self.get_achievement_lines() * 24
         x = (screen_width - 500) // 2
-        y = (screen_height - 350) // 2
-        self.popup.geometry(f"500x350+{x}+{y}")
+        y = (screen_height - height) // 2
+        self.popup.geometry(f"500x{height}+{x}+{y}")
+    
+    def get_achievement_lines(self):
+        """업적 표시 줄 수 (최대 4개 + '외 N개')"""
+        if not self.achievements:
+            return 0
+        return min(len(self.achievements), 4) + (1 if len(self.achievements) > 4 else 0)
     
     def create_widgets(self):
         """위젯 생성 - 레트로 게임 스타일"""
@@ -1145,7 +1349,7 @@ class LevelUpPopup:
         
         level_up_label = tk.Label(
             level_up_frame,
-            text="Level Up",
+            text=self.title_text,
             font=("Arial Black", 28, "bold"),
             fg="#FFEB3B",
             bg="#FF6B8A",
@@ -1175,7 +1379,28 @@ class LevelUpPopup:
             wraplength=400,
             justify=tk.CENTER
         )
-        message_label.pack(pady=(5, 25))
+        message_label.pack(pady=(5, 25) if not self.achievements else (5, 10))
+        
+        # 새 업적 목록
+        if self.achievements:
+            achievement_frame = tk.Frame(main_frame, bg="#87CEEB")
+            achievement_frame.pack(pady=(0, 15))
+            for achievement in self.achievements[:4]:
+                tk.Label(
+                    achievement_frame,
+                    text=achievement["title"],
+                    font=("맑은 고딕", 11, "bold"),
+                    fg="#8E44AD",
+                    bg="#87CEEB"
+                ).pack()
+            if len(self.achievements) > 4:
+                tk.Label(
+                    achievement_frame,
+                    text=f"외 {len(self.achievements) - 4}개",
+                    font=("맑은 고딕", 10),
+                    fg="#34495E",
+                    bg="#87CEEB"
+                ).pack()
         
         # 확인 버튼 (레트로 스타일)
         close_button = tk.Button(
@@ -1277,7 +1502,7 @@ class LevelUpPopup:
             
             # 포커스가 None이거나 이 팝업의 자식이 아니면 닫기
             if focused_widget is None or focused_widget.winfo_toplevel() != self.popup:
-                print("레벨업 창 포커스 상실 - 자동 닫기")
+                log.info("레벨업 창 포커스 상실 - 자동 닫기")
                 self.close_popup()
         except:
             # 예외 발생 시 안전하게 팝업 닫기
@@ -1293,46 +1518,56 @@ class LevelUpPopup:
                 current_levelup_popup = None
         except:
             pass
+        notify_popup_closed(self)
 
 class RestPopup:
     """휴식 알림 팝업 클래스"""
-    def __init__(self, parent_clock=None):
+    def __init__(self, parent_clock=None, rest_seconds=30, break_name=None, on_close=None):
         self.parent_clock = parent_clock
+        self.on_close = on_close          # 팝업이 닫힐 때 호출 (알림 큐에 다음 알림 요청)
+        self.rest_seconds = rest_seconds  # 휴식 타이머 프로필의 휴식 길이 (초)
+        self.break_name = break_name      # 휴식 타이머 이름 (눈 휴식, 스트레칭 등)
+        self._closed = False              # 닫기는 한 번만 (포커스 상실/닫기 버튼/타이머가 겹쳐 호출될 수 있음)
+        init_span = tracer.begin("RestPopup.__init__", "popup", break_name=break_name)
         self.popup = tk.Toplevel()
         self.popup.title("ClockApp Ver2 - 휴식 알림")
         
-        # 디버그 로그 파일 경로 설정
-        self.debug_log_path = "rest_popup_debug.txt"
-        self._debug_log("=== RestPopup 초기화 시작 ===")
+        popup_log.debug("=== RestPopup 초기화 시작 ===")
         
         # 휴식 메시지 로드 (중복 방지 랜덤 선택)
-        self.current_message = load_rest_messages()
-        self._debug_log(f"선택된 휴식 메시지: {self.current_message}")
+        with tracer.span("load_rest_messages", "popup"):
+            self.current_message = load_rest_messages()
+        popup_log.debug("선택된 휴식 메시지: %s", self.current_message)
         
         # 레벨 데이터 로드
         try:
-            self._debug_log("레벨 데이터 로드 시작")
-            self.level_data = load_level_data()
+            popup_log.debug("레벨 데이터 로드 시작")
+            with tracer.span("load_level_data", "popup"):
+                self.level_data = load_level_data()
             self.initial_total_seconds = self.level_data['total_seconds']
             self.popup_start_time = time.time()
-            self._debug_log("레벨 데이터 로드 완료")
+            popup_log.debug("레벨 데이터 로드 완료")
             
             # 초기 레벨 저장 (레벨업 감지용)
             self.initial_level = self.level_data['level']
             self.current_level = self.initial_level
-            self._debug_log(f"현재 레벨: {self.current_level}")
+            popup_log.debug("현재 레벨: %s", self.current_level)
+            
+            # 오늘 목표 / 연속 기록 (유지 중인 카운터만 조회)
+            with tracer.span("get_achievements", "popup"):
+                self.progress = get_achievements().progress()
+            popup_log.debug("오늘 진행: %s", self.progress)
             
             # 스트레칭 이미지 로드
             self.stretch_image = None
             self.stretch_photo = None
-            self._debug_log("스트레칭 이미지 로드 호출 전")
-            self.load_stretch_image()
-            self._debug_log("스트레칭 이미지 로드 호출 후")
+            popup_log.debug("스트레칭 이미지 로드 호출 전")
+            with tracer.span("load_stretch_image", "popup"):
+                self.load_stretch_image()
+            popup_log.debug("스트레칭 이미지 로드 호출 후")
             
         except Exception as e:
-            self._debug_log(f"❌ 초기화 오류: {e}")
-            import traceback
-            self._debug_log(f"스택 트레이스: {traceback.format_exc()}")
+            popup_log.exception("❌ 초기화 오류: %s", e)
             
             # 오류 발생 시 기본값으로 설정
             self.level_data = {"level": 1, "total_seconds": 0}
@@ -1340,34 +1575,33 @@ class RestPopup:
             self.popup_start_time = time.time()
             self.initial_level = 1
             self.current_level = 1
+            self.progress = None
             self.stretch_image = None
             self.stretch_photo = None
-            self._debug_log("기본값으로 초기화 완료")
+            popup_log.debug("기본값으로 초기화 완료")
             
             # 스트레칭 이미지 로드 재시도
             try:
-                self._debug_log("스트레칭 이미지 로드 재시도")
+                popup_log.debug("스트레칭 이미지 로드 재시도")
                 self.load_stretch_image()
             except Exception as img_e:
-                self._debug_log(f"스트레칭 이미지 로드 재시도 실패: {img_e}")
+                popup_log.warning("스트레칭 이미지 로드 재시도 실패: %s", img_e)
         
         # 이미지가 있으면 더 큰 크기로 설정 (가로로 넓게)
         try:
             if self.stretch_image:
-                self._debug_log(f"이미지 있음 - 큰 사이즈로 설정: {self.stretch_image.size}")
-                self.popup.geometry("480x520")  # 레벨 정보 표시를 위해 높이 증가
+                popup_log.debug("이미지 있음 - 큰 사이즈로 설정: %s", self.stretch_image.size)
+                self.popup.geometry("480x545")  # 레벨/연속 기록 표시를 위해 높이 증가
             else:
-                self._debug_log("이미지 없음 - 기본 사이즈로 설정")
-                self.popup.geometry("400x420")
+                popup_log.debug("이미지 없음 - 기본 사이즈로 설정")
+                self.popup.geometry("400x445")
             
             self.popup.resizable(False, False)
             self.popup.attributes('-topmost', True)  # 항상 위에 표시
-            self._debug_log("팝업 기본 설정 완료")
+            popup_log.debug("팝업 기본 설정 완료")
             
         except Exception as e:
-            self._debug_log(f"❌ 팝업 설정 오류: {e}")
-            import traceback
-            self._debug_log(f"스택 트레이스: {traceback.format_exc()}")
+            popup_log.exception("❌ 팝업 설정 오류: %s", e)
         
         # 아이콘 설정 (사용자 PNG 우선, 없으면 기본 시계 아이콘)
         try:
@@ -1378,12 +1612,14 @@ class RestPopup:
             pass
         
         # 창을 화면 중앙에 위치
-        self.center_popup()
+        with tracer.span("center_popup", "popup"):
+            self.center_popup()
         
-        # 30초 타이머
-        self.remaining_time = 30
+        # 휴식 타이머 (기본 30초)
+        self.remaining_time = self.rest_seconds
         
-        self.create_widgets()
+        with tracer.span("create_widgets", "popup"):
+            self.create_widgets()
         
         # X 버튼 활성화
         self.popup.protocol("WM_DELETE_WINDOW", self.close_popup)
@@ -1393,35 +1629,20 @@ class RestPopup:
         
         # 타이머 시작
         self.update_timer()
-    
-    def _debug_log(self, message):
-        """디버그 메시지를 파일로 저장 (PyInstaller 환경 대응)"""
-        try:
-            import datetime
-            timestamp = datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3]
-            log_message = f"[{timestamp}] {message}\n"
-            
-            with open(self.debug_log_path, "a", encoding="utf-8") as f:
-                f.write(log_message)
-            
-            # 콘솔에도 출력 (개발 환경용)
-            print(log_message.strip())
-        except Exception as e:
-            # 로그 저장 실패해도 앱이 중단되지 않도록
-            print(f"Debug log error: {e}")
+        init_span.end(stretch_image=self.stretch_image is not None)
     
     def load_stretch_image(self):
         """스트레칭 이미지를 랜덤으로 로드"""
-        self._debug_log("=== 스트레칭 이미지 로드 시작 ===")
+        popup_log.debug("=== 스트레칭 이미지 로드 시작 ===")
         try:
             image_path = stretch_image_manager.get_random_image()
-            self._debug_log(f"선택된 이미지 경로: {image_path}")
+            popup_log.debug("선택된 이미지 경로: %s", image_path)
             
             if image_path and os.path.exists(image_path):
-                self._debug_log(f"이미지 파일 존재 확인: {os.path.exists(image_path)}")
+                popup_log.debug("이미지 파일 존재 확인: %s", os.path.exists(image_path))
                 
                 img = Image.open(image_path)
-                self._debug_log(f"PIL Image.open 성공: {img.size}, 모드: {img.mode}")
+                popup_log.debug("PIL Image.open 성공: %s, 모드: %s", img.size, img.mode)
                 
                 # 이미지 크기 조정 (너비 최대 220px로 축소, 높이는 비율 유지)
                 max_width = 220
@@ -1429,74 +1650,17 @@ class RestPopup:
                 
                 # 비율 유지하며 크기 조정
                 img.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
-                self._debug_log(f"이미지 크기 조정 완료: {img.size}")
+                popup_log.debug("이미지 크기 조정 완료: %s", img.size)
                 
                 self.stretch_image = img
-                self._debug_log(f"✅ 스트레칭 이미지 로드 성공: {os.path.basename(image_path)}")
+                popup_log.debug("✅ 스트레칭 이미지 로드 성공: %s", os.path.basename(image_path))
             else:
-                self._debug_log("⚠️ 사용 가능한 스트레칭 이미지가 없습니다.")
-                self._debug_log(f"   'stretchimage' 폴더에 PNG, JPG 이미지를 넣어주세요.")
+                popup_log.warning("⚠️ 사용 가능한 스트레칭 이미지가 없습니다. 'stretchimage' 폴더에 PNG, JPG 이미지를 넣어주세요.")
                 self.stretch_image = None
         except Exception as e:
-            self._debug_log(f"❌ 스트레칭 이미지 로드 오류: {e}")
-            import traceback
-            traceback.print_exc()
+            popup_log.exception("❌ 스트레칭 이미지 로드 오류: %s", e)
             self.stretch_image = None
         
-    def close_popup(self):
-        """팝업 닫기"""
-        self._debug_log("=== close_popup 호출됨 ===")
-        try:
-            # 식사시간 중인지 확인
-            is_meal_time = False
-            if self.parent_clock and hasattr(self.parent_clock, 'is_meal_time'):
-                is_meal_time = self.parent_clock.is_meal_time()
-                self._debug_log(f"식사시간 확인: {is_meal_time}")
-            
-            # 팝업이 떠있던 시간 계산
-            elapsed_time = int(time.time() - self.popup_start_time)
-            
-            if is_meal_time:
-                # 식사시간 중에는 시간 누적하지 않음
-                new_total_seconds = self.initial_total_seconds
-                new_level, _ = calculate_level_from_seconds(new_total_seconds)
-                self._debug_log(f"식사시간 중 - 시간 누적하지 않음: elapsed_time={elapsed_time}초 (무시)")
-                print(f"식사시간 중 휴식 - 시간 누적하지 않음 (총 {new_total_seconds}초 유지)")
-            else:
-                # 일반 시간에는 시간 누적
-                new_total_seconds = self.initial_total_seconds + elapsed_time
-                new_level, _ = calculate_level_from_seconds(new_total_seconds)
-                self._debug_log(f"시간 계산: elapsed_time={elapsed_time}초, initial_total={self.initial_total_seconds}초")
-                self._debug_log(f"새로운 총 시간: {new_total_seconds}초, 새로운 레벨: {new_level}")
-                print(f"휴식 팝업 종료 - 누적 시간: {elapsed_time}초 추가 (총 {new_total_seconds}초)")
-            
-            # 레벨 데이터 저장
-            save_result = save_level_data(new_level, new_total_seconds)
-            self._debug_log(f"레벨 데이터 저장 결과: {save_result}")
-            
-            # 현재 열려있는 레벨업 팝업이 있다면 닫기
-            global current_levelup_popup
-            if current_levelup_popup is not None:
-                try:
-                    current_levelup_popup.close_popup()
-                except:
-                    pass
-            
-            # 팝업 닫기
-            self.popup.destroy()
-            
-            # 레벨업 체크 및 축하 팝업 표시 (실시간으로 표시하지 않았던 경우만)
-            # self.current_level은 실시간 업데이트된 레벨, self.initial_level은 시작 시 레벨
-            if new_level > self.current_level:
-                # 닫는 순간에 추가로 레벨업이 발생한 경우 (매우 드문 경우)
-                print(f"🎉 종료 시 레벨업! {self.current_level} → {new_level}")
-                root = self.popup.master
-                if root:
-                    root.after(300, lambda: LevelUpPopup(new_level))
-        except Exception as e:
-            print(f"팝업 닫기 오류: {e}")
-            pass
-    
     def on_focus_out(self, event):
         """팝업이 포커스를 잃었을 때 호출 (다른 앱 클릭 시)"""
         try:
@@ -1505,7 +1669,7 @@ class RestPopup:
             
             # 포커스가 None이거나 이 팝업의 자식이 아니면 닫기
             if focused_widget is None or focused_widget.winfo_toplevel() != self.popup:
-                print("포커스 상실 - 휴식 팝업 자동 닫기")
+                log.info("포커스 상실 - 휴식 팝업 자동 닫기")
                 self.close_popup()
         except:
             # 예외 발생 시 안전하게 팝업 닫기
@@ -1522,10 +1686,10 @@ class RestPopup:
         # 팝업 크기 (이미지 유무에 따라 다름)
         if self.stretch_image:
             popup_width = 480
-            popup_height = 520  # 레벨 정보 표시를 위해 증가
+            popup_height = 545  # 레벨/연속 기록 표시를 위해 증가
         else:
             popup_width = 400
-            popup_height = 420
+            popup_height = 445
         
         # 중앙 위치 계산
         x = (screen_width - popup_width) // 2
@@ -1535,11 +1699,11 @@ class RestPopup:
     
     def create_widgets(self):
         """위젯 생성 - 모던한 디자인"""
-        self._debug_log("=== create_widgets 시작 ===")
+        popup_log.debug("=== create_widgets 시작 ===")
         
         # 팝업 배경색 설정
         self.popup.configure(bg="#f0f8ff")
-        self._debug_log("팝업 배경색 설정 완료")
+        popup_log.debug("팝업 배경색 설정 완료")
         
         # 상단 헤더 영역 (간결하게)
         header_frame = tk.Frame(self.popup, bg="#4a90e2", height=60)
@@ -1549,7 +1713,7 @@ class RestPopup:
         # 메인 메시지
         message_label = tk.Label(
             header_frame, 
-            text="잠시 휴식하세요", 
+            text=f"{self.break_name} - 잠시 휴식하세요" if self.break_name else "잠시 휴식하세요", 
             font=("Segoe UI", 16, "bold"),
             fg="white",
             bg="#4a90e2"
@@ -1573,7 +1737,7 @@ class RestPopup:
         
         # 가로 레이아웃 (이미지가 있을 때)
         if self.stretch_image:
-            self._debug_log(f"✅ 스트레칭 이미지 표시 중 (크기: {self.stretch_image.size})")
+            popup_log.debug("✅ 스트레칭 이미지 표시 중 (크기: %s)", self.stretch_image.size)
             horizontal_container = tk.Frame(content_frame, bg="#f0f8ff")
             horizontal_container.pack(pady=3)
             
@@ -1588,7 +1752,7 @@ class RestPopup:
                 
                 # ImageTk.PhotoImage 생성 시도
                 self.stretch_photo = ImageTk.PhotoImage(self.stretch_image)
-                self._debug_log("✅ ImageTk.PhotoImage 생성 성공")
+                popup_log.debug("✅ ImageTk.PhotoImage 생성 성공")
                 
                 image_label = tk.Label(
                     image_frame,
@@ -1601,10 +1765,10 @@ class RestPopup:
                 
                 # 강제 화면 갱신
                 image_frame.update_idletasks()
-                self._debug_log("✅ 이미지 라벨 생성 및 배치 완료")
+                popup_log.debug("✅ 이미지 라벨 생성 및 배치 완료")
                 
             except Exception as e:
-                self._debug_log(f"❌ ImageTk.PhotoImage 생성 실패: {e}")
+                popup_log.error("❌ ImageTk.PhotoImage 생성 실패: %s", e)
                 # 이미지 표시 실패 시 대체 텍스트 표시
                 fallback_label = tk.Label(
                     image_frame,
@@ -1615,13 +1779,13 @@ class RestPopup:
                     justify=tk.CENTER
                 )
                 fallback_label.pack()
-                self._debug_log("⚠️ 대체 텍스트 표시로 처리")
+                popup_log.debug("⚠️ 대체 텍스트 표시로 처리")
             
             # 오른쪽: 원형 진행 표시 (크게)
             progress_container = tk.Frame(horizontal_container, bg="#f0f8ff")
             progress_container.pack(side=tk.LEFT)
         else:
-            self._debug_log("ℹ️ 스트레칭 이미지 없음 - 타이머만 표시")
+            popup_log.debug("ℹ️ 스트레칭 이미지 없음 - 타이머만 표시")
             # 이미지가 없으면 중앙에 진행바만
             progress_container = tk.Frame(content_frame, bg="#f0f8ff")
             progress_container.pack(pady=10)
@@ -1674,6 +1838,16 @@ class RestPopup:
         )
         self.next_level_label.pack(pady=(3, 0))
         
+        # 오늘 목표 / 연속 기록
+        self.streak_label = tk.Label(
+            level_info_frame,
+            text=self.get_progress_text(),
+            font=("맑은 고딕", 10, "bold"),
+            fg="#e67e22",
+            bg="#f0f8ff"
+        )
+        self.streak_label.pack(pady=(3, 0))
+        
         # 하단 버튼 영역
         button_frame = tk.Frame(self.popup, bg="#f0f8ff")
         button_frame.pack(fill=tk.X, padx=15, pady=(5, 12))
@@ -1695,10 +1869,20 @@ class RestPopup:
         )
         self.close_button.pack(fill=tk.X)
     
+    def get_progress_text(self):
+        """오늘 목표 / 연속 기록 문구"""
+        if not self.progress:
+            return ""
+        today = f"오늘 휴식 {self.progress['today_completed']}/{self.progress['daily_goal']}회"
+        if self.progress['streak']:
+            return f"🔥 {self.progress['streak']}일 연속 · {today}"
+        return f"{today} (목표 달성 시 연속 기록 시작)"
+    
+    @tk_callback("RestPopup.update_timer")
     def update_timer(self):
         """타이머 업데이트"""
         if self.remaining_time >= 0:
-            # 진행바 및 텍스트 업데이트 (30초에서 시작해서 줄어듦)
+            # 진행바 및 텍스트 업데이트 (휴식 길이에서 시작해서 줄어듦)
             self.update_rest_progress_bar()
             
             # 레벨 정보 업데이트
@@ -1741,17 +1925,11 @@ class RestPopup:
             
             # 레벨업 감지 및 축하 팝업 표시
             if current_level > self.current_level:
-                print(f"🎉 휴식 중 레벨업! {self.current_level} → {current_level}")
+                log.info("🎉 휴식 중 레벨업! %s → %s", self.current_level, current_level)
                 self.current_level = current_level
                 
-                # 레벨 데이터 즉시 저장
-                save_level_data(current_level, current_total_seconds)
-                
-                # 레벨업 팝업 표시
-                try:
-                    LevelUpPopup(current_level)
-                except Exception as e:
-                    print(f"레벨업 팝업 표시 오류: {e}")
+                # 레벨업 팝업 표시 (휴식 팝업이 닫힌 뒤 알림 큐에서 표시)
+                self.show_levelup_popup(current_level)
             
             # 다음 레벨까지 필요한 시간 계산
             next_level_required = get_next_level_required_seconds(current_level)
@@ -1769,15 +1947,15 @@ class RestPopup:
             self.next_level_label.config(text=f"다음 레벨까지 남은 시간: {remaining_time_display}")
             
         except Exception as e:
-            print(f"레벨 정보 업데이트 오류: {e}")
+            log.error("레벨 정보 업데이트 오류: %s", e)
     
     def update_rest_progress_bar(self):
         """휴식 팝업 원형 진행바 및 텍스트 업데이트"""
         try:
             import math
             
-            # 남은 시간 비율 계산 (30초 기준)
-            remaining_ratio = max(0.0, self.remaining_time / 30.0)
+            # 남은 시간 비율 계산 (휴식 길이 기준)
+            remaining_ratio = max(0.0, self.remaining_time / float(self.rest_seconds))
             
             # 캔버스 지우기
             self.rest_progress_canvas.delete("all")
@@ -1837,34 +2015,71 @@ class RestPopup:
             )
             
         except Exception as e:
-            print(f"휴식 진행바 업데이트 오류: {e}")
+            log.error("휴식 진행바 업데이트 오류: %s", e)
     
     def close_popup(self):
-        """팝업 닫기 및 휴식 시간 저장"""
+        """팝업 닫기 및 휴식 시간 저장 (두 번째 호출부터는 무시 - 세션이 중복 기록되지 않도록)"""
+        if self._closed:
+            return
+        self._closed = True
         try:
             # 실제 휴식 시간 계산 및 저장
             actual_rest_time = int(time.time() - self.popup_start_time)
-            print(f"💾 휴식 시간 저장: {actual_rest_time}초")
+            log.info("💾 휴식 시간 저장: %s초", actual_rest_time)
+            
+            # 휴식 세션 기록 (전체 파일을 다시 쓰지 않고 저널에 한 줄 추가)
+            is_meal_time = bool(self.parent_clock and self.parent_clock.is_meal_time())
+            early = self.remaining_time >= 0  # 타이머가 끝나기 전에 닫음
+            current_level, current_total_seconds = record_rest_session(
+                self.popup_start_time, actual_rest_time, meal=is_meal_time, early=early)
+            
+            log.info("✅ 총 누적 휴식 시간: %s초 (%.1f분)", current_total_seconds, current_total_seconds/60)
             
-            # 레벨 데이터 저장
-            current_total_seconds = self.initial_total_seconds + actual_rest_time
-            current_level, _ = calculate_level_from_seconds(current_total_seconds)
-            save_level_data(current_level, current_total_seconds)
+            # 마지막 레벨 정보 갱신 이후 닫기 직전에 레벨이 오른 경우 (휴식 중에 이미 표시한 레벨업은 제외)
+            if current_level > self.current_level:
+                log.info("🎉 종료 시 레벨업! %s → %s", self.current_level, current_level)
+                self.current_level = current_level
+                self.show_levelup_popup(current_level)
             
-            print(f"✅ 총 누적 휴식 시간: {current_total_seconds}초 ({current_total_seconds/60:.1f}분)")
+            # 새 업적이 있으면 알림 (레벨업 팝업이 먼저 뜨면 그 팝업에 함께 표시)
+            if achievements is not None and achievements.unannounced:
+                self.show_achievement_popup()
             
             self.popup.destroy()
         except Exception as e:
-            print(f"팝업 닫기 오류: {e}")
+            log.error("팝업 닫기 오류: %s", e)
             try:
                 self.popup.destroy()
             except:
                 pass
+        notify_popup_closed(self)
+    
+    def show_levelup_popup(self, level):
+        """레벨업 팝업 표시 - 알림 큐가 있으면 큐를 통해 (한 번에 팝업 하나만)"""
+        try:
+            if self.parent_clock and hasattr(self.parent_clock, 'notifications'):
+                self.parent_clock.notifications.push("levelup", level)
+            else:
+                LevelUpPopup(level)
+        except Exception as e:
+            log.error("레벨업 팝업 표시 오류: %s", e)
+    
+    def show_achievement_popup(self):
+        """새 업적 팝업 표시 - 알림 큐를 통해 (레벨업 팝업 다음)"""
+        try:
+            if self.parent_clock and hasattr(self.parent_clock, 'notifications'):
+                self.parent_clock.notifications.push("achievement")
+            else:
+                LevelUpPopup(self.current_level, achievements=get_achievements().take_unannounced(),
+                             title="Achievement")
+        except Exception as e:
+            log.error("업적 팝업 표시 오류: %s", e)
 
 class MealPopup:
     """식사 알림 팝업 클래스"""
-    def __init__(self, meal_type="식사"):
+    def __init__(self, meal_type="식사", on_close=None):
         self.meal_type = meal_type
+        self.on_close = on_close  # 팝업이 닫힐 때 호출 (알림 큐에 다음 알림 요청)
         self.popup = tk.Toplevel()
         self.popup.title("ClockApp Ver2 - 식사 알림")
         self.popup.geometry("350x200")  # 크기 증가 (진행바 공간)
@@ -1899,6 +2114,7 @@ class MealPopup:
             self.popup.destroy()
         except:
             pass
+        notify_popup_closed(self)
     
     def center_popup(self):
         """팝업을 화면 중앙에 위치시키기"""
@@ -1972,6 +2188,7 @@ class MealPopup:
         # 처음 진행바 그리기
         self.update_meal_progress_bar()
     
+    @tk_callback("MealPopup.update_timer")
     def update_timer(self):
         """타이머 업데이트"""
         if self.remaining_time >= 0:
@@ -2017,7 +2234,7 @@ class MealPopup:
                 self.meal_progress_canvas.create_rectangle(2, 2, 2 + bar_width, 18, fill=color, outline=color)
             
         except Exception as e:
-            print(f"식사 진행바 업데이트 오류: {e}")
+            log.error("식사 진행바 업데이트 오류: %s", e)
 
 class WeatherWindow:
     """날씨 정보 창 클래스"""
@@ -2352,7 +2569,7 @@ class WeatherWindow:
             self.update_label.pack(pady=8)
             
         except Exception as e:
-            print(f"날씨 데이터 표시 오류: {e}")
+            log.error("날씨 데이터 표시 오류: %s", e)
             error_label = tk.Label(self.weather_frame, 
                                   text=f"날씨 정보를 표시할 수 없습니다.\n{e}",
                                   font=("Segoe UI", 11), 
@@ -2380,10 +2597,10 @@ class WeatherWindow:
             # 캐시 확인 (2시간 이내면 캐시 사용)
             cached_data = load_weather_cache()
             if cached_data:
-                print("✅ 캐시 사용 (2시간 이내)")
+                log.info("✅ 캐시 사용 (2시간 이내)")
                 weather_data = cached_data
             else:
-                print("⏳ 캐시 만료, 새 데이터 가져오는 중...")
+                log.info("⏳ 캐시 만료, 새 데이터 가져오는 중...")
                 weather_data = get_weather_data(force_refresh=True)
             
             # UI 스레드에서 업데이트
@@ -2410,7 +2627,7 @@ class SettingsWindow:
         self.parent_clock = parent_clock
         self.settings_window = tk.Toplevel(parent_clock.clock_window)
         self.settings_window.title("ClockApp Ver2 - 시간 설정")
-        self.settings_window.geometry("350x500")  # 높이 증가로 모든 옵션 표시
+        self.settings_window.geometry("350x580")  # 높이 증가로 모든 옵션 표시
         self.settings_window.resizable(False, False)
         
         # 설정 창을 부모 창 중앙에 위치
@@ -2443,7 +2660,7 @@ class SettingsWindow:
         
         # 설정 창 크기
         settings_width = 350
-        settings_height = 500
+        settings_height = 580
         
         # 중앙 위치 계산
         x = parent_x + (parent_width - settings_width) // 2
@@ -2605,6 +2822,46 @@ class SettingsWindow:
                                         activebackground="#f5f5f5")
         startup_checkbox.pack(side=tk.LEFT)
         
+        # 초 단위 표시 (끄면 분 단위로 표시하고 1분마다만 화면 갱신)
+        seconds_frame = tk.Frame(startup_section, bg="#f5f5f5")
+        seconds_frame.pack(pady=(0, 10), padx=10, fill=tk.X)
+        
+        self.show_seconds_var = tk.BooleanVar()
+        self.show_seconds_var.set(getattr(self.parent_clock, 'show_seconds', True))
+        
+        seconds_checkbox = tk.Checkbutton(seconds_frame, 
+                                        text="⏱️ 초 단위 표시", 
+                                        variable=self.show_seconds_var,
+                                        font=("Segoe UI", 10, "bold"),
+                                        bg="#f5f5f5", fg="#2c3e50",
+                                        activebackground="#f5f5f5")
+        seconds_checkbox.pack(side=tk.LEFT)
+        
+        # 회의 캘린더 (.ics) - 회의 중에는 휴식 알림 일시정지
+        calendar_frame = tk.Frame(startup_section, bg="#f5f5f5")
+        calendar_frame.pack(pady=(0, 10), padx=10, fill=tk.X)
+        
+        self.calendar_path = self.parent_clock.settings.get("calendar_ics_path", "")
+        self.calendar_label = tk.Label(calendar_frame, 
+                                     text=self.get_calendar_label_text(),
+                                     font=("Segoe UI", 9),
+                                     bg="#f5f5f5", fg="#2c3e50", anchor="w")
+        self.calendar_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        calendar_clear_btn = tk.Button(calendar_frame, text="✖",
+                                     command=self.clear_calendar_file,
+                                     font=("Segoe UI", 9),
+                                     bg="#e0e0e0", relief=tk.FLAT, bd=0, padx=6,
+                                     cursor="hand2")
+        calendar_clear_btn.pack(side=tk.RIGHT)
+        
+        calendar_btn = tk.Button(calendar_frame, text="📅 캘린더",
+                               command=self.choose_calendar_file,
+                               font=("Segoe UI", 9),
+                               bg="#e0e0e0", relief=tk.FLAT, bd=0, padx=6,
+                               cursor="hand2")
+        calendar_btn.pack(side=tk.RIGHT, padx=(0, 3))
+        
         # 버튼 프레임 (메인창 스타일)
         button_frame = tk.Frame(main_frame, bg="#f8f9fa")
         button_frame.pack(fill=tk.X)
@@ -2649,6 +2906,26 @@ class SettingsWindow:
         close_btn.bind("<Enter>", on_enter_close)
         close_btn.bind("<Leave>", on_leave_close)
     
+    def get_calendar_label_text(self):
+        """회의 캘린더 표시 문구"""
+        if self.calendar_path:
+            return f"📅 {os.path.basename(self.calendar_path)}"
+        return "📅 회의 캘린더 없음"
+    
+    def choose_calendar_file(self):
+        """회의 캘린더 (.ics) 파일 선택"""
+        path = filedialog.askopenfilename(parent=self.settings_window,
+                                          title="회의 캘린더 (.ics) 선택",
+                                          filetypes=[("iCalendar", "*.ics"), ("모든 파일", "*.*")])
+        if path:
+            self.calendar_path = path
+            self.calendar_label.config(text=self.get_calendar_label_text())
+    
+    def clear_calendar_file(self):
+        """회의 캘린더 연결 해제"""
+        self.calendar_path = ""
+        self.calendar_label.config(text=self.get_calendar_label_text())
+    
     def save_settings(self):
         """설정 저장"""
         try:
@@ -2663,6 +2940,7 @@ class SettingsWindow:
             break_enabled = self.break_enabled_var.get()
             lunch_enabled = self.lunch_enabled_var.get()
             dinner_enabled = self.dinner_enabled_var.get()
+            show_seconds = self.show_seconds_var.get()
             
             # 유효성 검사
             if not (1 <= minutes <= 1440):  # 1분~24시간
@@ -2678,7 +2956,8 @@ class SettingsWindow:
             
             # 설정 저장 (부모 클래스에 전달)
             self.parent_clock.update_time_settings(minutes, lunch_hour, lunch_minute, dinner_hour, dinner_minute, 
-                                                 break_enabled, lunch_enabled, dinner_enabled)
+                                                 break_enabled, lunch_enabled, dinner_enabled, show_seconds,
+                                                 calendar_ics_path=self.calendar_path)
             
             # 시작 프로그램 등록/해제 처리
             startup_enabled = self.startup_var.get()
@@ -2689,7 +2968,7 @@ class SettingsWindow:
                 startup_success = add_to_startup()
                 if not startup_success:
                     # 레지스트리 방법 실패 시 작업 스케줄러 방법 시도
-                    print("레지스트리 방법 실패, 작업 스케줄러 방법 시도...")
+                    log.warning("레지스트리 방법 실패, 작업 스케줄러 방법 시도...")
                     startup_success = add_to_startup_alternative()
                     if not startup_success:
                         tk.messagebox.showwarning("경고", "시작 프로그램 등록에 실패했습니다.")
@@ -2703,17 +2982,8 @@ class SettingsWindow:
                 if not startup_success:
                     tk.messagebox.showwarning("경고", "시작 프로그램 제거에 실패했습니다.")
             
-            # 파일에도 저장
-            settings = {
-                "time_interval": minutes,
-                "lunch_hour": lunch_hour,
-                "lunch_minute": lunch_minute,
-                "dinner_hour": dinner_hour,
-                "dinner_minute": dinner_minute,
-                "break_enabled": break_enabled,
-                "lunch_enabled": lunch_enabled,
-                "dinner_enabled": dinner_enabled
-            }
+            # 파일에도 저장 (설정창에 없는 항목도 함께 유지)
+            settings = dict(self.parent_clock.settings)
             
             if save_settings_to_file(settings):
                 # 성공 메시지
@@ -2727,6 +2997,230 @@ class SettingsWindow:
         except Exception as e:
             tk.messagebox.showerror("오류", f"설정 저장 중 오류가 발생했습니다: {e}")
 
+class HistoryChartWindow:
+    """휴식 기록 차트 창 - 일별 휴식 시간을 PIL 이미지 한 장으로 그려서 표시"""
+    RANGES = (("3개월", 92), ("1년", 366), ("전체", None))
+    
+    def __init__(self, parent_clock):
+        self.parent_clock = parent_clock
+        self.days = 366
+        self.redraw_job = None
+        self.photo = None
+        
+        first_day, seconds_per_day = get_rest_columns().daily_series(until=datetime.now().date())
+        self.chart = HistoryChart(first_day, seconds_per_day)
+        
+        self.window = tk.Toplevel(parent_clock.clock_window)
+        self.window.title("휴식 기록")
+        self.window.geometry("760x380")
+        self.window.minsize(360, 220)
+        self.window.configure(bg="#f0f8ff")
+        
+        self.create_widgets()
+        self.window.protocol("WM_DELETE_WINDOW", self.close_window)
+        self.window.focus_set()
+    
+    def create_widgets(self):
+        """위젯 생성"""
+        button_frame = tk.Frame(self.window, bg="#f0f8ff")
+        button_frame.pack(fill=tk.X, padx=10, pady=(8, 0))
+        
+        tk.Label(
+            button_frame,
+            text="일별 휴식 시간",
+            font=("맑은 고딕", 11, "bold"),
+            fg="#2c3e50",
+            bg="#f0f8ff"
+        ).pack(side=tk.LEFT)
+        
+        for text, days in reversed(self.RANGES):
+            tk.Button(
+                button_frame,
+                text=text,
+                font=("맑은 고딕", 9),
+                relief=tk.FLAT,
+                bg="#d6e4f0",
+                cursor="hand2",
+                command=lambda d=days: self.set_range(d)
+            ).pack(side=tk.RIGHT, padx=(4, 0))
+        
+        # 차트 영역 - 이미지 크기가 창 크기에 영향을 주지 않도록 place 사용
+        self.chart_frame = tk.Frame(self.window, bg="#f0f8ff")
+        self.chart_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.chart_label = tk.Label(self.chart_frame, bg="#f0f8ff", borderwidth=0)
+        self.chart_label.place(x=0, y=0, relwidth=1, relheight=1)
+        self.chart_frame.bind("<Configure>", self.schedule_redraw)
+    
+    def set_range(self, days):
+        """표시 기간 변경"""
+        self.days = days
+        self.redraw()
+    
+    def schedule_redraw(self, event=None):
+        """크기 조절 중에는 마지막 크기로 한 번만 다시 그림"""
+        if self.redraw_job is not None:
+            self.window.after_cancel(self.redraw_job)
+        self.redraw_job = self.window.after(60, self.redraw)
+    
+    def redraw(self):
+        """차트 이미지를 현재 크기로 그려서 표시 (같은 크기/기간은 캐시된 층 재사용)"""
+        self.redraw_job = None
+        try:
+            width = self.chart_frame.winfo_width()
+            height = self.chart_frame.winfo_height()
+            if width < 50 or height < 50:
+                return
+            image = self.chart.render(width, height, days=self.days)
+            self.photo = ImageTk.PhotoImage(image)  # 참조를 유지해야 이미지가 사라지지 않음
+            self.chart_label.configure(image=self.photo)
+        except Exception as e:
+            log.error("휴식 기록 차트 그리기 오류: %s", e)
+    
+    def close_window(self):
+        """창 닫기"""
+        if self.redraw_job is not None:
+            self.window.after_cancel(self.redraw_job)
+            self.redraw_job = None
+        self.window.destroy()
+
+class DiagnosticsWindow:
+    """진단 정보 창 - 메모리, 스레드, 대기 중인 after 콜백, 틱 지연, 캐시, 느린 콜백
+    
+    측정 대상에 영향을 주지 않도록 자체 타이머로 REFRESH_MS마다 한 번만 수집
+    (이 창의 갱신은 Tk 콜백 지표/느린 콜백 목록에 넣지 않음)
+    """
+    REFRESH_MS = 2000
+    
+    def __init__(self, parent_clock):
+        self.parent_clock = parent_clock
+        self.refresh_job = None
+        lateness = parent_clock.ticker.lateness
+        self.last_ticks = (lateness.count, lateness.total)
+        
+        self.window = tk.Toplevel(parent_clock.clock_window)
+        self.window.title("진단 정보")
+        self.window.geometry("560x520")
+        self.window.configure(bg="#f0f8ff")
+        
+        self.create_widgets()
+        self.window.protocol("WM_DELETE_WINDOW", self.close_window)
+        self.refresh()
+    
+    def create_widgets(self):
+        """위젯 생성"""
+        button_frame = tk.Frame(self.window, bg="#f0f8ff")
+        button_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=(0, 8))
+        tk.Button(
+            button_frame,
+            text="복사",
+            font=("맑은 고딕", 9),
+            relief=tk.FLAT,
+            bg="#d6e4f0",
+            cursor="hand2",
+            command=self.copy_to_clipboard
+        ).pack(side=tk.RIGHT)
+        
+        self.text = tk.Text(self.window, font=("Consolas", 9), wrap=tk.WORD, relief=tk.FLAT,
+                            bg="white", fg="#2c3e50", padx=8, pady=6)
+        self.text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+    
+    def collect(self):
+        """현재 상태를 텍스트로 수집"""
+        now = time.time()
+        lines = [f"[{datetime.now().strftime('%H:%M:%S')}] {self.REFRESH_MS // 1000}초마다 갱신", ""]
+        
+        lines.append(f"메모리(RSS): {format_bytes(process_rss())}")
+        names = thread_names()
+        lines.append(f"스레드 ({len(names)}): {', '.join(names)}")
+        
+        # 창별 대기 중인 after 콜백
+        windows = pending_after(self.parent_clock.clock_window)
+        lines.append("")
+        lines.append(f"대기 중인 after 콜백 ({sum(len(names) for names in windows.values())})")
+        for window, callbacks in sorted(windows.items()):
+            counts = {}
+            for callback in callbacks:
+                counts[callback] = counts.get(callback, 0) + 1
+            summary = ", ".join(name if count == 1 else f"{name} ×{count}" for name, count in counts.items())
+            lines.append(f"  {window}: {summary}")
+        
+        # 틱 지연 - 이번 갱신 주기 동안의 평균 + 시작 후 전체 분포
+        lateness = self.parent_clock.ticker.lateness
+        ticks = lateness.count - self.last_ticks[0]
+        recent = (lateness.total - self.last_ticks[1]) / ticks if ticks else 0.0
+        self.last_ticks = (lateness.count, lateness.total)
+        stats = lateness.summary()
+        lines.append("")
+        lines.append(f"틱 지연: 최근 평균 {recent:.1f}ms ({ticks}틱) · p50 {stats['p50']:g}ms · "
+                     f"p99 {stats['p99']:g}ms · 최대 {stats['max']:g}ms (전체 {stats['count']}틱)")
+        
+        # 캐시 크기/적중률
+        lines.append("")
+        lines.append("캐시")
+        info = json_store.cache_info()
+        lookups = info["hits"] + info["reads"]
+        lines.append(f"  상태 파일 파싱: {info['entries']}개, 적중률 {self.percent(info['hits'], lookups)} "
+                     f"(적중 {info['hits']} / 파일 읽기 {info['reads']})")
+        weather_lookups = WEATHER_CACHE_LOOKUPS.value(result="hit") + WEATHER_CACHE_LOOKUPS.value(result="miss")
+        lines.append(f"  날씨: 적중률 {self.percent(WEATHER_CACHE_LOOKUPS.value(result='hit'), weather_lookups)} "
+                     f"(조회 {weather_lookups}회)")
+        renderer = self.parent_clock.renderer.stats
+        lines.append(f"  시계 라벨: 변경 없음 {self.percent(renderer['skipped'], renderer['skipped'] + renderer['applied'])} "
+                     f"(반영 {renderer['applied']} / 건너뜀 {renderer['skipped']})")
+        store = state_store.stats
+        lines.append(f"  지연 쓰기: 갱신 {store['puts']}회, 합쳐짐 {store['coalesced']}회, 파일 기록 {store['writes']}회, "
+                     f"대기 {'있음' if state_store.is_dirty() else '없음'}")
+        
+        # UI 멈춤 (감시를 켠 경우)
+        watchdog = self.parent_clock.watchdog
+        if watchdog is not None:
+            lines.append("")
+            lines.append(f"UI 멈춤 ({watchdog.threshold * 1000:.0f}ms 이상): 이번 실행 {watchdog.stats['stalls']}회, "
+                         f"최장 {watchdog.stats['longest_ms']:.0f}ms")
+            for stall in watchdog.records()[-3:][::-1]:
+                where = stall["stack"][-1] if stall["stack"] else "스택 없음"
+                duration = stall["duration_ms"] if stall["duration_ms"] is not None else stall["detected_ms"]
+                lines.append(f"  {stall['at']} {duration}ms {where}")
+        
+        # 느린 콜백
+        lines.append("")
+        recent_slow = slow_callbacks.recent()
+        lines.append(f"느린 콜백 ({slow_callbacks.threshold * 1000:.0f}ms 이상, 최근 {len(recent_slow)}개 / "
+                     f"전체 {slow_callbacks.total}회)")
+        for at, name, ms in recent_slow:
+            age = int(now - at)
+            lines.append(f"  {datetime.fromtimestamp(at).strftime('%H:%M:%S')} ({age}초 전) {name} {ms:.1f}ms")
+        return "\n".join(lines)
+    
+    @staticmethod
+    def percent(part, total):
+        return f"{part * 100 / total:.0f}%" if total else "-"
+    
+    def refresh(self):
+        """수집 후 표시하고 다음 갱신 예약"""
+        self.refresh_job = None
+        try:
+            text = self.collect()
+            self.text.configure(state=tk.NORMAL)
+            self.text.delete("1.0", tk.END)
+            self.text.insert("1.0", text)
+            self.text.configure(state=tk.DISABLED)
+        except Exception as e:
+            log.error("진단 정보 수집 오류: %s", e)
+        self.refresh_job = self.window.after(self.REFRESH_MS, self.refresh)
+    
+    def copy_to_clipboard(self):
+        """문의 답변에 붙여 넣을 수 있도록 현재 내용 복사"""
+        self.window.clipboard_clear()
+        self.window.clipboard_append(self.text.get("1.0", tk.END))
+    
+    def close_window(self):
+        """창 닫기"""
+        if self.refresh_job is not None:
+            self.window.after_cancel(self.refresh_job)
+            self.refresh_job = None
+        self.window.destroy()
+
 class AboutWindow:
     """배포자 정보 창"""
     def __init__(self, parent_clock):
@@ -2854,11 +3348,52 @@ class AboutWindow:
         except:
             pass
     
+class LabelRenderCache:
+    """위젯별 마지막으로 반영한 텍스트/색상을 기억해 실제로 바뀐 경우에만 Tk에 반영"""
+    def __init__(self):
+        self._last = {}  # 위젯 -> (text, fg)
+        self.stats = {"applied": 0, "skipped": 0}
+    
+    def set(self, widget, text, fg=None):
+        """변경된 경우에만 config() 호출 - 반영했으면 True"""
+        state = (text, fg)
+        if self._last.get(widget) == state:
+            self.stats["skipped"] += 1
+            return False
+        if fg is None:
+            widget.config(text=text)
+        else:
+            widget.config(text=text, fg=fg)
+        self._last[widget] = state
+        self.stats["applied"] += 1
+        return True
+    
+    def invalidate(self):
+        """캐시 초기화 (다음 set에서 무조건 반영)"""
+        self._last.clear()
+
 class ClockWindow:
     """시계 창 클래스"""
     def __init__(self, start_minimized=False):
+        # 로그/추적 시작 (DEBUG는 설정 "debug_logging", 구간 추적은 "trace_enabled"가 true일 때만)
+        bootstrap_settings = json_store.load(get_settings_file_path()) or {}
+        app_log.setup(get_data_dir(), debug=bool(bootstrap_settings.get("debug_logging")))
+        if bootstrap_settings.get("trace_enabled") or os.environ.get("CLOCKAPP_TRACE"):
+            tracer.enable(os.path.join(get_data_dir(), TRACE_FILE_NAME))
+        # 성능 지표 HTTP 서버 (설정 "metrics_port", 기본 0 = 끔)
+        self.metrics_server = start_metrics_server(bootstrap_settings.get("metrics_port", 0))
+        # UI 멈춤 감시 (설정 "stall_watchdog_ms", 예: 250 - 기본 0 = 끔)
+        # 켜면 heartbeat가 Tk 루프를 초당 약 10번 깨우므로 문제를 조사할 때만 사용
+        stall_ms = bootstrap_settings.get("stall_watchdog_ms", 0)
+        self.watchdog = None
+        if stall_ms:
+            self.watchdog = StallWatchdog(os.path.join(get_data_dir(), STALL_FILE_NAME), threshold_ms=stall_ms)
+            self.heartbeat_ms = max(10, min(HEARTBEAT_MS, int(stall_ms) // 2))
+        startup_span = tracer.begin("ClockWindow.__init__", "startup", minimized=start_minimized)
+        
         # 독립적인 루트 창 생성 (Toplevel 대신 Tk 사용)
-        self.clock_window = tk.Tk()
+        with tracer.span("tk.Tk", "startup"):
+            self.clock_window = tk.Tk()
         self.clock_window.title("ClockApp Ver2")
         self.clock_window.geometry("320x240")  # 더 넓은 모던한 크기
         self.clock_window.resizable(False, False)
@@ -2866,8 +3401,16 @@ class ClockWindow:
         # 시작 시 최소화 여부 저장
         self.start_minimized = start_minimized
         
-        # 설정 로드 (일관된 함수 사용)
-        self.settings = load_settings()
+        # 라벨 렌더링 캐시 및 창 표시 상태 (숨김 상태에서는 라벨 갱신 중단)
+        self.renderer = LabelRenderCache()
+        self.window_visible = not start_minimized
+        
+        # 저장소 선택 (JSON 파일 / SQLite) 후 설정 로드 (일관된 함수 사용)
+        with tracer.span("configure_storage_backend", "startup"):
+            configure_storage_backend()
+        with tracer.span("load_settings", "startup"):
+            self.settings = load_settings()
+        widgets_span = tracer.begin("create_widgets", "startup")
         
         # 아이콘 설정 (사용자 PNG 우선, 없으면 기본 시계 아이콘)
         try:
@@ -2985,6 +3528,7 @@ class ClockWindow:
             settings_btn['background'] = '#78909c'
         settings_btn.bind("<Enter>", on_enter_settings)
         settings_btn.bind("<Leave>", on_leave_settings)
+        widgets_span.end()
         
         # 저장된 설정값 사용 (이미 초기화에서 로드됨)
         self.time_interval = self.settings["time_interval"]
@@ -2993,202 +3537,265 @@ class ClockWindow:
         self.break_enabled = self.settings.get("break_enabled", True)
         self.lunch_enabled = self.settings.get("lunch_enabled", True)
         self.dinner_enabled = self.settings.get("dinner_enabled", True)
-        
-        print("=" * 50)
-        print("📁 설정 로드 결과:")
-        print(f"   🔄 휴식 간격: {self.time_interval}분")
-        print(f"   🍱 점심시간: {self.lunch_time[0]:02d}:{self.lunch_time[1]:02d} ({'활성화' if self.lunch_enabled else '비활성화'})")
-        print(f"   🍽️ 저녁시간: {self.dinner_time[0]:02d}:{self.dinner_time[1]:02d} ({'활성화' if self.dinner_enabled else '비활성화'})")
-        print(f"   🔔 휴식 알림: {'활성화' if self.break_enabled else '비활성화'}")
-        print("=" * 50)
-        
-        # 휴식 타이머 관련 변수
-        self.last_break_time = time.time()  # 마지막 휴식 알림 시간
+        self.show_seconds = self.settings.get("show_seconds", True)  # False면 분 단위 표시 모드
+        with tracer.span("configure_level_curve", "startup"):
+            configure_level_curve(self.settings.get("level_curve"))  # 팀별 레벨 곡선
+        
+        # 지연 쓰기 시작 (flush_interval_seconds마다 변경된 상태 파일만 기록, 0이면 즉시 기록)
+        state_store.start(self.settings.get("flush_interval_seconds", DEFAULT_FLUSH_INTERVAL))
+        
+        log.info("📁 설정 로드 결과:")
+        log.info("   🔄 휴식 간격: %s분", self.time_interval)
+        log.info("   🍱 점심시간: %02d:%02d (%s)", self.lunch_time[0], self.lunch_time[1], '활성화' if self.lunch_enabled else '비활성화')
+        log.info("   🍽️ 저녁시간: %02d:%02d (%s)", self.dinner_time[0], self.dinner_time[1], '활성화' if self.dinner_enabled else '비활성화')
+        log.info("   🔔 휴식 알림: %s", '활성화' if self.break_enabled else '비활성화')
+        
+        # 휴식/식사 스케줄링 엔진 (Tk와 무관한 순수 로직)
+        with tracer.span("BreakScheduler", "startup"):
+            self.scheduler = BreakScheduler(self.settings)
+            # 이전 실행의 상태 복원 (자동 시작/재시작 시 휴식 카운트다운과 식사 알림 여부 유지)
+            if self.scheduler.restore_state(load_scheduler_state()):
+                log.info("   💾 이전 스케줄러 상태 복원")
+        
+        # 알림 큐 (식사/휴식/레벨업 팝업을 한 번에 하나씩, 중복은 합치거나 버림)
+        self.notifications = NotificationQueue(self.present_notification, alive=self.is_popup_alive)
+        
+        # 데드라인 스케줄러 (1초 폴링 대신 가장 가까운 이벤트 시각에만 깨어남)
+        self._next_label_time = 0  # 다음 라벨 갱신 시각
+        self.ticker = AlignedTicker(self.clock_window, self.update_clock)  # 경계 정렬 + 지연 기록
+        register_app_metrics(self.ticker, self.watchdog)
         
         # 창 닫기 시 정리
         self.clock_window.protocol("WM_DELETE_WINDOW", self.on_closing)
         
         # 첫 실행 시 시작프로그램에 자동 등록 (기본 활성화)
         try:
-            if not check_startup_registry():
-                add_to_startup()
-                print("윈도우 시작프로그램에 자동 등록되었습니다.")
+            with tracer.span("startup_registry", "startup"):
+                if not check_startup_registry():
+                    add_to_startup()
+                    log.info("윈도우 시작프로그램에 자동 등록되었습니다.")
         except Exception as e:
-            print(f"시작프로그램 등록 오류: {e}")
+            log.error("시작프로그램 등록 오류: %s", e)
         
         # 시작 시 최소화 처리
-        if self.start_minimized:
-            # 창을 숨기고 시스템 트레이에만 표시
-            self.clock_window.withdraw()  # 창 숨기기
-            self.create_system_tray()     # 시스템 트레이 아이콘 생성
-        else:
-            # 창을 화면 중앙에 위치
-            self.clock_window.eval('tk::PlaceWindow . center')
+        with tracer.span("show_window", "startup", minimized=self.start_minimized):
+            if self.start_minimized:
+                # 창을 숨기고 시스템 트레이에만 표시
+                self.clock_window.withdraw()  # 창 숨기기
+                self.create_system_tray()     # 시스템 트레이 아이콘 생성
+            else:
+                # 창을 화면 중앙에 위치
+                self.clock_window.eval('tk::PlaceWindow . center')
         
         # 시계 업데이트 시작
-        self.update_clock()
+        with tracer.span("update_clock", "startup"):
+            self.update_clock()
+        startup_span.end()
+        
+        # 메인루프가 처음 한가해질 때까지 (첫 화면 그리기 포함)
+        self.clock_window.after_idle(tracer.begin("first_idle", "startup").end)
+        
+        # UI 멈춤 감시 시작 (이후 메인루프가 heartbeat_ms마다 살아 있음을 알림)
+        if self.watchdog is not None:
+            self.watchdog.start()
+            self.heartbeat()
         
         # 시계 창의 메인루프 시작
         self.clock_window.mainloop()
         
+    def heartbeat(self):
+        """UI 멈춤 감시 - 메인루프가 돌고 있음을 감시 스레드에 알림"""
+        self.watchdog.beat()
+        self.clock_window.after(self.heartbeat_ms, self.heartbeat)
+    
+    @tk_callback("update_clock")
     def update_clock(self):
-        """시계 업데이트"""
+        """가장 가까운 데드라인에 호출 - 도래한 이벤트만 처리하고 다음 데드라인 예약"""
+        try:
+            # 휴식/식사 이벤트 처리
+            fired = self.scheduler.poll()
+            if fired:
+                # 다음 휴식 표시가 바로 바뀌도록 라벨 즉시 갱신
+                self._next_label_time = 0
+                save_scheduler_state(self.scheduler.export_state())
+            for kind, detail in fired:
+                if kind == "break":
+                    log.info("휴식 시간! [%s] %g분이 지났습니다.", detail['name'], detail['interval'])
+                    self.show_break_popup(detail)
+                elif detail == "lunch":
+                    log.info("점심 시간입니다!")
+                    self.show_meal_popup("점심")
+                else:
+                    log.info("저녁 시간입니다!")
+                    self.show_meal_popup("저녁")
+            
+            # 초(분 단위 모드는 분) 경계마다 라벨 갱신 (창이 숨겨져 있으면 건너뜀)
+            if self.window_visible and time.time() >= self._next_label_time:
+                self.refresh_labels()
+                self._next_label_time = next_boundary(self.get_display_period())
+                
+        except Exception as e:
+            log.error("시계 업데이트 오류: %s", e)
+        finally:
+            self._schedule_wakeup()
+    
+    def refresh_labels(self):
+        """시간/날짜/다음 휴식 라벨 갱신"""
         try:
             now = datetime.now()
             
-            # 시간 포맷 (HH:MM:SS)
-            time_str = now.strftime("%H:%M:%S")
-            self.time_label.config(text=time_str)
+            # 시간 포맷 (HH:MM:SS, 분 단위 모드는 HH:MM)
+            time_str = now.strftime(self.get_time_format())
+            self.renderer.set(self.time_label, time_str)
             
-            # 날짜 포맷 (YYYY-MM-DD 요일)
+            # 날짜 포맷 (YYYY-MM-DD 요일) - 하루에 한 번만 실제로 반영됨
             date_str = now.strftime("%Y-%m-%d %A")
-            self.date_label.config(text=date_str)
-            
-            # 휴식 타이머 체크
-            self.check_break_time()
-            
-            # 식사 시간 체크
-            self.check_meal_time()
+            self.renderer.set(self.date_label, date_str)
             
             # 다음 휴식시간 업데이트
             self.update_next_break_info()
             
-            # 1초 후 다시 업데이트
-            self.clock_window.after(1000, self.update_clock)
-            
         except Exception as e:
-            print(f"시계 업데이트 오류: {e}")
+            log.error("시계 표시 업데이트 오류: %s", e)
+    
+    def get_display_period(self):
+        """라벨 갱신 주기 (초) - 분 단위 표시 모드면 60초"""
+        return 1.0 if self.show_seconds else 60.0
+    
+    def get_time_format(self):
+        """시계 표시 형식"""
+        return "%H:%M:%S" if self.show_seconds else "%H:%M"
+    
+    def _schedule_wakeup(self):
+        """가장 가까운 데드라인(라벨 갱신/휴식/식사)에 after() 하나만 예약"""
+        try:
+            # 창이 숨겨져 있으면 라벨 갱신 데드라인은 제외
+            deadline = self._next_label_time if self.window_visible else float('inf')
+            scheduler_deadline = self.scheduler.next_deadline()
+            if scheduler_deadline is not None:
+                deadline = min(deadline, scheduler_deadline)
+            # 벽시계 시각에 맞춰 예약 (콜백 실행 시간이 누적되지 않음)
+            self.ticker.arm(min(deadline, time.time() + SCHEDULER_MAX_SLEEP))
+        except Exception as e:
+            log.error("스케줄 예약 오류: %s", e)
     
     def update_next_break_info(self):
         """다음 휴식시간 정보 업데이트"""
         try:
-            # 식사시간 중이면 특별 메시지 표시
-            if self.is_meal_time():
-                self.next_break_label.config(text="🍽️ 식사시간 (휴식 알림 일시정지)", fg="orange")
+            # 식사시간/억제 구간 중이면 특별 메시지 표시
+            suppressions = self.scheduler.active_suppressions()
+            if suppressions:
+                kind, name = suppressions[0]
+                if self.is_meal_time():
+                    self.renderer.set(self.next_break_label, "🍽️ 식사시간 (휴식 알림 일시정지)", "orange")
+                elif kind == "calendar":
+                    self.renderer.set(self.next_break_label, f"📅 {name} (휴식 알림 일시정지)", "orange")
+                else:
+                    self.renderer.set(self.next_break_label, f"🔕 {name} (휴식 알림 일시정지)", "orange")
                 return
             
-            current_time = time.time()
-            elapsed_minutes = (current_time - self.last_break_time) / 60
+            # 가장 가까운 휴식 타이머 (우선순위 큐의 맨 앞)
+            next_break = self.scheduler.next_break()
+            if next_break is None:
+                self.renderer.set(self.next_break_label, "⏰ 휴식 알림 꺼짐", "gray")
+                return
+            
+            # 타이머가 여러 개면 이름 표시
+            title = "다음 휴식"
+            if len(self.scheduler.timers) > 1:
+                title = f"다음 {next_break[1]['name']}"
             
             # 다음 휴식까지 남은 시간 계산
-            remaining_minutes = max(0, self.time_interval - elapsed_minutes)
+            remaining_minutes = self.scheduler.remaining_break_seconds() / 60
             
-            if remaining_minutes >= 1:
+            if not self.show_seconds:
+                # 분 단위 표시 모드 - 남은 분을 올림해서 표시
+                if remaining_minutes > 0:
+                    self.renderer.set(self.next_break_label, f"⏰ {title}: {math.ceil(remaining_minutes)}분", "green")
+                else:
+                    self.renderer.set(self.next_break_label, "⏰ 휴식시간!", "red")
+            elif remaining_minutes >= 1:
                 remaining_mins = int(remaining_minutes)
                 remaining_secs = int((remaining_minutes - remaining_mins) * 60)
-                self.next_break_label.config(text=f"⏰ 다음 휴식: {remaining_mins}:{remaining_secs:02d}", fg="green")
+                self.renderer.set(self.next_break_label, f"⏰ {title}: {remaining_mins}:{remaining_secs:02d}", "green")
             else:
                 remaining_secs = int(remaining_minutes * 60)
                 if remaining_secs > 0:
-                    self.next_break_label.config(text=f"⏰ 다음 휴식: {remaining_secs}초", fg="orange")
+                    self.renderer.set(self.next_break_label, f"⏰ {title}: {remaining_secs}초", "orange")
                 else:
-                    self.next_break_label.config(text="⏰ 휴식시간!", fg="red")
+                    self.renderer.set(self.next_break_label, "⏰ 휴식시간!", "red")
             
         except Exception as e:
-            print(f"다음 휴식시간 정보 업데이트 오류: {e}")
+            log.error("다음 휴식시간 정보 업데이트 오류: %s", e)
     
     def is_meal_time(self):
         """현재 식사시간인지 확인 (식사 알림이 활성화된 경우에만)"""
         try:
-            now = datetime.now()
-            current_hour = now.hour
-            current_minute = now.minute
-            current_time_minutes = current_hour * 60 + current_minute
-            
-            is_meal = False
-            
-            # 점심시간 체크 (점심 알림이 활성화된 경우에만)
-            if getattr(self, 'lunch_enabled', True):
-                lunch_start = self.lunch_time[0] * 60 + self.lunch_time[1]
-                lunch_end = lunch_start + 60  # 1시간 후
-                if lunch_start <= current_time_minutes < lunch_end:
-                    is_meal = True
-            
-            # 저녁시간 체크 (저녁 알림이 활성화된 경우에만)
-            if getattr(self, 'dinner_enabled', True):
-                dinner_start = self.dinner_time[0] * 60 + self.dinner_time[1]
-                dinner_end = dinner_start + 60  # 1시간 후
-                if dinner_start <= current_time_minutes < dinner_end:
-                    is_meal = True
-            
-            return is_meal
-            
+            return self.scheduler.is_meal_time()
         except Exception as e:
-            print(f"식사시간 확인 오류: {e}")
+            log.error("식사시간 확인 오류: %s", e)
             return False
     
-    def check_break_time(self):
-        """휴식 시간 체크"""
-        try:
-            # 휴식 알림이 비활성화되어 있으면 건너뛰기
-            if not getattr(self, 'break_enabled', True):
-                return
-            
-            # 식사시간 중이면 휴식 팝업 건너뛰기
-            if self.is_meal_time():
-                print("식사시간 중이므로 휴식 알림을 건너뜁니다.")
-                return
-            
-            current_time = time.time()
-            elapsed_minutes = (current_time - self.last_break_time) / 60
-            
-            # 설정된 시간 간격이 지났으면 휴식 알림
-            if elapsed_minutes >= self.time_interval:
-                print(f"휴식 시간! {self.time_interval}분이 지났습니다.")
-                self.show_break_popup()
-                self.last_break_time = current_time  # 마지막 휴식 시간 업데이트
-                
-        except Exception as e:
-            print(f"휴식 시간 체크 오류: {e}")
+    def show_break_popup(self, timer=None):
+        """휴식 팝업 요청 (timer: 도래한 휴식 타이머 프로필) - 알림 큐를 통해 표시"""
+        if not self.notifications.push("break", timer):
+            log.info("휴식 알림 생략 (식사/휴식 팝업 표시 중)")
     
-    def show_break_popup(self):
-        """휴식 팝업 표시"""
-        try:
-            RestPopup(parent_clock=self)
-        except Exception as e:
-            print(f"휴식 팝업 표시 오류: {e}")
+    def show_meal_popup(self, meal_type):
+        """식사 팝업 요청 - 알림 큐를 통해 표시"""
+        self.notifications.push("meal", meal_type)
     
-    def check_meal_time(self):
-        """식사 시간 체크"""
-        try:
-            now = datetime.now()
-            current_hour = now.hour
-            current_minute = now.minute
-            current_date = now.strftime("%Y-%m-%d")
-            
-            # 점심 시간 체크 (정확한 시간에만)
-            if (getattr(self, 'lunch_enabled', True) and 
-                current_hour == self.lunch_time[0] and current_minute == self.lunch_time[1] and 
-                (not hasattr(self, 'lunch_shown_today') or 
-                getattr(self, 'lunch_shown_today', '') != current_date)):
-                print("점심 시간입니다!")
-                self.show_meal_popup("점심")
-                self.lunch_shown_today = current_date
-            
-            # 저녁 시간 체크 (정확한 시간에만)
-            if (getattr(self, 'dinner_enabled', True) and
-                current_hour == self.dinner_time[0] and current_minute == self.dinner_time[1] and
-                (not hasattr(self, 'dinner_shown_today') or 
-                getattr(self, 'dinner_shown_today', '') != current_date)):
-                print("저녁 시간입니다!")
-                self.show_meal_popup("저녁")
-                self.dinner_shown_today = current_date
-                
-        except Exception as e:
-            print(f"식사 시간 체크 오류: {e}")
+    @tk_callback("present_notification")
+    def present_notification(self, kind, payload):
+        """알림 큐에서 꺼낸 알림의 팝업 생성 - 팝업 객체 반환"""
+        popup = self.create_notification_popup(kind, payload)
+        if popup is not None:
+            POPUP_EVENTS.inc(kind=kind, event="shown")
+        return popup
     
-    def show_meal_popup(self, meal_type):
-        """식사 팝업 표시"""
+    def create_notification_popup(self, kind, payload):
+        """알림 종류별 팝업 생성 (표시할 것이 없으면 None)"""
+        on_close = self.on_popup_closed
+        if kind == "break":
+            if payload:
+                # 타이머가 하나뿐이면 이름 없이 기존 문구 사용
+                break_name = payload["name"] if len(self.scheduler.timers) > 1 else None
+                return RestPopup(parent_clock=self, rest_seconds=payload["rest_seconds"],
+                                 break_name=break_name, on_close=on_close)
+            return RestPopup(parent_clock=self, on_close=on_close)
+        if kind == "meal":
+            return MealPopup(payload, on_close=on_close)
+        if kind == "levelup":
+            return LevelUpPopup(payload, on_close=on_close, achievements=get_achievements().take_unannounced())
+        if kind == "achievement":
+            # 레벨업 팝업에 이미 함께 표시했으면 생략
+            new_achievements = get_achievements().take_unannounced()
+            if not new_achievements:
+                return None
+            return LevelUpPopup(get_rest_journal().level, on_close=on_close, achievements=new_achievements,
+                                title="Achievement")
+        return None
+    
+    def on_popup_closed(self, popup):
+        """팝업이 닫히면 잠시 뒤 다음 알림 표시"""
+        active = self.notifications.active
+        if active is not None and active[2] is popup:
+            POPUP_EVENTS.inc(kind=active[0], event="dismissed")
         try:
-            MealPopup(meal_type)
-        except Exception as e:
-            print(f"식사 팝업 표시 오류: {e}")
+            self.clock_window.after(300, lambda: self.notifications.done(popup))
+        except Exception:
+            self.notifications.done(popup)
+    
+    def is_popup_alive(self, popup):
+        """팝업 창이 아직 열려 있는지"""
+        return bool(popup.popup.winfo_exists())
     
     def on_closing(self):
         """창 닫기 처리 - X 버튼 클릭 시 백그라운드로 이동"""
         try:
-            # 창을 완전히 숨기기
+            # 창을 완전히 숨기기 (라벨 갱신 중단)
             self.clock_window.withdraw()
+            self.window_visible = False
             
             # 작업표시줄에서도 숨기기
             self.clock_window.attributes('-toolwindow', True)
@@ -3209,7 +3816,7 @@ class ClockWindow:
             self.show_background_notification()
             
         except Exception as e:
-            print(f"백그라운드 이동 오류: {e}")
+            log.error("백그라운드 이동 오류: %s", e)
             # 오류 발생 시 완전 종료
             self.exit_application()
     
@@ -3244,7 +3851,7 @@ class ClockWindow:
             notification.after(3000, notification.destroy)
             
         except Exception as e:
-            print(f"알림 표시 오류: {e}")
+            log.error("알림 표시 오류: %s", e)
     
     def create_system_tray(self):
         """시스템 트레이 기능 구현 (간단한 버전)"""
@@ -3263,7 +3870,7 @@ class ClockWindow:
             self.create_tray_icon()
             
         except Exception as e:
-            print(f"시스템 트레이 생성 오류: {e}")
+            log.error("시스템 트레이 생성 오류: %s", e)
     
     def create_tray_icon(self):
         """트레이 아이콘 창 생성"""
@@ -3312,35 +3919,40 @@ class ClockWindow:
             tray_frame.bind("<Button-3>", self.show_tray_menu)
             
         except Exception as e:
-            print(f"트레이 아이콘 생성 오류: {e}")
+            log.error("트레이 아이콘 생성 오류: %s", e)
     
     def update_tray_time(self):
         """트레이 창의 시간 업데이트"""
         try:
             if hasattr(self, 'tray_time_label') and self.tray_time_label.winfo_exists():
-                current_time = datetime.now().strftime("%H:%M:%S")
+                current_time = datetime.now().strftime(self.get_time_format())
                 self.tray_time_label.config(text=current_time)
-                # 1초 후 다시 실행
-                self.root.after(1000, self.update_tray_time)
+                # 다음 초(분 단위 모드는 분) 경계에 다시 실행
+                delay_ms = int((next_boundary(self.get_display_period()) - time.time()) * 1000) + 1
+                self.root.after(delay_ms, self.update_tray_time)
         except Exception as e:
-            print(f"트레이 시간 업데이트 오류: {e}")
+            log.error("트레이 시간 업데이트 오류: %s", e)
     
     def show_tray_menu(self, event):
         """트레이 메뉴 표시"""
         try:
             self.tray_menu.post(event.x_root, event.y_root)
         except Exception as e:
-            print(f"트레이 메뉴 표시 오류: {e}")
+            log.error("트레이 메뉴 표시 오류: %s", e)
     
     def show_window(self):
         """창 다시 표시"""
         try:
             self.clock_window.deiconify()  # 창 다시 표시
             self.clock_window.lift()       # 창을 맨 앞으로
+            
+            # 라벨 갱신 재개 (즉시 최신 시각으로 갱신)
+            self.window_visible = True
+            self.update_clock()
             if hasattr(self, 'tray_window'):
                 self.tray_window.destroy()  # 트레이 창 닫기
         except Exception as e:
-            print(f"창 표시 오류: {e}")
+            log.error("창 표시 오류: %s", e)
     
     def create_system_tray(self):
         """실제 Windows 시스템 트레이 아이콘 생성"""
@@ -3352,8 +3964,11 @@ class ClockWindow:
             menu = Menu(
                 MenuItem("Ver2 열기", self.show_window_from_tray, default=True),
                 MenuItem("설정", self.open_settings_from_tray),
+                MenuItem("휴식 통계", self.open_rest_stats_from_tray),
+                MenuItem("휴식 기록 차트", self.open_history_chart_from_tray),
                 Menu.SEPARATOR,
                 MenuItem("Ver2 정보", self.open_about_from_tray),
+                MenuItem("진단 정보", self.open_diagnostics_from_tray),
                 Menu.SEPARATOR,
                 MenuItem("종료", self.quit_from_tray)
             )
@@ -3370,10 +3985,10 @@ class ClockWindow:
             self.tray_thread = threading.Thread(target=self.system_tray.run, daemon=True)
             self.tray_thread.start()
             
-            print("Windows 시스템 트레이 아이콘이 생성되었습니다.")
+            log.info("Windows 시스템 트레이 아이콘이 생성되었습니다.")
             
         except Exception as e:
-            print(f"시스템 트레이 아이콘 생성 오류: {e}")
+            log.error("시스템 트레이 아이콘 생성 오류: %s", e)
     
     def get_tray_icon_image(self):
         """트레이에 사용할 아이콘 이미지 가져오기"""
@@ -3397,7 +4012,7 @@ class ClockWindow:
                 # 3. 기본 시계 아이콘 생성 (마지막 fallback)
                 return create_clock_image(32)
         except Exception as e:
-            print(f"트레이 아이콘 이미지 생성 오류: {e}")
+            log.error("트레이 아이콘 이미지 생성 오류: %s", e)
             # 오류 시 기본 아이콘 반환
             return create_clock_image(32)
     
@@ -3413,6 +4028,36 @@ class ClockWindow:
         """트레이에서 정보 창 열기"""
         self.clock_window.after(0, self.open_about)
     
+    def open_rest_stats_from_tray(self, icon=None, item=None):
+        """트레이에서 휴식 통계 열기"""
+        self.clock_window.after(0, self.show_rest_stats)
+    
+    def open_history_chart_from_tray(self, icon=None, item=None):
+        """트레이에서 휴식 기록 차트 열기"""
+        self.clock_window.after(0, self.open_history_chart)
+    
+    def open_diagnostics_from_tray(self, icon=None, item=None):
+        """트레이에서 진단 정보 창 열기"""
+        self.clock_window.after(0, self.open_diagnostics)
+    
+    def show_rest_stats(self):
+        """휴식 통계 요약 표시 (오늘/이번 주 휴식 시간, 완료율, 연속 휴식 일수)"""
+        try:
+            summary = get_rest_columns().summary()
+            busiest = get_rest_columns().totals_by_hour()
+            peak_hour = busiest.index(max(busiest)) if any(busiest) else None
+            lines = [
+                f"오늘 휴식: {format_time_display(summary['today_seconds'])}",
+                f"이번 주 휴식: {format_time_display(summary['week_seconds'])}",
+                f"끝까지 휴식한 비율: {summary['completion_rate'] * 100:.0f}% ({summary['sessions']}회)",
+                f"연속 휴식: {summary['streaks']['current']}일 (최장 {summary['streaks']['longest']}일)"
+            ]
+            if peak_hour is not None:
+                lines.append(f"가장 많이 쉰 시간대: {peak_hour}시")
+            messagebox.showinfo("휴식 통계", "\n".join(lines))
+        except Exception as e:
+            log.error("휴식 통계 표시 오류: %s", e)
+    
     def quit_from_tray(self, icon=None, item=None):
         """트레이에서 애플리케이션 종료"""
         try:
@@ -3423,9 +4068,51 @@ class ClockWindow:
             pass
         self.clock_window.after(0, self.exit_application)
     
+    def dump_tick_stats(self):
+        """틱 지연 히스토그램(p50/p99/max)을 파일로 저장 - Tk 루프를 막는 콜백 추적용"""
+        try:
+            stats_file = os.path.join(get_data_dir(), "tick_lateness.json")
+            self.ticker.lateness.dump(stats_file)
+            log.info("틱 지연 통계 저장: %s -> %s", self.ticker.lateness.summary(), stats_file)
+        except Exception as e:
+            log.warning("틱 지연 통계 저장 실패: %s", e)
+    
     def exit_application(self):
         """애플리케이션 완전 종료"""
         try:
+            # UI 멈춤 감시 종료 (종료 중 저장은 멈춤으로 기록하지 않음)
+            if self.watchdog is not None:
+                self.watchdog.stop()
+            
+            # 틱 지연 통계 저장
+            self.dump_tick_stats()
+            
+            # 스케줄러 상태 저장 (다음 실행에서 이어서 동작)
+            save_scheduler_state(self.scheduler.export_state())
+            
+            # 휴식 기록 스냅샷 저장 (다음 시작 시 저널 꼬리만 읽도록)
+            save_level_data()
+            
+            # 지연 쓰기 중인 상태 파일 모두 기록
+            state_store.close()
+            if state_db is not None:
+                state_db.close()
+            
+            # 구간 추적 파일 저장 (추적을 켠 경우)
+            if tracer.enabled:
+                try:
+                    log.info("구간 추적 저장: %s", tracer.write())
+                except OSError as e:
+                    log.warning("구간 추적 저장 실패: %s", e)
+                tracer.disable()
+            
+            # 성능 지표 서버 종료
+            if self.metrics_server is not None:
+                self.metrics_server.stop()
+            
+            # 큐에 남은 로그 기록
+            app_log.shutdown()
+            
             # 시스템 트레이 정리
             if hasattr(self, 'system_tray') and self.system_tray:
                 try:
@@ -3451,43 +4138,84 @@ class ClockWindow:
         try:
             SettingsWindow(self)
         except Exception as e:
-            print(f"설정 창 열기 오류: {e}")
+            log.error("설정 창 열기 오류: %s", e)
     
     def open_weather(self):
         """날씨 창 열기"""
         try:
             WeatherWindow(self)
         except Exception as e:
-            print(f"날씨 창 열기 오류: {e}")
+            log.error("날씨 창 열기 오류: %s", e)
+    
+    def open_history_chart(self):
+        """휴식 기록 차트 창 열기"""
+        try:
+            HistoryChartWindow(self)
+        except Exception as e:
+            log.error("휴식 기록 차트 열기 오류: %s", e)
+    
+    def open_diagnostics(self):
+        """진단 정보 창 열기 (이미 열려 있으면 앞으로)"""
+        try:
+            window = getattr(self, "diagnostics_window", None)
+            if window is not None and window.window.winfo_exists():
+                window.window.lift()
+                return
+            self.diagnostics_window = DiagnosticsWindow(self)
+        except Exception as e:
+            log.error("진단 정보 창 열기 오류: %s", e)
     
     def open_about(self):
         """정보 창 열기"""
         try:
             AboutWindow(self)
         except Exception as e:
-            print(f"정보 창 열기 오류: {e}")
+            log.error("정보 창 열기 오류: %s", e)
     
     def update_time_settings(self, minutes, lunch_hour, lunch_minute, dinner_hour, dinner_minute, 
-                           break_enabled=True, lunch_enabled=True, dinner_enabled=True):
-        """시간 설정 업데이트"""
+                           break_enabled=True, lunch_enabled=True, dinner_enabled=True, show_seconds=None,
+                           calendar_ics_path=None):
+        """시간 설정 업데이트 (calendar_ics_path: None이면 유지, 빈 문자열이면 해제)"""
         self.time_interval = minutes
         self.lunch_time = (lunch_hour, lunch_minute)
         self.dinner_time = (dinner_hour, dinner_minute)
         self.break_enabled = break_enabled
         self.lunch_enabled = lunch_enabled
         self.dinner_enabled = dinner_enabled
-        
-        # 휴식 타이머 리셋 (새로운 간격 적용)
-        self.last_break_time = time.time()
-        
-        print(f"설정 업데이트됨 - 간격: {minutes}분, 점심: {lunch_hour:02d}:{lunch_minute:02d}, 저녁: {dinner_hour:02d}:{dinner_minute:02d}")
-        print(f"활성화 상태 - 휴식: {break_enabled}, 점심: {lunch_enabled}, 저녁: {dinner_enabled}")
-        print("휴식 타이머가 리셋되었습니다.")
+        if show_seconds is not None:
+            self.show_seconds = show_seconds
+        
+        # 현재 설정에 반영 (suppression_windows 등 설정창에 없는 항목은 유지)
+        self.settings.update({
+            "time_interval": minutes,
+            "lunch_hour": lunch_hour,
+            "lunch_minute": lunch_minute,
+            "dinner_hour": dinner_hour,
+            "dinner_minute": dinner_minute,
+            "break_enabled": break_enabled,
+            "lunch_enabled": lunch_enabled,
+            "dinner_enabled": dinner_enabled,
+            "show_seconds": self.show_seconds
+        })
+        if calendar_ics_path is not None:
+            self.settings["calendar_ics_path"] = calendar_ics_path
+        
+        # 표시 형식이 바뀌었을 수 있으므로 라벨 즉시 갱신
+        self._next_label_time = 0
+        
+        # 휴식 타이머 리셋 및 데드라인/억제 구간 재계산 (새로운 설정 적용)
+        self.scheduler.update_settings(self.settings)
+        save_scheduler_state(self.scheduler.export_state())
+        self._schedule_wakeup()
+        
+        log.info("설정 업데이트됨 - 간격: %s분, 점심: %02d:%02d, 저녁: %02d:%02d", minutes, lunch_hour, lunch_minute, dinner_hour, dinner_minute)
+        log.info("활성화 상태 - 휴식: %s, 점심: %s, 저녁: %s", break_enabled, lunch_enabled, dinner_enabled)
+        log.info("휴식 타이머가 리셋되었습니다.")
 
 def create_hello_window():
     """인사 창 생성"""
     # 실행 시작 시 아이콘 파일 생성
-    print("하트 아이콘 파일 생성 중..")
+    log.info("하트 아이콘 파일 생성 중..")
     icon_file_path = create_icon_file()
 
     # 커스텀 팝업 창 만들기
@@ -3500,9 +4228,9 @@ def create_hello_window():
     try:
         if icon_file_path and os.path.exists(icon_file_path):
             root.iconbitmap(icon_file_path)
-            print("생성된 하트 아이콘 적용 성공")
+            log.info("생성된 하트 아이콘 적용 성공")
     except Exception as e:
-        print(f"아이콘 설정 실패: {e}")
+        log.warning("아이콘 설정 실패: %s", e)
 
     # 창을 화면 중앙에 위치
     root.eval('tk::PlaceWindow . center')
@@ -3573,7 +4301,7 @@ def create_hello_window():
             raise Exception("시계 이미지 생성 실패")
 
     except Exception as e:
-        print(f"타이틀바 하트 이미지 오류: {e}")
+        log.error("타이틀바 하트 이미지 오류: %s", e)
         title_text = tk.Label(title_content, text="♥ 안녕하세요!", bg="#d0d0d0", font=("Arial", 10, "bold"))   
         title_text.pack()
         title_text.bind("<Button-1>", start_drag)
@@ -3639,7 +4367,7 @@ def create_hello_window():
             raise Exception("메인 마우스 이미지 생성 실패")
 
     except Exception as e:
-        print(f"메인 하트 이미지 오류: {e}")
+        log.error("메인 하트 이미지 오류: %s", e)
         label = tk.Label(content_frame, text="♥ 안녕", font=("Arial", 16))
         label.pack(expand=True)
 
@@ -3649,7 +4377,7 @@ def create_hello_window():
         try:
             ClockWindow()  # 시계창 열기
         except Exception as e:
-            print(f"시계 창 오류: {e}")
+            log.error("시계 창 오류: %s", e)
         finally:
             try:
                 root.quit()
@@ -3702,7 +4430,7 @@ if __name__ == "__main__":
     mutex_handle = CreateMutexW(None, False, MUTEX_NAME_V2)
     
     if GetLastError() == ERROR_ALREADY_EXISTS:
-        print("ClockApp Ver2가 이미 실행 중입니다.")
+        log.info("ClockApp Ver2가 이미 실행 중입니다.")
         # 메시지 박스 표시 (콘솔이 없을 수 있으므로)
         MessageBoxW = ctypes.windll.user32.MessageBoxW
         MessageBoxW(None, "ClockApp Ver2가 이미 실행 중입니다.\n시스템 트레이를 확인해주세요.", 
@@ -3721,7 +4449,7 @@ if __name__ == "__main__":
         try:
             ClockWindow(start_minimized=args.minimized)
         except Exception as e:
-            print(f"시계 창 실행 오류: {e}")
+            log.error("시계 창 실행 오류: %s", e)
     finally:
         # 뮤텍스 해제 (프로그램 종료 시 자동으로 해제되지만 명시적으로 처리)
         if mutex_handle:
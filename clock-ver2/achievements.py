@@ -0,0 +1,165 @@
+"""
+ClockApp Ver2 - 업적 / 연속 기록
+레벨 외에 하루 목표(완료한 휴식 N회), 연속 달성 일수, 누적 세션/시간 마일스톤을 계산
+휴식 세션 하나마다 유지 중인 카운터만 갱신 (기록 전체를 다시 훑지 않음, 세션당 O(1))
+"""
+
+import logging
+from datetime import date
+
+log = logging.getLogger("clockapp.achievements")
+
+STATE_VERSION = 1
+DEFAULT_DAILY_GOAL = 4  # 하루 목표: 끝까지 마친 휴식 횟수
+
+# 마일스톤 기준 (오름차순) - 다음 기준 하나만 확인
+MILESTONES = {
+    "streak": (3, 7, 14, 30, 50, 100, 200, 365),
+    "sessions": (10, 50, 100, 250, 500, 1000, 2500, 5000, 10000),
+    "hours": (1, 5, 10, 25, 50, 100, 250, 500, 1000),
+}
+MILESTONE_TITLES = {
+    "streak": "🔥 {0}일 연속 목표 달성",
+    "sessions": "🏅 휴식 {0}회 완료",
+    "hours": "⏳ 누적 휴식 {0}시간",
+}
+
+
+def local_day(epoch):
+    """epoch -> 로컬 날짜 번호 (date.toordinal)"""
+    return date.fromtimestamp(epoch).toordinal()
+
+
+class AchievementTracker:
+    """하루 목표 / 연속 기록 / 마일스톤 카운터"""
+
+    def __init__(self, daily_goal=DEFAULT_DAILY_GOAL):
+        self.daily_goal = max(1, int(daily_goal))
+        self.day = 0               # 오늘 카운터의 날짜 번호
+        self.day_completed = 0     # 그날 끝까지 마친 휴식 수
+        self.day_seconds = 0       # 그날 휴식 초
+        self.last_goal_day = 0     # 마지막으로 목표를 달성한 날
+        self.streak = 0            # last_goal_day까지 이어진 연속 달성 일수
+        self.longest_streak = 0
+        self.goal_days = 0         # 목표를 달성한 날 수
+        self.sessions = 0
+        self.completed = 0
+        self.seconds = 0
+        self.next_index = {kind: 0 for kind in MILESTONES}  # 다음에 확인할 마일스톤 위치
+        self.unlocked = []         # [{"id", "title", "at"}]
+        self.journal_sessions = 0  # 마지막으로 반영한 시점의 저널 세션 수 (동기화 확인용)
+        self.unannounced = []      # 아직 팝업으로 알리지 않은 업적 (저장하지 않음)
+
+    # ===== 세션 반영 =====
+
+    def record(self, start, duration, meal=False, early=False):
+        """휴식 세션 하나 반영 - 새로 달성한 업적 목록 (하루 목표 포함)"""
+        events = []
+        duration = int(duration)
+        self.sessions += 1
+        self.seconds += duration
+        completed = not early and not meal and duration > 0
+
+        day = local_day(start)
+        if day > self.day:
+            self.day, self.day_completed, self.day_seconds = day, 0, 0
+        if day == self.day:
+            self.day_seconds += duration
+            if completed:
+                self.day_completed += 1
+                if self.day_completed == self.daily_goal:
+                    events.extend(self._goal_reached(day))
+        if completed:
+            self.completed += 1
+
+        events.extend(self._check("sessions", self.completed))
+        events.extend(self._check("hours", self.seconds // 3600))
+        self.unannounced.extend(events)
+        return events
+
+    def _goal_reached(self, day):
+        """하루 목표 달성 - 연속 일수 갱신"""
+        self.streak = self.streak + 1 if self.last_goal_day == day - 1 else 1
+        self.last_goal_day = day
+        self.longest_streak = max(self.longest_streak, self.streak)
+        self.goal_days += 1
+        events = [{"id": f"goal-{date.fromordinal(day).isoformat()}",
+                   "title": f"✅ 오늘 목표 달성 (휴식 {self.daily_goal}회)"}]
+        return events + self._check("streak", self.streak)
+
+    def _check(self, kind, value):
+        """다음 마일스톤에 도달했는지 (한 번에 여러 개를 넘으면 모두)"""
+        thresholds = MILESTONES[kind]
+        events = []
+        while self.next_index[kind] < len(thresholds) and value >= thresholds[self.next_index[kind]]:
+            threshold = thresholds[self.next_index[kind]]
+            self.next_index[kind] += 1
+            achievement = {"id": f"{kind}-{threshold}", "title": MILESTONE_TITLES[kind].format(threshold),
+                           "at": self.day}
+            self.unlocked.append(achievement)
+            events.append(achievement)
+        return events
+
+    def take_unannounced(self):
+        """알리지 않은 업적을 꺼냄 (팝업에 표시할 때)"""
+        events, self.unannounced = self.unannounced, []
+        return events
+
+    # ===== 조회 =====
+
+    def progress(self, now_day=None):
+        """오늘 진행 상황 {"today_completed", "daily_goal", "streak", "longest_streak", "goal_met"}
+
+        어제나 오늘 목표를 달성하지 않았으면 연속 기록은 끊긴 것(0)으로 본다.
+        """
+        today = now_day if now_day is not None else date.today().toordinal()
+        today_completed = self.day_completed if self.day == today else 0
+        streak = self.streak if self.last_goal_day >= today - 1 else 0
+        return {
+            "today_completed": today_completed,
+            "daily_goal": self.daily_goal,
+            "streak": streak,
+            "longest_streak": self.longest_streak,
+            "goal_met": self.last_goal_day == today
+        }
+
+    # ===== 저장 / 복원 =====
+
+    def export_state(self):
+        return {
+            "v": STATE_VERSION,
+            "goal": self.daily_goal,
+            "day": [self.day, self.day_completed, self.day_seconds],
+            "streak": [self.streak, self.longest_streak, self.last_goal_day, self.goal_days],
+            "totals": [self.sessions, self.completed, self.seconds],
+            "next": self.next_index,
+            "unlocked": self.unlocked,
+            "journal_sessions": self.journal_sessions
+        }
+
+    @classmethod
+    def from_state(cls, state, daily_goal=DEFAULT_DAILY_GOAL):
+        """저장된 상태 복원 - 형식/하루 목표가 다르면 None (기록에서 다시 계산)"""
+        if not state or state.get("v") != STATE_VERSION or state.get("goal") != max(1, int(daily_goal)):
+            return None
+        try:
+            tracker = cls(daily_goal)
+            tracker.day, tracker.day_completed, tracker.day_seconds = state["day"]
+            tracker.streak, tracker.longest_streak, tracker.last_goal_day, tracker.goal_days = state["streak"]
+            tracker.sessions, tracker.completed, tracker.seconds = state["totals"]
+            tracker.next_index.update(state["next"])
+            tracker.unlocked = list(state["unlocked"])
+            tracker.journal_sessions = int(state.get("journal_sessions", 0))
+            return tracker
+        except (KeyError, TypeError, ValueError) as e:
+            log.warning("업적 상태 복원 실패: %s", e)
+            return None
+
+    @classmethod
+    def rebuild(cls, records, daily_goal=DEFAULT_DAILY_GOAL):
+        """휴식 기록 (dict: s, d, m, e, 시간 순)으로 처음부터 계산 - 상태 파일이 없거나 맞지 않을 때 한 번"""
+        tracker = cls(daily_goal)
+        for record in records:
+            tracker.record(record.get("s", 0), record.get("d", 0), record.get("m", 0), record.get("e", 0))
+        tracker.unannounced = []  # 지난 업적은 다시 알리지 않음
+        return tracker
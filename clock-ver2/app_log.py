@@ -0,0 +1,111 @@
+"""
+ClockApp Ver2 - 로그
+Tk 스레드에서는 로그 기록을 큐에 넣기만 하고, 백그라운드 스레드가 모아서 파일/콘솔에 씀 (표준 logging)
+
+- 레벨: DEBUG는 설정 "debug_logging": true일 때만 - 꺼져 있으면 logger.debug()는 레벨 확인 후 바로 반환
+  (메시지는 log.debug("... %s", 값) 형태로 넘겨서 꺼져 있을 때 문자열도 만들지 않음)
+- 파일: 데이터 폴더의 clockapp.log, 1MB마다 순환 (clockapp.log.1 ~ .3)
+- 큐가 가득 차면 (디스크가 매우 느린 경우) 기록을 버리고 개수만 셈 - Tk 스레드는 기다리지 않음
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+
+LOG_FILE_NAME = "clockapp.log"
+MAX_BYTES = 1024 * 1024   # 순환 기준 크기
+BACKUP_COUNT = 3          # 보관할 이전 로그 파일 수
+QUEUE_SIZE = 10000        # 쓰기 전에 쌓아 둘 수 있는 기록 수
+LOG_FORMAT = "[%(asctime)s.%(msecs)03d] %(levelname)-7s %(name)s: %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+logger = logging.getLogger("clockapp")
+logger.propagate = False
+logger.setLevel(logging.INFO)
+# setup() 전(모듈 import, 테스트)에는 콘솔에 바로 출력
+_fallback_handler = logging.StreamHandler()
+_fallback_handler.setFormatter(logging.Formatter("%(message)s"))
+logger.addHandler(_fallback_handler)
+
+_listener = None
+stats = {"dropped": 0}
+
+
+class _NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """큐가 가득 차면 기다리지 않고 버림"""
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            stats["dropped"] += 1
+
+
+def get_logger(name=None):
+    """앱 로거 ("clockapp" 또는 "clockapp.<name>")"""
+    return logger.getChild(name) if name else logger
+
+
+def setup(folder, debug=False, console=None, max_bytes=MAX_BYTES, backup_count=BACKUP_COUNT):
+    """파일 로그 시작 (여러 번 호출해도 한 번만) - 로그 파일 경로 반환
+
+    console: 콘솔에도 출력할지 (None이면 콘솔이 있는 개발 환경에서만)
+    """
+    global _listener
+    path = os.path.join(folder, LOG_FILE_NAME)
+    if _listener is not None:
+        set_debug(debug)
+        return path
+
+    formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
+    handlers = []
+    try:
+        os.makedirs(folder, exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True)
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+    except OSError as e:
+        print(f"로그 파일을 열 수 없음, 콘솔에만 출력: {e}")
+    if console is None:
+        console = sys.stderr is not None and not getattr(sys, 'frozen', False)
+    if console:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter("%(message)s"))
+        handlers.append(console_handler)
+
+    log_queue = queue.Queue(QUEUE_SIZE)
+    _listener = logging.handlers.QueueListener(log_queue, *handlers)
+    _listener.start()
+    logger.removeHandler(_fallback_handler)
+    logger.addHandler(_NonBlockingQueueHandler(log_queue))
+    set_debug(debug)
+    atexit.register(shutdown)
+    return path
+
+
+def set_debug(enabled):
+    """DEBUG 기록 켜기/끄기 (설정 변경 시 바로 반영)"""
+    logger.setLevel(logging.DEBUG if enabled else logging.INFO)
+
+
+def debug_enabled():
+    return logger.isEnabledFor(logging.DEBUG)
+
+
+def shutdown():
+    """큐에 남은 기록을 모두 쓰고 백그라운드 스레드 종료"""
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()
+    for handler in list(logger.handlers):
+        if isinstance(handler, _NonBlockingQueueHandler):
+            logger.removeHandler(handler)
+    for handler in listener.handlers:
+        handler.close()
+    logger.addHandler(_fallback_handler)
@@ -0,0 +1,400 @@
+"""
+ClockApp Ver2 - 휴식/식사 스케줄링 엔진
+Tk, 레지스트리, 트레이와 무관한 순수 로직 (시간 소스 주입 가능)
+"""
+
+import logging
+import time
+import json
+import heapq
+from datetime import datetime, timedelta
+
+from interval_index import build_daily_index, parse_hhmm
+from calendar_import import IcsCalendar, DEFAULT_WINDOW_DAYS
+
+log = logging.getLogger("clockapp.break_scheduler")
+
+MEAL_DURATION_MINUTES = 60  # 식사시간 (휴식 알림 억제) 길이
+DEFAULT_REST_SECONDS = 30    # 휴식 팝업 기본 길이 (초)
+STATE_VERSION = 1            # 저장 상태 형식 버전
+
+
+class SystemClock:
+    """실제 시스템 시계"""
+
+    def time(self):
+        return time.time()
+
+    def now(self):
+        return datetime.now()
+
+
+class VirtualClock:
+    """시뮬레이션/테스트용 가상 시계"""
+
+    def __init__(self, start=None):
+        if isinstance(start, datetime):
+            start = start.timestamp()
+        self._time = time.time() if start is None else float(start)
+
+    def time(self):
+        return self._time
+
+    def now(self):
+        return datetime.fromtimestamp(self._time)
+
+    def advance(self, seconds):
+        """주어진 초만큼 시간 진행"""
+        self._time += seconds
+
+    def set(self, timestamp):
+        """특정 시각으로 이동 (과거로는 이동하지 않음)"""
+        self._time = max(self._time, float(timestamp))
+
+
+class BreakScheduler:
+    """휴식/식사 데드라인 엔진
+
+    여러 휴식 타이머(눈 휴식, 스트레칭, 걷기 등)와 식사 알림을 우선순위 큐(힙)로 관리하며,
+    설정이 바뀔 때만 재계산한다. poll()은 도래한 이벤트만 처리하고 발생한 알림 목록을 반환한다.
+    """
+
+    def __init__(self, settings, clock=None):
+        self.clock = clock or SystemClock()
+        self.timers = {}  # 타이머 이름 -> 프로필 (interval, rest_seconds, last)
+        self.meal_shown = {"lunch": None, "dinner": None}  # 식사 알림을 표시한 날짜
+        self._break_queue = []  # (시각, 타이머 이름) 힙
+        self._meal_queue = []   # (시각, "lunch"/"dinner") 힙
+        self.calendar = None    # 회의 일정 (.ics) 억제 구간
+        self._load_settings(settings)
+        self.rebuild()
+
+    def _load_settings(self, settings):
+        """설정값 반영"""
+        self._config_key = self._make_config_key(settings)
+        self.time_interval = settings.get("time_interval", 20)
+        self.lunch_time = (settings.get("lunch_hour", 12), settings.get("lunch_minute", 10))
+        self.dinner_time = (settings.get("dinner_hour", 18), settings.get("dinner_minute", 0))
+        self.break_enabled = settings.get("break_enabled", True)
+        self.lunch_enabled = settings.get("lunch_enabled", True)
+        self.dinner_enabled = settings.get("dinner_enabled", True)
+        self.suppression_windows = settings.get("suppression_windows", [])
+        self._build_suppression_index()
+        self._load_calendar(settings)
+        self._load_timers(settings)
+
+    def _load_timers(self, settings):
+        """휴식 타이머 프로필 구성
+
+        break_timers 설정 형식 (없으면 time_interval 하나짜리 기본 타이머):
+            [{"name": "눈 휴식", "interval": 20, "rest_seconds": 20, "enabled": true}, ...]
+        """
+        profiles = settings.get("break_timers") or [
+            {"name": "휴식", "interval": self.time_interval, "rest_seconds": DEFAULT_REST_SECONDS}
+        ]
+        now = self.clock.time()
+        timers = {}
+        for profile in profiles:
+            try:
+                if not profile.get("enabled", True):
+                    continue
+                name = profile.get("name", "휴식")
+                timers[name] = {
+                    "name": name,
+                    "interval": float(profile["interval"]),
+                    "rest_seconds": int(profile.get("rest_seconds", DEFAULT_REST_SECONDS)),
+                    "last": self.timers.get(name, {}).get("last", now)  # 마지막 알림 시간
+                }
+            except Exception as e:
+                log.error("휴식 타이머 설정 오류 (%s): %s", profile, e)
+        self.timers = timers
+
+    def _build_suppression_index(self):
+        """휴식 알림 억제 구간 인덱스 생성 (식사시간 + 사용자 정의 구간)
+
+        suppression_windows 설정 형식:
+            [{"name": "스탠드업", "start": "09:30", "duration": 15, "enabled": true}, ...]
+        """
+        windows = []
+        if self.lunch_enabled:
+            windows.append((self.lunch_time[0] * 60 + self.lunch_time[1], MEAL_DURATION_MINUTES, ("meal", "점심")))
+        if self.dinner_enabled:
+            windows.append((self.dinner_time[0] * 60 + self.dinner_time[1], MEAL_DURATION_MINUTES, ("meal", "저녁")))
+
+        for window in self.suppression_windows:
+            try:
+                if not window.get("enabled", True):
+                    continue
+                name = window.get("name", "집중 시간")
+                windows.append((parse_hhmm(window["start"]), int(window.get("duration", 60)), ("custom", name)))
+            except Exception as e:
+                log.error("휴식 억제 구간 설정 오류 (%s): %s", window, e)
+
+        self.suppression_index = build_daily_index(windows)
+
+    def _load_calendar(self, settings):
+        """회의 캘린더 (.ics) 설정 - 경로가 같으면 기존 캐시를 그대로 사용
+
+        calendar_ics_path: 로컬 .ics 파일 경로, calendar_window_days: 미리 펼쳐둘 기간 (일)
+        """
+        path = settings.get("calendar_ics_path")
+        if not path:
+            self.calendar = None
+            return
+        window_days = settings.get("calendar_window_days", DEFAULT_WINDOW_DAYS)
+        if (self.calendar is None or self.calendar.path != path
+                or self.calendar.window_seconds != window_days * 86400):
+            self.calendar = IcsCalendar(path, window_days=window_days, clock=self.clock)
+
+    @staticmethod
+    def _make_config_key(settings):
+        """데드라인 계산에 영향을 주는 설정의 지문 - 같으면 저장된 힙을 그대로 재사용"""
+        keys = ("time_interval", "lunch_hour", "lunch_minute", "dinner_hour", "dinner_minute",
+                "break_enabled", "lunch_enabled", "dinner_enabled", "suppression_windows", "break_timers",
+                "calendar_ics_path")
+        return json.dumps([settings.get(key) for key in keys], ensure_ascii=False, sort_keys=True)
+
+    def update_settings(self, settings):
+        """설정 변경 - 휴식 타이머를 리셋하고 데드라인 재계산"""
+        self._load_settings(settings)
+        self.reset_break_timers()
+
+    def reset_break_timers(self):
+        """모든 휴식 타이머를 지금부터 다시 시작"""
+        now = self.clock.time()
+        for timer in self.timers.values():
+            timer["last"] = now
+        self.rebuild()
+
+    def rebuild(self):
+        """데드라인 힙 재구성"""
+        self._break_queue = []
+        self._meal_queue = []
+        for name in self.timers:
+            self._push_break_deadline(name)
+        self._push_meal_deadline("lunch")
+        self._push_meal_deadline("dinner")
+
+    def next_deadline(self):
+        """가장 가까운 데드라인 시각 (없으면 None)"""
+        candidates = [queue[0][0] for queue in (self._break_queue, self._meal_queue) if queue]
+        return min(candidates) if candidates else None
+
+    def next_break(self):
+        """가장 가까운 휴식 타이머 (시각, 프로필) - 없으면 None"""
+        if not self._break_queue:
+            return None
+        due, name = self._break_queue[0]
+        return due, self.timers[name]
+
+    def poll(self):
+        """도래한 이벤트 처리 - 발생한 알림 목록 반환 ("break", 프로필) / ("meal", "lunch")
+
+        같은 순간에 여러 휴식 타이머가 도래하면 가장 긴 휴식 하나로 합친다
+        (모든 타이머는 리셋됨).
+        """
+        fired = []
+        current_time = self.clock.time()
+
+        due_break = None
+        while self._break_queue and self._break_queue[0][0] <= current_time:
+            _, name = heapq.heappop(self._break_queue)
+            if self.check_break_time(name):
+                timer = self.timers[name]
+                if due_break is None or timer["rest_seconds"] > due_break["rest_seconds"]:
+                    due_break = timer
+            self._push_break_deadline(name)
+        if due_break is not None:
+            fired.append(("break", due_break))
+
+        while self._meal_queue and self._meal_queue[0][0] <= current_time:
+            due, meal = heapq.heappop(self._meal_queue)
+            if self.check_meal_time(meal):
+                fired.append(("meal", meal))
+            self._push_meal_deadline(meal, not_before=due)
+        return fired
+
+    def _push_break_deadline(self, name):
+        """해당 휴식 타이머의 다음 데드라인 등록"""
+        if not self.break_enabled:
+            return
+        timer = self.timers[name]
+        current_time = self.clock.time()
+        due = timer["last"] + timer["interval"] * 60
+        if due <= current_time:
+            # 억제 구간이라 건너뛴 경우 - 구간이 끝나는 시각에 다시 확인
+            due = self.suppression_end_time() or current_time + 1
+        heapq.heappush(self._break_queue, (due, name))
+
+    def _push_meal_deadline(self, meal, not_before=None):
+        """다음 식사 알림 데드라인 등록 (오늘 지났으면 내일)"""
+        if not self._meal_enabled(meal):
+            return
+        hour, minute = self._meal_time(meal)
+        now = self.clock.now()
+        start = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        # 식사 알림은 해당 분 안에서만 표시되므로 그 분이 지났거나 이미 처리했으면 다음 날
+        if now >= start + timedelta(minutes=1) or (not_before is not None and start.timestamp() <= not_before):
+            start += timedelta(days=1)
+        heapq.heappush(self._meal_queue, (start.timestamp(), meal))
+
+    def _meal_enabled(self, meal):
+        return self.lunch_enabled if meal == "lunch" else self.dinner_enabled
+
+    def _meal_time(self, meal):
+        return self.lunch_time if meal == "lunch" else self.dinner_time
+
+    def active_suppressions(self, now=None):
+        """현재 휴식 알림을 억제하는 구간 라벨 튜플 ((종류, 이름), ...) - 없으면 빈 튜플
+
+        종류: "meal" (식사), "custom" (사용자 정의 구간), "calendar" (회의 일정)
+        """
+        now = now or self.clock.now()
+        labels = self.suppression_index.find(now.hour * 60 + now.minute)
+        if self.calendar is not None:
+            labels += self.calendar.find(now.timestamp())
+        return labels
+
+    def is_break_suppressed(self, now=None):
+        """식사시간이나 사용자 정의 구간 때문에 휴식 알림이 억제되는지 확인"""
+        return bool(self.active_suppressions(now))
+
+    def is_meal_time(self, now=None):
+        """현재 식사시간인지 확인 (식사 알림이 활성화된 경우에만)"""
+        return any(kind == "meal" for kind, _ in self.active_suppressions(now))
+
+    def suppression_end_time(self):
+        """현재 억제 구간이면 (이어지는 구간까지 포함해) 끝나는 시각(epoch) 반환, 아니면 None
+
+        하루 단위 구간과 회의 일정이 이어지면 (예: 점심 직후 회의) 마지막 구간의 끝까지 따라간다.
+        """
+        point = self.clock.time()
+        end = None
+        for _ in range(100):
+            moved = False
+            now = datetime.fromtimestamp(point)
+            end_minutes = self.suppression_index.run_end(now.hour * 60 + now.minute)
+            if end_minutes is not None:
+                midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+                point = (midnight + timedelta(minutes=end_minutes)).timestamp()
+                moved = True
+            calendar_end = self.calendar.run_end(point) if self.calendar is not None else None
+            if calendar_end is not None:
+                point = calendar_end
+                moved = True
+            if not moved:
+                break
+            end = point
+        return end
+
+    def check_break_time(self, name):
+        """휴식 시간 체크 - 해당 타이머의 휴식 알림을 띄워야 하면 True"""
+        if not self.break_enabled:
+            return False
+
+        # 식사시간/억제 구간 중이면 휴식 팝업 건너뛰기
+        if self.is_break_suppressed():
+            return False
+
+        timer = self.timers[name]
+        current_time = self.clock.time()
+        elapsed_minutes = (current_time - timer["last"]) / 60
+
+        # 설정된 시간 간격이 지났으면 휴식 알림
+        if elapsed_minutes >= timer["interval"]:
+            timer["last"] = current_time
+            return True
+        return False
+
+    def check_meal_time(self, meal):
+        """식사 시간 체크 (정확한 시간에만, 하루 한 번) - 식사 알림을 띄워야 하면 True"""
+        if not self._meal_enabled(meal):
+            return False
+
+        now = self.clock.now()
+        current_date = now.strftime("%Y-%m-%d")
+        hour, minute = self._meal_time(meal)
+
+        if now.hour == hour and now.minute == minute and self.meal_shown.get(meal) != current_date:
+            self.meal_shown[meal] = current_date
+            return True
+        return False
+
+    def export_state(self):
+        """재시작 후 이어서 동작하기 위한 상태 (JSON 직렬화 가능한 작은 dict)
+
+        t: 타이머별 마지막 알림 시각, b/m: 데드라인 힙, f: 식사 알림을 표시한 날짜
+        """
+        return {
+            "v": STATE_VERSION,
+            "saved": round(self.clock.time(), 3),
+            "key": self._config_key,
+            "t": {name: round(timer["last"], 3) for name, timer in self.timers.items()},
+            "b": [[round(due, 3), name] for due, name in self._break_queue],
+            "m": [[due, meal] for due, meal in self._meal_queue],
+            "f": dict(self.meal_shown)
+        }
+
+    def restore_state(self, state):
+        """export_state()로 저장한 상태 복원 - 복원했으면 True
+
+        오늘 저장된 상태만 휴식 타이머를 이어가고 (어제 상태면 지금부터 새로 시작),
+        식사 알림 표시 여부는 날짜 기준이라 그대로 복원한다.
+        설정이 저장 당시와 같으면 데드라인 힙을 재계산 없이 그대로 사용한다.
+        """
+        try:
+            if not state or state.get("v") != STATE_VERSION:
+                return False
+
+            for meal in self.meal_shown:
+                self.meal_shown[meal] = state.get("f", {}).get(meal)
+
+            now = self.clock.now()
+            saved = datetime.fromtimestamp(state["saved"])
+            if saved.date() != now.date() or saved > now:
+                self.rebuild()
+                return True
+
+            for name, last in state.get("t", {}).items():
+                if name in self.timers:
+                    self.timers[name]["last"] = float(last)
+
+            if state.get("key") == self._config_key and set(state.get("t", {})) == set(self.timers):
+                self._break_queue = [(float(due), name) for due, name in state.get("b", [])]
+                self._meal_queue = [(float(due), meal) for due, meal in state.get("m", [])]
+                heapq.heapify(self._break_queue)
+                heapq.heapify(self._meal_queue)
+            else:
+                self.rebuild()
+            return True
+        except Exception as e:
+            log.warning("스케줄러 상태 복원 실패: %s", e)
+            self.rebuild()
+            return False
+
+    def remaining_break_seconds(self):
+        """가장 가까운 휴식까지 남은 시간 (초) - 휴식 타이머가 없으면 None"""
+        next_break = self.next_break()
+        if next_break is None:
+            return None
+        return max(0.0, next_break[0] - self.clock.time())
+
+
+# 사용 예시 (가상 시계로 하루 시뮬레이션)
+if __name__ == "__main__":
+    clock = VirtualClock(datetime(2025, 1, 6, 9, 0))
+    scheduler = BreakScheduler({
+        "dinner_enabled": True,
+        "break_timers": [
+            {"name": "눈 휴식", "interval": 20, "rest_seconds": 20},
+            {"name": "스트레칭", "interval": 45, "rest_seconds": 30},
+            {"name": "걷기", "interval": 60, "rest_seconds": 60}
+        ]
+    }, clock=clock)
+    end = clock.time() + 24 * 3600
+
+    while scheduler.next_deadline() is not None and scheduler.next_deadline() <= end:
+        clock.set(scheduler.next_deadline())
+        for kind, detail in scheduler.poll():
+            label = detail["name"] if kind == "break" else detail
+            print(f"{clock.now().strftime('%H:%M')} {kind} {label}")
@@ -0,0 +1,415 @@
+"""
+ClockApp Ver2 - 캘린더(.ics) 가져오기
+로컬 .ics 파일의 회의 일정을 휴식 알림 억제 구간으로 사용
+
+- 반복 일정(RRULE)은 일정별 생성기로 필요한 만큼만 펼치고 결과를 캐시 (롤링 윈도우)
+- 펼친 일정은 IntervalIndex(epoch 초 단위)로 만들어 O(log n) 조회
+- 파일 수정 시각(mtime)이 바뀔 때만 다시 파싱
+"""
+
+import logging
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+from interval_index import IntervalIndex
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # Python 3.8 이하
+    ZoneInfo = None
+
+log = logging.getLogger("clockapp.calendar_import")
+
+DEFAULT_WINDOW_DAYS = 14      # 미리 펼쳐둘 기간 (일)
+REFRESH_CHECK_SECONDS = 60    # 파일 변경 확인 주기 (초)
+MAX_EMPTY_PERIODS = 1000      # 회차가 하나도 없는 주기가 이만큼 이어지면 전개 중단
+WEEKDAYS = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
+
+
+def unfold_lines(text):
+    """RFC 5545 줄 접기 해제 (공백/탭으로 시작하는 줄은 앞 줄에 이어붙임)"""
+    lines = []
+    for raw in text.splitlines():
+        if raw[:1] in (" ", "\t") and lines:
+            lines[-1] += raw[1:]
+        elif raw:
+            lines.append(raw)
+    return lines
+
+
+def parse_property(line):
+    """"NAME;PARAM=VALUE:값" 한 줄을 (이름, 파라미터 dict, 값)으로 분리"""
+    head, _, value = line.partition(":")
+    parts = head.split(";")
+    params = {}
+    for part in parts[1:]:
+        key, _, param_value = part.partition("=")
+        params[key.upper()] = param_value.strip('"')
+    return parts[0].upper(), params, value
+
+
+def _get_tz(params):
+    """TZID 파라미터의 시간대 (알 수 없으면 None = 로컬 시간)"""
+    tzid = params.get("TZID")
+    if tzid and ZoneInfo is not None:
+        try:
+            return ZoneInfo(tzid)
+        except Exception:
+            pass
+    return None
+
+
+def parse_datetime(value, params):
+    """DTSTART/DTEND 값 파싱 - (datetime, 종일 일정 여부)
+
+    UTC(Z)는 로컬 시간으로 변환하고, TZID가 있으면 aware datetime을 반환한다.
+    """
+    value = value.strip()
+    if params.get("VALUE") == "DATE" or len(value) == 8:
+        return datetime.strptime(value[:8], "%Y%m%d"), True
+    if value.endswith("Z"):
+        dt = datetime.strptime(value[:15], "%Y%m%dT%H%M%S").replace(tzinfo=timezone.utc)
+        return dt.astimezone().replace(tzinfo=None), False
+    dt = datetime.strptime(value[:15], "%Y%m%dT%H%M%S")
+    tz = _get_tz(params)
+    return (dt.replace(tzinfo=tz) if tz else dt), False
+
+
+def parse_duration(value):
+    """DURATION 값 (예: PT30M, P1DT2H) 파싱"""
+    value = value.strip()
+    sign = -1 if value.startswith("-") else 1
+    value = value.lstrip("+-").lstrip("P")
+    total = timedelta()
+    number = ""
+    in_time = False
+    units_date = {"W": timedelta(weeks=1), "D": timedelta(days=1)}
+    units_time = {"H": timedelta(hours=1), "M": timedelta(minutes=1), "S": timedelta(seconds=1)}
+    for char in value:
+        if char == "T":
+            in_time = True
+        elif char.isdigit():
+            number += char
+        else:
+            unit = (units_time if in_time else units_date).get(char)
+            if unit is not None and number:
+                total += unit * int(number)
+            number = ""
+    return total * sign
+
+
+def parse_rrule(value):
+    """RRULE 값을 dict로 (FREQ, INTERVAL, COUNT, UNTIL, BYDAY, BYMONTHDAY)"""
+    rule = {}
+    for part in value.split(";"):
+        key, _, item = part.partition("=")
+        rule[key.upper()] = item
+    return rule
+
+
+def _to_epoch(dt):
+    return dt.timestamp()
+
+
+def _same_wall_time(day, start):
+    """day 날짜에 start와 같은 시각 (시간대 정보 유지)"""
+    return start.replace(year=day.year, month=day.month, day=day.day)
+
+
+def _nth_weekday(year, month, weekday, nth):
+    """해당 월의 n번째 요일 날짜 (nth < 0이면 뒤에서부터) - 없으면 None"""
+    first = datetime(year, month, 1)
+    if nth > 0:
+        day = 1 + (weekday - first.weekday()) % 7 + (nth - 1) * 7
+    else:
+        next_month = datetime(year + month // 12, month % 12 + 1, 1)
+        last = next_month - timedelta(days=1)
+        day = last.day - (last.weekday() - weekday) % 7 + (nth + 1) * 7
+    try:
+        return datetime(year, month, day)
+    except ValueError:
+        return None
+
+
+def _parse_byday(text):
+    """BYDAY 값 (예: "MO,WE" / "2TU,-1FR")을 [(요일, 순번 또는 0), ...]로"""
+    result = []
+    for item in filter(None, text.split(",")):
+        code = item[-2:].upper()
+        if code in WEEKDAYS:
+            nth = item[:-2]
+            result.append((WEEKDAYS[code], int(nth) if nth not in ("", "+", "-") else 0))
+    return result
+
+
+class CalendarEvent:
+    """.ics의 VEVENT 하나 (반복 규칙 포함)"""
+
+    def __init__(self, uid, summary, start, end, rrule=None, exdates=(), recurrence_id=None):
+        self.uid = uid
+        self.summary = summary
+        self.start = start
+        self.duration = end - start
+        self.rrule = rrule
+        self.exdates = set(exdates)  # 제외할 시작 시각 (epoch)
+        self.recurrence_id = recurrence_id
+
+    def occurrences(self, not_before=None):
+        """(시작 epoch, 끝 epoch) 생성기 - 시작 시각 순서, not_before 이전에 끝나는 건 빠르게 건너뜀"""
+        duration = self.duration.total_seconds()
+        for start in self._candidate_starts(not_before):
+            start_epoch = _to_epoch(start)
+            if start_epoch in self.exdates:
+                continue
+            if not_before is not None and start_epoch + duration <= not_before:
+                continue
+            yield start_epoch, start_epoch + duration
+
+    def _candidate_starts(self, not_before):
+        """반복 규칙에 따른 시작 시각 (EXDATE 적용 전)"""
+        if not self.rrule:
+            yield self.start
+            return
+
+        rule = self.rrule
+        freq = rule.get("FREQ", "DAILY").upper()
+        interval = max(1, int(rule.get("INTERVAL", 1) or 1))
+        count = int(rule["COUNT"]) if rule.get("COUNT") else None
+        until = None
+        if rule.get("UNTIL"):
+            until_dt, _ = parse_datetime(rule["UNTIL"], {})
+            until = _to_epoch(until_dt)
+        byday = _parse_byday(rule.get("BYDAY", ""))
+        bymonthday = [int(day) for day in rule.get("BYMONTHDAY", "").split(",") if day.strip()]
+
+        # COUNT가 없으면 오래된 반복 일정도 not_before 근처까지 주기 단위로 건너뜀
+        skip_periods = 0
+        if count is None and not_before is not None and freq in ("DAILY", "WEEKLY"):
+            period_days = interval * (7 if freq == "WEEKLY" else 1)
+            lag = not_before - _to_epoch(self.start) - self.duration.total_seconds()
+            if lag > 0:
+                skip_periods = max(0, int(lag // (period_days * 86400)) - 1)
+
+        produced = 0
+        for start in self._expand(freq, interval, byday, bymonthday, skip_periods):
+            if start < self.start:
+                continue
+            if until is not None and _to_epoch(start) > until:
+                return
+            if count is not None and produced >= count:
+                return
+            produced += 1
+            yield start
+
+    def _expand(self, freq, interval, byday, bymonthday, skip_periods):
+        """주기별 후보 시작 시각 (무한 생성기, 시작 시각 오름차순)"""
+        start = self.start
+        weekdays = sorted(day for day, _ in byday)
+        if freq == "DAILY":
+            period = skip_periods
+            misses = 0
+            while misses <= MAX_EMPTY_PERIODS:
+                day = start + timedelta(days=period * interval)
+                if not weekdays or day.weekday() in weekdays:
+                    misses = 0
+                    yield day
+                else:
+                    misses += 1  # 예: INTERVAL=7인데 BYDAY가 다른 요일이면 회차 없음
+                period += 1
+        elif freq == "WEEKLY":
+            week_start = (start - timedelta(days=start.weekday())).date()
+            period = skip_periods
+            while True:
+                monday = week_start + timedelta(weeks=period * interval)
+                for weekday in (weekdays or [start.weekday()]):
+                    yield _same_wall_time(monday + timedelta(days=weekday), start)
+                period += 1
+        elif freq == "MONTHLY":
+            period = 0
+            while True:
+                month_index = start.month - 1 + period * interval
+                year, month = start.year + month_index // 12, month_index % 12 + 1
+                days = []
+                if byday:
+                    for weekday, nth in byday:
+                        if nth:
+                            found = _nth_weekday(year, month, weekday, nth)
+                            if found:
+                                days.append(found)
+                        else:
+                            day = _nth_weekday(year, month, weekday, 1)
+                            while day and day.month == month:
+                                days.append(day)
+                                day += timedelta(days=7)
+                else:
+                    last_day = (datetime(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)).day
+                    for monthday in (bymonthday or [start.day]):
+                        if monthday < 0:
+                            monthday += last_day + 1  # -1 = 그 달의 마지막 날
+                        if 1 <= monthday <= last_day:
+                            days.append(datetime(year, month, monthday))
+                for day in sorted(days):
+                    yield _same_wall_time(day, start)
+                period += 1
+                if period > MAX_EMPTY_PERIODS and not days:
+                    return  # 잘못된 규칙 (예: BYMONTHDAY=32) - 무한 루프 방지
+        elif freq == "YEARLY":
+            period = 0
+            while True:
+                try:
+                    yield start.replace(year=start.year + period * interval)
+                except ValueError:
+                    pass  # 2월 29일
+                period += 1
+
+
+def parse_ics(text):
+    """ics 텍스트에서 시간이 정해진 VEVENT 목록 추출
+
+    종일 일정, 취소된 일정, 한가함(TRANSP:TRANSPARENT)으로 표시된 일정은 제외하고,
+    RECURRENCE-ID로 수정된 회차는 원래 회차를 대신한다.
+    """
+    events = []
+    current = None
+    for line in unfold_lines(text):
+        name, params, value = parse_property(line)
+        if name == "BEGIN" and value.upper() == "VEVENT":
+            current = {"exdates": []}
+        elif name == "END" and value.upper() == "VEVENT":
+            if current is not None:
+                events.append(current)
+            current = None
+        elif current is not None:
+            if name in ("DTSTART", "DTEND", "RECURRENCE-ID"):
+                current[name] = parse_datetime(value, params)
+            elif name == "EXDATE":
+                for item in value.split(","):
+                    current["exdates"].append(parse_datetime(item, params)[0])
+            elif name in ("DURATION", "RRULE", "SUMMARY", "UID", "STATUS", "TRANSP"):
+                current[name] = value
+
+    result = []
+    overridden = {}  # UID -> 수정된 회차의 원래 시작 시각들
+    for item in events:
+        try:
+            if "DTSTART" not in item:
+                continue
+            start, all_day = item["DTSTART"]
+            if all_day:
+                continue
+            if item.get("STATUS", "").upper() == "CANCELLED" or item.get("TRANSP", "").upper() == "TRANSPARENT":
+                if "RECURRENCE-ID" in item:
+                    overridden.setdefault(item.get("UID"), []).append(_to_epoch(item["RECURRENCE-ID"][0]))
+                continue
+            if "DTEND" in item:
+                end = item["DTEND"][0]
+            else:
+                end = start + parse_duration(item.get("DURATION", "PT0M"))
+            recurrence_id = _to_epoch(item["RECURRENCE-ID"][0]) if "RECURRENCE-ID" in item else None
+            if recurrence_id is not None:
+                overridden.setdefault(item.get("UID"), []).append(recurrence_id)
+            rrule = parse_rrule(item["RRULE"]) if "RRULE" in item and recurrence_id is None else None
+            summary = item.get("SUMMARY", "회의").replace("\\,", ",").replace("\\;", ";") or "회의"
+            result.append(CalendarEvent(item.get("UID"), summary, start, end, rrule,
+                                        [_to_epoch(dt) for dt in item["exdates"]], recurrence_id))
+        except Exception as e:
+            log.error("캘린더 일정 파싱 오류 (%s): %s", item.get('SUMMARY', '?'), e)
+
+    for event in result:
+        if event.rrule and event.uid in overridden:
+            event.exdates.update(overridden[event.uid])
+    return result
+
+
+class IcsCalendar:
+    """로컬 .ics 파일 기반 휴식 억제 구간 (롤링 윈도우 + 증분 전개)
+
+    find(epoch)/run_end(epoch)는 IntervalIndex 조회만 하므로 매 틱 호출해도 부담이 없다.
+    윈도우의 절반이 지나면 각 일정의 생성기를 이어서 필요한 만큼만 더 펼친다.
+    """
+
+    def __init__(self, path, window_days=DEFAULT_WINDOW_DAYS, clock=time):
+        self.path = path
+        self.window_seconds = window_days * 86400
+        self.clock = clock
+        self._mtime = None
+        self._last_check = None
+        self._events = []
+        self._cursors = []      # 일정별 [생성기, 다음 회차 또는 None]
+        self._intervals = []    # 펼친 (시작, 끝, 라벨)
+        self._horizon = None    # 여기까지 펼쳤음 (epoch)
+        self.index = IntervalIndex()
+        self.stats = {"parses": 0, "extends": 0, "occurrences": 0}
+
+    def refresh(self, force=False):
+        """파일이 바뀌었으면 다시 파싱하고, 윈도우가 부족하면 더 펼침"""
+        now = self.clock.time()
+        if force or self._last_check is None or now - self._last_check >= REFRESH_CHECK_SECONDS:
+            self._last_check = now
+            try:
+                mtime = os.path.getmtime(self.path)
+            except OSError:
+                mtime = None
+            if mtime != self._mtime:
+                self._mtime = mtime
+                self._load()
+        if self._horizon is None or now + self.window_seconds / 2 > self._horizon:
+            self._extend(now)
+
+    def _load(self):
+        """ics 파일 파싱 (mtime이 바뀐 경우에만 호출)"""
+        self._events = []
+        if self._mtime is not None:
+            try:
+                with open(self.path, 'r', encoding='utf-8', errors='replace') as f:
+                    self._events = parse_ics(f.read())
+                self.stats["parses"] += 1
+                log.info("캘린더 로드: %s개 일정 (%s)", len(self._events), self.path)
+            except Exception as e:
+                log.warning("캘린더 로드 실패: %s", e)
+        self._cursors = None
+        self._intervals = []
+        self._horizon = None
+
+    def _extend(self, now):
+        """롤링 윈도우를 now + window까지 넓힘 - 각 일정은 멈춘 곳부터 이어서 전개"""
+        window_start = now - 86400
+        horizon = now + self.window_seconds
+        if self._cursors is None:
+            self._cursors = [[event.occurrences(not_before=window_start), None] for event in self._events]
+
+        # 지난 회차는 버림
+        intervals = [item for item in self._intervals if item[1] > window_start]
+        for event, cursor in zip(self._events, self._cursors):
+            label = ("calendar", event.summary)
+            while True:
+                if cursor[1] is None:
+                    cursor[1] = next(cursor[0], False)
+                if cursor[1] is False or cursor[1][0] >= horizon:
+                    break
+                start, end = cursor[1]
+                if end > window_start:
+                    intervals.append((start, end, label))
+                    self.stats["occurrences"] += 1
+                cursor[1] = None
+
+        self._intervals = intervals
+        self._horizon = horizon
+        self.index = IntervalIndex(intervals)
+        self.stats["extends"] += 1
+
+    def find(self, epoch):
+        """epoch 시각을 덮는 회의 라벨 튜플 (("calendar", 제목), ...)"""
+        self.refresh()
+        return self.index.find(epoch)
+
+    def run_end(self, epoch):
+        """epoch를 포함하는 연속 회의 구간이 끝나는 시각 (회의 중이 아니면 None)"""
+        self.refresh()
+        return self.index.run_end(epoch)
+
+    def next_start(self, epoch):
+        """epoch 이후 첫 회의 시작 시각 (없으면 None)"""
+        self.refresh()
+        return self.index.next_start(epoch)
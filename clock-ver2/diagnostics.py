@@ -0,0 +1,135 @@
+"""
+ClockApp Ver2 - 진단 정보 수집
+"ClockApp이 느려요" 문의를 사용자 PC에서 바로 확인할 수 있도록 프로세스/Tk 상태를 모음
+(진단 창이 낮은 주기로 호출 - 여기 함수들은 한 번 호출에 수 ms 이내)
+
+- 메모리(RSS): Windows는 GetProcessMemoryInfo, 리눅스는 /proc/self/statm
+- 대기 중인 after 콜백: Tcl의 "after info" 목록을 콜백을 등록한 위젯의 창별로 묶음
+- 느린 콜백: 기준 시간보다 오래 걸린 Tk 콜백을 최근 N개만 보관
+"""
+
+import ctypes
+import logging
+import os
+import re
+import threading
+import time
+from collections import deque
+
+SLOW_CALLBACK_MS = 50   # 이보다 오래 걸린 콜백을 기록 (화면 3프레임 정도)
+SLOW_CALLBACK_KEEP = 20  # 보관할 최근 느린 콜백 수
+
+log = logging.getLogger("clockapp.diagnostics")
+
+
+if os.name == "nt":
+    from ctypes import wintypes
+
+    class _ProcessMemoryCounters(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+
+def process_rss():
+    """현재 프로세스의 실제 메모리 사용량 (바이트) - 알 수 없으면 None"""
+    try:
+        if os.name == "nt":
+            counters = _ProcessMemoryCounters()
+            counters.cb = ctypes.sizeof(counters)
+            kernel32 = ctypes.windll.kernel32
+            kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+            if ctypes.windll.psapi.GetProcessMemoryInfo(kernel32.GetCurrentProcess(), ctypes.byref(counters),
+                                                        counters.cb):
+                return counters.WorkingSetSize
+            return None
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, AttributeError, ValueError) as e:
+        log.debug("메모리 사용량 확인 실패: %s", e)
+        return None
+
+
+def format_bytes(size):
+    """사람이 읽기 쉬운 크기 (예: 42.3 MB)"""
+    if size is None:
+        return "알 수 없음"
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def thread_names():
+    """실행 중인 Python 스레드 이름"""
+    return sorted(thread.name for thread in threading.enumerate())
+
+
+# tkinter가 등록한 Tcl 명령 이름: id(함수) 숫자 + 함수 이름
+_COMMAND_ID = re.compile(r"^\d+")
+
+
+def pending_after(root):
+    """대기 중인 after 콜백을 창별로 묶음 - {창 제목: [콜백 이름, ...]}
+
+    tkinter는 after()로 넘긴 함수를 호출한 위젯의 명령으로 등록하므로,
+    위젯 트리에서 명령 이름의 주인을 찾아 그 위젯의 최상위 창으로 묶는다.
+    """
+    owners = {}
+    stack = [root]
+    while stack:
+        widget = stack.pop()
+        for name in getattr(widget, "_tclCommands", None) or ():
+            owners[name] = widget
+        stack.extend(widget.children.values())
+
+    windows = {}
+    for after_id in root.tk.splitlist(root.tk.call("after", "info")):
+        try:
+            script = root.tk.splitlist(root.tk.call("after", "info", after_id))[0]
+        except Exception:  # 그 사이에 실행/취소됨
+            continue
+        script = str(script)
+        widget = owners.get(script)
+        if widget is None:
+            window = "(기타)"
+        else:
+            try:
+                window = widget.winfo_toplevel().title() or str(widget.winfo_toplevel())
+            except Exception:
+                window = "(닫힌 창)"
+        windows.setdefault(window, []).append(_COMMAND_ID.sub("", script) or script)
+    return windows
+
+
+class SlowCallbackLog:
+    """기준보다 오래 걸린 콜백의 최근 기록 (Tk 스레드에서 기록, 진단 창에서 읽음)"""
+
+    def __init__(self, threshold_ms=SLOW_CALLBACK_MS, keep=SLOW_CALLBACK_KEEP):
+        self.threshold = threshold_ms / 1000
+        self.entries = deque(maxlen=keep)  # (시각, 콜백 이름, ms)
+        self.total = 0
+
+    def record(self, name, seconds):
+        """실행 시간 기록 - 기준을 넘은 경우만 보관"""
+        if seconds >= self.threshold:
+            self.entries.append((time.time(), name, seconds * 1000))
+            self.total += 1
+
+    def recent(self):
+        """최근 것부터"""
+        return list(reversed(self.entries))
+
+
+# 앱 전체에서 쓰는 느린 콜백 기록
+slow_callbacks = SlowCallbackLog()
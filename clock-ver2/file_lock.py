@@ -0,0 +1,137 @@
+"""
+ClockApp Ver2 - 프로세스 간 파일 잠금
+Ver1/Ver2 동시 실행이나 같은 프로필의 여러 세션이 같은 상태 파일을 쓸 때 쓰기를 순서대로 처리하기 위한
+권고(advisory) 잠금 (Windows: msvcrt, 그 외: fcntl)
+
+잠금 파일(<경로>.lock) 앞부분에는 세대 번호(generation)를 기록한다.
+쓰는 쪽은 잠금을 잡은 상태에서 번호를 올리고, 읽는 쪽은 잠금 없이 번호만 읽어
+바뀌지 않았으면 파일을 다시 읽지 않는다 (mtime 해상도가 낮은 파일 시스템에서도 변경 감지).
+"""
+
+import os
+import threading
+import time
+
+try:
+    import msvcrt
+except ImportError:  # Windows가 아니면 fcntl 사용
+    msvcrt = None
+    import fcntl
+
+DEFAULT_TIMEOUT = 10.0    # 잠금 대기 최대 시간 (초)
+GENERATION_WIDTH = 20     # 세대 번호 자릿수 (항상 같은 길이로 덮어씀)
+LOCK_OFFSET = 1024        # Windows 잠금 위치 - 세대 번호 영역과 겹치지 않아야 잠금 없이 읽을 수 있음
+
+
+class LockTimeout(TimeoutError):
+    """다른 프로세스가 잠금을 오래 잡고 있음"""
+
+
+class FileLock:
+    """<경로>.lock 파일에 대한 배타적 권고 잠금 (같은 스레드에서 다시 잡을 수 있음)"""
+
+    def __init__(self, path, timeout=DEFAULT_TIMEOUT):
+        self.lock_path = path + ".lock"
+        self.timeout = timeout
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fd = None
+        self.stats = {"acquired": 0, "waited": 0}
+
+    def acquire(self):
+        self._thread_lock.acquire()
+        if self._depth:
+            self._depth += 1
+            return self
+        try:
+            folder = os.path.dirname(self.lock_path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            # 추가 모드로 열면 세대 번호를 앞부분에 덮어쓸 수 없으므로 읽기/쓰기로 염
+            self._fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o644)
+            deadline = time.monotonic() + self.timeout
+            delay = 0.001
+            while not self._try_lock():
+                if time.monotonic() >= deadline:
+                    raise LockTimeout(f"잠금 대기 시간 초과: {self.lock_path}")
+                self.stats["waited"] += 1
+                time.sleep(delay)
+                delay = min(delay * 2, 0.05)
+        except BaseException:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+            self._thread_lock.release()
+            raise
+        self._depth = 1
+        self.stats["acquired"] += 1
+        return self
+
+    def _try_lock(self):
+        fd = self._fd
+        try:
+            if msvcrt is not None:
+                os.lseek(fd, LOCK_OFFSET, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            return False
+
+    def release(self):
+        if self._depth > 1:
+            self._depth -= 1
+            self._thread_lock.release()
+            return
+        try:
+            fd = self._fd
+            if msvcrt is not None:
+                os.lseek(fd, LOCK_OFFSET, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+            self._depth = 0
+            self._thread_lock.release()
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    # ===== 세대 번호 =====
+
+    def read_generation(self):
+        """현재 세대 번호 (잠금 없이 읽음, 잠금 파일이 없으면 0)"""
+        try:
+            with open(self.lock_path, 'rb') as f:
+                raw = f.read(GENERATION_WIDTH)
+            return int(raw) if raw.strip() else 0
+        except (OSError, ValueError):
+            return 0
+
+    def bump_generation(self):
+        """세대 번호 +1 (잠금을 잡은 상태에서만) - 새 번호 반환"""
+        if not self._depth:
+            raise RuntimeError("잠금 없이 세대 번호를 올릴 수 없음")
+        generation = self.read_generation() + 1
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        os.write(self._fd, b"%0*d" % (GENERATION_WIDTH, generation))
+        return generation
+
+
+_locks = {}
+_locks_guard = threading.Lock()
+
+
+def lock_for(path):
+    """경로별 FileLock (프로세스 안에서 하나만 만들어 재사용)"""
+    with _locks_guard:
+        lock = _locks.get(path)
+        if lock is None:
+            lock = _locks[path] = FileLock(path)
+        return lock
@@ -0,0 +1,168 @@
+"""
+ClockApp Ver2 - 휴식 기록 차트
+일별 휴식 시간(분)을 PIL 이미지 한 장으로 그림 (Tk 캔버스 항목을 날마다 만들지 않음)
+
+- 긴 기록은 LTTB로 그림 너비(픽셀)만큼만 점을 남겨서 그림 - 몇 년치여도 그리는 비용은 창 크기에 비례
+- 배경(격자/눈금) 층과 데이터 층을 (크기, 기간)별로 캐시 - 창 크기를 바꿨다 돌아오면 다시 그리지 않음
+"""
+
+from collections import OrderedDict
+from datetime import date, timedelta
+
+from PIL import Image, ImageDraw, ImageFont
+
+from rest_analytics import lttb
+
+MARGIN = (52, 14, 16, 30)  # 왼쪽, 위, 오른쪽, 아래 (축 눈금 글자 자리)
+LAYER_CACHE_SIZE = 8       # 캐시할 층 수 (크기/기간 조합)
+BACKGROUND = "#f0f8ff"
+GRID_COLOR = "#d6e4f0"
+AXIS_COLOR = "#7f8c8d"
+TEXT_COLOR = "#2c3e50"
+LINE_COLOR = (41, 128, 185, 255)
+FILL_COLOR = (52, 152, 219, 70)
+
+
+def nice_ceiling(value):
+    """눈금으로 쓰기 좋은 올림 값 (1, 1.5, 2, 3, 4, 5, 6, 8 x 10^n - 4등분 눈금)"""
+    if value <= 0:
+        return 10
+    scale = 1
+    while scale * 10 <= value:
+        scale *= 10
+    for step in (1, 1.5, 2, 3, 4, 5, 6, 8, 10):
+        if step * scale >= value:
+            return step * scale
+    return 10 * scale
+
+
+def load_font(size=11):
+    """눈금 글꼴 (맑은 고딕, 없으면 PIL 기본 글꼴)"""
+    for name in ("malgun.ttf", "NanumGothic.ttf"):
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+
+class HistoryChart:
+    """일별 휴식 시간 차트 - render(width, height, days)로 PIL 이미지 반환"""
+
+    def __init__(self, first_day, seconds_per_day):
+        self.font = load_font()
+        self._layers = OrderedDict()
+        self.stats = {"renders": 0, "layer_hits": 0, "layers_drawn": 0}
+        self.version = 0
+        self.set_series(first_day, seconds_per_day)
+
+    def set_series(self, first_day, seconds_per_day):
+        """데이터 교체 (첫 날짜, 날짜별 휴식 초) - 데이터 층 캐시만 무효화"""
+        self.first_day = first_day
+        self.minutes = [seconds / 60 for seconds in seconds_per_day]
+        self.xs = list(range(len(self.minutes)))
+        self.version += 1
+        self._points = {}  # (시작 인덱스, 그림 너비) -> LTTB 인덱스
+
+    # ===== 층 캐시 =====
+
+    def _layer(self, key, draw):
+        layer = self._layers.get(key)
+        if layer is not None:
+            self._layers.move_to_end(key)
+            self.stats["layer_hits"] += 1
+            return layer
+        layer = self._layers[key] = draw()
+        self.stats["layers_drawn"] += 1
+        while len(self._layers) > LAYER_CACHE_SIZE:
+            self._layers.popitem(last=False)
+        return layer
+
+    def _view(self, days):
+        """보여줄 구간 - (시작 인덱스, y축 최대 분)"""
+        start = max(0, len(self.minutes) - days) if days else 0
+        visible = self.minutes[start:]
+        return start, nice_ceiling(max(visible) if visible else 0)
+
+    def render(self, width, height, days=None):
+        """최근 days일 (None이면 전체) 차트 이미지"""
+        self.stats["renders"] += 1
+        start, y_max = self._view(days)
+        size = (max(width, MARGIN[0] + MARGIN[2] + 10), max(height, MARGIN[1] + MARGIN[3] + 10))
+        background = self._layer(("background", size, start, len(self.minutes), y_max),
+                                 lambda: self._draw_background(size, start, y_max))
+        series = self._layer(("series", size, start, self.version, y_max),
+                             lambda: self._draw_series(size, start, y_max))
+        return Image.alpha_composite(background, series)
+
+    # ===== 그리기 =====
+
+    def _plot_box(self, size):
+        left, top, right, bottom = MARGIN
+        return left, top, size[0] - right, size[1] - bottom
+
+    def _x(self, index, start, box):
+        count = len(self.minutes) - start
+        if count <= 1:
+            return box[0]
+        return box[0] + (index - start) * (box[2] - box[0]) / (count - 1)
+
+    def _y(self, minutes, y_max, box):
+        return box[3] - minutes * (box[3] - box[1]) / y_max
+
+    def _draw_background(self, size, start, y_max):
+        """격자, y축 분 눈금, x축 월 눈금"""
+        image = Image.new("RGBA", size, BACKGROUND)
+        draw = ImageDraw.Draw(image)
+        box = self._plot_box(size)
+
+        for i in range(5):
+            value = y_max * i / 4
+            y = self._y(value, y_max, box)
+            draw.line([(box[0], y), (box[2], y)], fill=GRID_COLOR)
+            draw.text((box[0] - 6, y), f"{value:g}분", fill=TEXT_COLOR, font=self.font, anchor="rm")
+
+        count = len(self.minutes) - start
+        if count > 0:
+            first = self.first_day + timedelta(days=start)
+            last = self.first_day + timedelta(days=len(self.minutes) - 1)
+            months = (last.year - first.year) * 12 + last.month - first.month + 1
+            step = 1 if months <= 12 else 3 if months <= 36 else 12
+            month = first.year * 12 + first.month - 1
+            month += -month % step
+            while True:
+                tick = date(month // 12, month % 12 + 1, 1)
+                if tick > last:
+                    break
+                if tick >= first:
+                    x = self._x((tick - self.first_day).days, start, box)
+                    draw.line([(x, box[1]), (x, box[3])], fill=GRID_COLOR)
+                    label = f"{tick.year}" if step == 12 else f"{tick.year % 100:02d}.{tick.month:02d}"
+                    draw.text((x, box[3] + 6), label, fill=TEXT_COLOR, font=self.font, anchor="mt")
+                month += step
+
+        draw.line([(box[0], box[1]), (box[0], box[3]), (box[2], box[3])], fill=AXIS_COLOR)
+        return image
+
+    def _draw_series(self, size, start, y_max):
+        """일별 휴식 시간 선 + 아래 채움 (그림 너비만큼의 점만)"""
+        image = Image.new("RGBA", size, (0, 0, 0, 0))
+        box = self._plot_box(size)
+        if len(self.minutes) - start < 1:
+            return image
+
+        width = int(box[2] - box[0])
+        key = (start, width)
+        indices = self._points.get(key)
+        if indices is None:
+            if len(self._points) >= LAYER_CACHE_SIZE:
+                self._points.clear()
+            indices = self._points[key] = [start + i for i in
+                                           lttb(self.xs[start:], self.minutes[start:], max(width, 3))]
+        points = [(self._x(i, start, box), self._y(self.minutes[i], y_max, box)) for i in indices]
+
+        draw = ImageDraw.Draw(image)
+        draw.polygon([(points[0][0], box[3])] + points + [(points[-1][0], box[3])], fill=FILL_COLOR)
+        if len(points) > 1:
+            draw.line(points, fill=LINE_COLOR, width=2, joint="curve")
+        return image
@@ -0,0 +1,109 @@
+"""
+ClockApp Ver2 - 구간 인덱스
+휴식 알림 억제 구간(식사, 스탠드업, 집중 시간 등)을 정렬된 배열로 미리 만들어두고
+bisect로 O(log n) 조회
+"""
+
+from bisect import bisect_right
+
+
+class IntervalIndex:
+    """겹치는 구간을 서로 겹치지 않는 세그먼트로 정리한 조회용 인덱스
+
+    intervals: (시작, 끝, 라벨) 목록 - [시작, 끝) 반열린 구간, 라벨은 해시 가능해야 함
+    각 세그먼트는 그 구간을 덮는 라벨 튜플을 가진다.
+    """
+
+    def __init__(self, intervals=()):
+        self._starts = []
+        self._ends = []
+        self._labels = []
+        self._run_ends = []
+        self._build(intervals)
+
+    def _build(self, intervals):
+        """스윕 방식으로 세그먼트 구성 - O(n log n)"""
+        events = []
+        for start, end, label in intervals:
+            if end > start:
+                events.append((start, 1, label))
+                events.append((end, -1, label))
+        # 같은 지점에서는 끝나는 구간을 먼저 처리
+        events.sort(key=lambda event: (event[0], event[1]))
+
+        active = {}  # 라벨 -> 겹친 개수 (삽입 순서 유지)
+        prev = None
+        for point, delta, label in events:
+            if prev is not None and point > prev and active:
+                labels = tuple(active)
+                if self._ends and self._ends[-1] == prev and self._labels[-1] == labels:
+                    self._ends[-1] = point
+                else:
+                    self._starts.append(prev)
+                    self._ends.append(point)
+                    self._labels.append(labels)
+            if delta > 0:
+                active[label] = active.get(label, 0) + 1
+            else:
+                active[label] -= 1
+                if not active[label]:
+                    del active[label]
+            prev = point
+
+        # 이어진 세그먼트들의 끝 (억제 구간이 완전히 끝나는 지점)
+        self._run_ends = list(self._ends)
+        for i in range(len(self._starts) - 2, -1, -1):
+            if self._ends[i] == self._starts[i + 1]:
+                self._run_ends[i] = self._run_ends[i + 1]
+
+    def _locate(self, point):
+        """point를 포함하는 세그먼트 번호 (없으면 -1)"""
+        i = bisect_right(self._starts, point) - 1
+        if i >= 0 and point < self._ends[i]:
+            return i
+        return -1
+
+    def find(self, point):
+        """point를 덮는 라벨 튜플 (없으면 빈 튜플)"""
+        i = self._locate(point)
+        return self._labels[i] if i >= 0 else ()
+
+    def contains(self, point):
+        """point가 어떤 구간에든 포함되는지"""
+        return self._locate(point) >= 0
+
+    def run_end(self, point):
+        """point를 포함하는 연속 구간이 끝나는 지점 (포함되지 않으면 None)"""
+        i = self._locate(point)
+        return self._run_ends[i] if i >= 0 else None
+
+    def next_start(self, point):
+        """point 이후에 시작하는 첫 세그먼트의 시작점 (없으면 None)"""
+        i = bisect_right(self._starts, point)
+        return self._starts[i] if i < len(self._starts) else None
+
+    def __len__(self):
+        return len(self._starts)
+
+
+def parse_hhmm(text):
+    """"HH:MM" 문자열을 하루 중 분 단위로 변환"""
+    hour, minute = str(text).split(":")
+    return int(hour) * 60 + int(minute)
+
+
+def build_daily_index(windows):
+    """하루 단위 반복 구간 인덱스 생성 (분 단위, 자정을 넘는 구간은 둘로 나눔)
+
+    windows: (시작 분, 길이 분, 라벨) 목록
+    """
+    intervals = []
+    for start, duration, label in windows:
+        start %= 1440
+        end = start + duration
+        if end > 1440:
+            intervals.append((start, 1440, label))
+            intervals.append((0, min(end - 1440, 1440), label))
+        else:
+            intervals.append((start, end, label))
+    return IntervalIndex(intervals)
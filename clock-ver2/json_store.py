@@ -0,0 +1,194 @@
+"""
+ClockApp Ver2 - JSON 파일 저장소
+모든 JSON 상태 파일이 같은 방식으로 읽고 쓰도록 하는 공통 모듈
+
+- 쓰기: 임시 파일에 쓰고 fsync 후 rename (중간에 종료되어도 잘린 파일이 남지 않음), 이전 파일은 .bak
+- 체크섬: 마지막 키 "_checksum"에 본문 CRC32를 넣고, 읽을 때 바이트 한 번 + JSON 파싱 한 번으로 검증
+- 캐시: 파일의 (세대 번호, mtime, 크기)가 그대로면 다시 파싱하지 않고 이전 결과를 돌려줌
+- 잠금: 쓰기는 프로세스 간 권고 잠금(<경로>.lock) 안에서, 읽기는 잠금 없이 (file_lock 참고)
+"""
+
+import copy
+import json
+import logging
+import os
+import threading
+import zlib
+from contextlib import contextmanager
+
+from file_lock import lock_for
+
+log = logging.getLogger("clockapp.json_store")
+
+CHECKSUM_KEY = "_checksum"
+_CHECKSUM_MARKER = b'"' + CHECKSUM_KEY.encode() + b'"'
+
+
+class CorruptFileError(ValueError):
+    """체크섬이 맞지 않거나 JSON이 깨진 파일"""
+
+
+_cache = {}            # 경로 -> ((세대 번호, mtime_ns, 크기), 데이터)
+_created_dirs = set()  # 이미 확인/생성한 폴더
+_lock = threading.Lock()
+stats = {"reads": 0, "cache_hits": 0, "writes": 0, "bytes_written": 0, "corrupt": 0}
+
+
+def encode(data, indent=2, compact=False):
+    """데이터를 체크섬이 포함된 JSON 바이트로 변환 (dict가 아니면 체크섬 없이)"""
+    if compact:
+        body = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    else:
+        body = json.dumps(data, ensure_ascii=False, indent=indent)
+    if not isinstance(data, dict):
+        return body.encode('utf-8')
+
+    # 본문의 닫는 괄호 앞까지를 체크섬 대상으로 하고 마지막 키로 체크섬 추가
+    head = body[:-1].rstrip().encode('utf-8')
+    checksum = f"{zlib.crc32(head):08x}"
+    comma = b"," if data else b""
+    if compact or indent is None:
+        tail = comma + _CHECKSUM_MARKER + f':"{checksum}"}}'.encode()
+    else:
+        pad = b"\n" + b" " * (indent if isinstance(indent, int) else len(indent))
+        tail = comma + pad + _CHECKSUM_MARKER + f': "{checksum}"\n}}'.encode()
+    return head + tail
+
+
+def decode(raw, strict=True):
+    """JSON 바이트 검증 + 파싱 (체크섬이 없으면 예전 형식/직접 만든 파일로 보고 그대로 사용)
+
+    strict가 False이면 JSON은 정상인데 체크섬만 다른 경우 (사용자가 직접 고친 파일) 경고만 출력한다.
+    """
+    try:
+        data = json.loads(raw.decode('utf-8'))
+    except ValueError as e:
+        raise CorruptFileError(f"JSON 파싱 실패: {e}")
+
+    if not isinstance(data, dict) or CHECKSUM_KEY not in data:
+        return data
+    stored = data.pop(CHECKSUM_KEY)
+    head = raw[:raw.rfind(_CHECKSUM_MARKER)].rstrip()
+    if head.endswith(b","):
+        head = head[:-1]
+    if f"{zlib.crc32(head):08x}" != stored:
+        if strict:
+            raise CorruptFileError("체크섬 불일치")
+        log.warning("JSON 체크섬 불일치 - 직접 수정된 파일로 보고 그대로 사용")
+    return data
+
+
+def ensure_dir(folder):
+    """폴더가 없으면 생성 (같은 폴더는 프로세스당 한 번만 확인)"""
+    if not folder or folder in _created_dirs:
+        return
+    os.makedirs(folder, exist_ok=True)
+    _created_dirs.add(folder)
+
+
+@contextmanager
+def _no_lock():
+    yield None
+
+
+def save(path, data, indent=2, compact=False, backup=True, lock=True):
+    """원자적 저장 (임시 파일 -> fsync -> rename) - 기록한 바이트 수 반환
+
+    lock이 True이면 다른 프로세스와 겹치지 않도록 잠금 안에서 쓰고 세대 번호를 올린다
+    (내보내기/진단 파일처럼 한 프로세스만 쓰는 파일은 False).
+    """
+    raw = encode(data, indent=indent, compact=compact)
+    ensure_dir(os.path.dirname(path))
+    with (lock_for(path) if lock else _no_lock()) as file_lock:
+        temp_path = path + ".tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        if backup and os.path.exists(path):
+            os.replace(path, path + ".bak")
+        os.replace(temp_path, path)
+        generation = file_lock.bump_generation() if file_lock else 0
+
+        # 방금 쓴 내용은 다시 파싱할 필요 없음
+        try:
+            st = os.stat(path)
+            with _lock:
+                _cache[path] = ((generation, st.st_mtime_ns, st.st_size), copy.deepcopy(data))
+        except OSError:
+            pass
+    stats["writes"] += 1
+    stats["bytes_written"] += len(raw)
+    return len(raw)
+
+
+def _read(path, strict):
+    """파일 읽기 (변경 없으면 캐시) - 파일이 없으면 None, 깨졌으면 CorruptFileError
+
+    세대 번호는 잠금 없이 읽는다. 번호를 파일보다 먼저 읽으므로 그 사이 다른 프로세스가 쓰면
+    새 내용이 옛 번호로 캐시될 수는 있어도 (다음 읽기에서 다시 파싱) 옛 내용이 새 번호로 남지는 않는다.
+    """
+    generation = lock_for(path).read_generation()
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = (generation, st.st_mtime_ns, st.st_size)
+    with _lock:
+        cached = _cache.get(path)
+    if cached and cached[0] == key:
+        stats["cache_hits"] += 1
+        return copy.deepcopy(cached[1])
+
+    with open(path, 'rb') as f:
+        raw = f.read()
+    stats["reads"] += 1
+    data = decode(raw, strict=strict)
+    with _lock:
+        _cache[path] = (key, data)
+    return copy.deepcopy(data)
+
+
+def load(path, default=None, strict=False):
+    """JSON 파일 로드 - 깨졌거나 저장 도중 종료되었으면 이전 파일(.bak)로 복구"""
+    try:
+        data = _read(path, strict)
+        if data is not None:
+            return data
+    except CorruptFileError as e:
+        stats["corrupt"] += 1
+        log.warning("손상된 파일 (%s): %s - 백업 파일 확인", os.path.basename(path), e)
+
+    try:
+        data = _read(path + ".bak", strict)
+        if data is not None:
+            log.info("백업 파일에서 복구: %s.bak", os.path.basename(path))
+            return data
+    except CorruptFileError as e:
+        stats["corrupt"] += 1
+        log.error("백업 파일도 손상됨 (%s.bak): %s", os.path.basename(path), e)
+    return default
+
+
+def update(path, func, default=None, strict=False, **options):
+    """잠금 안에서 읽고-고치고-저장 (다른 프로세스의 변경을 덮어쓰지 않음) - 저장한 데이터 반환"""
+    with lock_for(path):
+        data = func(load(path, default=copy.deepcopy(default), strict=strict))
+        save(path, data, **options)
+        return data
+
+
+def invalidate(path=None):
+    """파싱 캐시 비우기 (path가 없으면 전체)"""
+    with _lock:
+        if path is None:
+            _cache.clear()
+        else:
+            _cache.pop(path, None)
+
+
+def cache_info():
+    """파싱 캐시 상태 - 항목 수, 적중/파일 읽기 횟수 (진단용)"""
+    with _lock:
+        entries = len(_cache)
+    return {"entries": entries, "hits": stats["cache_hits"], "reads": stats["reads"]}
@@ -0,0 +1,78 @@
+"""
+ClockApp Ver2 - 레벨 곡선 엔진
+레벨별 누적 시간 기준표를 한 번만 만들어두고 bisect로 레벨 조회 (매 초 호출해도 O(log n))
+
+level_curve 설정 형식 (없으면 기존 2배 곡선):
+    {"type": "doubling", "base": 30}                   30, 60, 120, 240 ...
+    {"type": "linear", "base": 30, "step": 30}         30, 60, 90, 120 ...
+    {"type": "polynomial", "base": 30, "exponent": 2}  30, 120, 270, 480 ... (base * 레벨^exponent)
+    {"type": "table", "steps": [30, 60, 120, 300]}     표의 마지막 값이 이후 레벨에 반복
+"""
+
+import logging
+from bisect import bisect_right
+
+log = logging.getLogger("clockapp.level_curve")
+
+DEFAULT_CURVE = {"type": "doubling", "base": 30}
+MAX_TOTAL_SECONDS = 10 ** 10  # 기준표를 만들 누적 시간 상한 (약 300년)
+MAX_LEVELS = 100000           # 기준표 레벨 상한
+
+
+class LevelCurve:
+    """레벨 곡선 - step(level)은 level에서 다음 레벨로 가는 데 필요한 시간 (초)"""
+
+    def __init__(self, step, name="custom"):
+        self.name = name
+        self._step = step
+        self._thresholds = [0]  # 레벨 n을 시작하는 누적 시간 = _thresholds[n - 1]
+        self._steps = []
+        total = 0
+        level = 1
+        while total <= MAX_TOTAL_SECONDS and level <= MAX_LEVELS:
+            required = int(step(level))
+            if required <= 0:
+                raise ValueError(f"레벨 {level}의 필요 시간이 0 이하입니다: {required}")
+            self._steps.append(required)
+            total += required
+            self._thresholds.append(total)
+            level += 1
+
+    def level_for(self, total_seconds):
+        """누적 시간으로 (레벨, 현재 레벨 시작 누적 시간) 계산"""
+        level = min(bisect_right(self._thresholds, total_seconds), len(self._steps))
+        return level, self._thresholds[level - 1]
+
+    def required_for(self, level):
+        """level에서 다음 레벨까지 필요한 시간 (초)"""
+        if 1 <= level <= len(self._steps):
+            return self._steps[level - 1]
+        return int(self._step(max(1, level)))
+
+    def __len__(self):
+        return len(self._steps)
+
+
+def make_curve(config=None):
+    """설정값으로 레벨 곡선 생성 (잘못된 설정이면 기본 2배 곡선)"""
+    config = config or DEFAULT_CURVE
+    try:
+        curve_type = config.get("type", "doubling")
+        base = config.get("base", 30)
+        if curve_type == "doubling":
+            return LevelCurve(lambda level: base * 2 ** (level - 1), curve_type)
+        if curve_type == "linear":
+            step = config.get("step", base)
+            return LevelCurve(lambda level: base + step * (level - 1), curve_type)
+        if curve_type == "polynomial":
+            exponent = config.get("exponent", 2)
+            return LevelCurve(lambda level: base * level ** exponent, curve_type)
+        if curve_type == "table":
+            steps = [int(seconds) for seconds in config["steps"]]
+            if not steps:
+                raise ValueError("steps가 비어 있습니다")
+            return LevelCurve(lambda level: steps[min(level, len(steps)) - 1], curve_type)
+        raise ValueError(f"알 수 없는 곡선 종류: {curve_type}")
+    except Exception as e:
+        log.error("레벨 곡선 설정 오류 (%s): %s - 기본 곡선 사용", config, e)
+        return make_curve(DEFAULT_CURVE)
@@ -11,6 +11,8 @@ import json
 import shutil
 from pathlib import Path
 
+import json_store
+
 def get_ver1_settings_path():
     """Ver1 설정 파일 경로를 찾는다"""
     possible_paths = [
@@ -74,8 +76,7 @@ def migrate_settings():
         }
         
         # Ver2 설정 저장
-        with open(ver2_path, 'w', encoding='utf-8') as f:
-            json.dump(ver2_settings, f, indent=4, ensure_ascii=False)
+        json_store.save(ver2_path, ver2_settings, indent=4)
         
         print(f"Ver2 설정 저장 완료: {ver2_path}")
         print(f"마이그레이션된 설정: {ver2_settings}")
@@ -0,0 +1,131 @@
+"""
+ClockApp Ver2 - 알림 큐
+식사/휴식/레벨업/업적 팝업을 우선순위 큐로 관리해서 한 번에 하나의 팝업 창만 만들고,
+중복되거나 겹치는 알림은 합치거나 버림 (Tk와 무관한 순수 로직)
+"""
+
+import heapq
+import itertools
+import logging
+
+log = logging.getLogger("clockapp.notification_queue")
+
+# 알림 우선순위 (작을수록 먼저 표시)
+PRIORITY_MEAL = 0
+PRIORITY_BREAK = 1
+PRIORITY_LEVELUP = 2
+PRIORITY_ACHIEVEMENT = 3  # 레벨업 팝업이 먼저 뜨면 그 팝업에 함께 표시됨
+
+PRIORITIES = {
+    "meal": PRIORITY_MEAL,
+    "break": PRIORITY_BREAK,
+    "levelup": PRIORITY_LEVELUP,
+    "achievement": PRIORITY_ACHIEVEMENT
+}
+
+
+class NotificationQueue:
+    """한 번에 팝업 하나만 띄우는 알림 큐
+
+    show(kind, payload)는 팝업을 만들고 핸들을 반환한다. 팝업이 닫히면 done(handle)을 호출해야
+    다음 알림이 표시된다. alive(handle)을 주면 done() 호출 없이 사라진 팝업도 감지한다.
+
+    합치기 규칙:
+        - 같은 종류의 알림이 대기 중이면 하나로 합침 (휴식은 더 긴 휴식, 레벨업은 더 높은 레벨, 업적은 목록 합침)
+        - 같은 식사 알림은 중복 제거
+        - 식사 알림이 표시/대기 중이면 휴식 알림은 버림 (곧 식사하므로)
+        - 휴식 팝업이 표시 중이면 새 휴식 알림은 버림 (이미 휴식 중)
+    """
+
+    def __init__(self, show, alive=None):
+        self._show = show
+        self._alive = alive
+        self._heap = []      # (우선순위, 순번, 종류)
+        self._pending = {}   # 종류 -> payload (종류별로 하나만 대기)
+        self._seq = itertools.count()
+        self.active = None   # (종류, payload, 핸들)
+        self.stats = {"shown": 0, "merged": 0, "dropped": 0}
+
+    def push(self, kind, payload=None):
+        """알림 추가 - 실제로 대기열에 들어갔거나 합쳐졌으면 True, 버려졌으면 False"""
+        self._check_active()
+
+        if kind == "break" and (self._is_active("meal") or self._is_active("break") or "meal" in self._pending):
+            self.stats["dropped"] += 1
+            return False
+        if kind == "meal" and self.active and self.active[0] == "meal" and self.active[1] == payload:
+            self.stats["dropped"] += 1
+            return False
+        if kind == "meal":
+            # 곧 식사 알림이 뜨므로 대기 중인 휴식 알림은 버림
+            if self._pending.pop("break", None) is not None:
+                self.stats["dropped"] += 1
+
+        if kind in self._pending:
+            self._pending[kind] = self._merge(kind, self._pending[kind], payload)
+            self.stats["merged"] += 1
+        else:
+            self._pending[kind] = payload
+            heapq.heappush(self._heap, (PRIORITIES.get(kind, PRIORITY_LEVELUP), next(self._seq), kind))
+
+        if self.active is None:
+            self._show_next()
+        return True
+
+    def done(self, handle=None):
+        """표시 중인 팝업이 닫힘 - 다음 알림 표시 (이전 팝업의 늦은 호출은 무시)"""
+        if self.active is None or (handle is not None and self.active[2] is not handle):
+            return
+        self.active = None
+        self._show_next()
+
+    def clear(self):
+        """대기 중인 알림 모두 제거 (표시 중인 팝업은 유지)"""
+        self._heap = []
+        self._pending = {}
+
+    def __len__(self):
+        return len(self._pending)
+
+    @staticmethod
+    def _merge(kind, old, new):
+        """같은 종류의 대기 알림 합치기"""
+        if kind == "break":
+            old_seconds = (old or {}).get("rest_seconds", 0)
+            new_seconds = (new or {}).get("rest_seconds", 0)
+            return new if new_seconds > old_seconds else old
+        if kind == "levelup":
+            return max(old, new)
+        if kind == "achievement":
+            return (old or []) + (new or [])
+        return new
+
+    def _is_active(self, kind):
+        return self.active is not None and self.active[0] == kind
+
+    def _check_active(self):
+        """done() 없이 사라진 팝업 정리"""
+        if self.active is not None and self._alive is not None:
+            try:
+                alive = self._alive(self.active[2])
+            except Exception:
+                alive = False
+            if not alive:
+                self.active = None
+
+    def _show_next(self):
+        """가장 우선순위가 높은 알림 표시 (표시에 실패하면 다음 알림으로)"""
+        while self._heap and self.active is None:
+            _, _, kind = heapq.heappop(self._heap)
+            if kind not in self._pending:
+                continue
+            payload = self._pending.pop(kind)
+            try:
+                handle = self._show(kind, payload)
+            except Exception as e:
+                log.error("알림 표시 오류 (%s): %s", kind, e)
+                continue
+            if handle is None:
+                continue
+            self.active = (kind, payload, handle)
+            self.stats["shown"] += 1
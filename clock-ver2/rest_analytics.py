@@ -0,0 +1,239 @@
+"""
+ClockApp Ver2 - 휴식 기록 분석
+휴식 세션을 열(column) 단위 배열(array)로 보관하고 일/주/시간대별 합계, 완료율, 연속 기록을 계산
+NumPy가 있으면 같은 버퍼(memoryview)를 복사 없이 벡터 연산으로 처리 (10만 세션도 수 ms)
+"""
+
+import time
+from array import array
+from datetime import date, datetime, timedelta, timezone
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 없으면 순수 파이썬 경로 사용
+    np = None
+
+EPOCH_DATE = date(1970, 1, 1)
+
+
+def _local_offsets():
+    """epoch 시(hour) 단위 -> 로컬 UTC 오프셋(초) 캐시 조회 함수 (일광절약시간 대응)"""
+    cache = {}
+
+    def offset(hour_key):
+        value = cache.get(hour_key)
+        if value is None:
+            local = datetime.fromtimestamp(hour_key * 3600)
+            utc = datetime.fromtimestamp(hour_key * 3600, timezone.utc).replace(tzinfo=None)
+            value = cache[hour_key] = int((local - utc).total_seconds())
+        return value
+
+    return offset
+
+
+class SessionColumns:
+    """휴식 세션 열 저장소
+
+    start: 시작 epoch (double), duration: 휴식 초 (long),
+    meal: 식사시간 여부, early: 일찍 닫음 여부 (int8),
+    day: 로컬 날짜 번호 (1970-01-01부터 일 수), hour: 로컬 시각 (0~23)
+    """
+
+    def __init__(self):
+        self.start = array('d')
+        self.duration = array('l')
+        self.meal = array('b')
+        self.early = array('b')
+        self.day = array('l')
+        self.hour = array('b')
+        self._offset = _local_offsets()
+
+    @classmethod
+    def from_records(cls, records):
+        """저널 기록 (dict: s, d, m, e) 목록으로 생성"""
+        columns = cls()
+        for record in records:
+            columns.append(record.get("s", 0), record.get("d", 0), record.get("m", 0), record.get("e", 0))
+        return columns
+
+    @classmethod
+    def from_journal(cls, journal):
+        """RestJournal의 모든 세션으로 생성"""
+        return cls.from_records(journal.iter_sessions())
+
+    def append(self, start, duration, meal=False, early=False):
+        """세션 하나 추가 (로컬 날짜/시간대는 추가할 때 한 번만 계산)"""
+        local = int(start) + self._offset(int(start) // 3600)
+        self.start.append(start)
+        self.duration.append(int(duration))
+        self.meal.append(1 if meal else 0)
+        self.early.append(1 if early else 0)
+        self.day.append(local // 86400)
+        self.hour.append(local % 86400 // 3600)
+
+    def __len__(self):
+        return len(self.start)
+
+    def _np(self, column):
+        """열을 복사 없이 NumPy 배열로 (memoryview)"""
+        return np.frombuffer(memoryview(column), dtype=column.typecode)
+
+    # ===== 합계 =====
+
+    def totals_by_day(self):
+        """{날짜: 휴식 초}"""
+        if not len(self):
+            return {}
+        if np is not None:
+            days = self._np(self.day)
+            first = int(days.min())
+            sums = np.bincount(days - first, weights=self._np(self.duration))
+            nonzero = np.flatnonzero(sums)
+            return {EPOCH_DATE + timedelta(days=first + int(i)): int(sums[i]) for i in nonzero}
+        totals = {}
+        for day, seconds in zip(self.day, self.duration):
+            totals[day] = totals.get(day, 0) + seconds
+        return {EPOCH_DATE + timedelta(days=day): seconds for day, seconds in sorted(totals.items())}
+
+    def totals_by_week(self):
+        """{주 시작 월요일: 휴식 초}"""
+        if not len(self):
+            return {}
+        if np is not None:
+            weeks = (self._np(self.day) + 3) // 7  # 1970-01-01은 목요일
+            first = int(weeks.min())
+            sums = np.bincount(weeks - first, weights=self._np(self.duration))
+            nonzero = np.flatnonzero(sums)
+            return {EPOCH_DATE + timedelta(days=(first + int(i)) * 7 - 3): int(sums[i]) for i in nonzero}
+        totals = {}
+        for day, seconds in zip(self.day, self.duration):
+            week = (day + 3) // 7
+            totals[week] = totals.get(week, 0) + seconds
+        return {EPOCH_DATE + timedelta(days=week * 7 - 3): seconds for week, seconds in sorted(totals.items())}
+
+    def totals_by_hour(self):
+        """시간대별 휴식 초 [0시, 1시, ..., 23시]"""
+        if np is not None and len(self):
+            sums = np.bincount(self._np(self.hour), weights=self._np(self.duration), minlength=24)
+            return [int(value) for value in sums]
+        totals = [0] * 24
+        for hour, seconds in zip(self.hour, self.duration):
+            totals[hour] += seconds
+        return totals
+
+    def daily_series(self, until=None):
+        """날짜별 휴식 초를 빈 날 없이 이어 붙인 배열 - (첫 날짜, array('l'))
+
+        첫 세션 날짜부터 마지막 세션 날짜(until이 더 늦으면 until)까지, 쉬지 않은 날은 0 (차트용)
+        """
+        if not len(self):
+            return (until or date.today()), array('l')
+        if np is not None:
+            days = self._np(self.day)
+            first = int(days.min())
+            last = max(int(days.max()), (until - EPOCH_DATE).days if until else 0)
+            sums = np.bincount(days - first, weights=self._np(self.duration), minlength=last - first + 1)
+            return EPOCH_DATE + timedelta(days=first), array('l', sums.astype(np.int64).tolist())
+        first, last = min(self.day), max(self.day)
+        if until:
+            last = max(last, (until - EPOCH_DATE).days)
+        series = array('l', bytes(array('l').itemsize * (last - first + 1)))
+        for day, seconds in zip(self.day, self.duration):
+            series[day - first] += seconds
+        return EPOCH_DATE + timedelta(days=first), series
+
+    # ===== 완료율 / 연속 기록 =====
+
+    def completion_rate(self):
+        """타이머가 끝날 때까지 휴식한 세션 비율 (0.0 ~ 1.0)"""
+        if not len(self):
+            return 0.0
+        if np is not None:
+            return 1.0 - float(self._np(self.early).mean())
+        return 1.0 - sum(self.early) / len(self.early)
+
+    def _completed_days(self):
+        """완료한 세션이 하나 이상 있는 날짜 번호 (정렬됨)"""
+        if np is not None:
+            days = self._np(self.day)[self._np(self.early) == 0]
+            return [int(day) for day in np.unique(days)]
+        return sorted({day for day, early in zip(self.day, self.early) if not early})
+
+    def streaks(self, today=None):
+        """연속 휴식 일수 {"current": 오늘(또는 어제)까지 이어진 일수, "longest": 최장 기록}"""
+        days = self._completed_days()
+        if not days:
+            return {"current": 0, "longest": 0}
+
+        longest = run = 1
+        for prev, day in zip(days, days[1:]):
+            run = run + 1 if day == prev + 1 else 1
+            longest = max(longest, run)
+
+        today = today or date.today()
+        today_number = (today - EPOCH_DATE).days
+        current = 0
+        if days[-1] >= today_number - 1:  # 오늘 아직 휴식 전이면 어제까지의 기록 유지
+            current = 1
+            for i in range(len(days) - 1, 0, -1):
+                if days[i] - days[i - 1] != 1:
+                    break
+                current += 1
+        return {"current": current, "longest": longest}
+
+    def summary(self, today=None):
+        """통계 요약 (오늘/이번 주 합계, 완료율, 연속 기록)"""
+        today = today or date.today()
+        by_day = self.totals_by_day()
+        monday = today - timedelta(days=today.weekday())
+        return {
+            "sessions": len(self),
+            "today_seconds": by_day.get(today, 0),
+            "week_seconds": self.totals_by_week().get(monday, 0),
+            "completion_rate": round(self.completion_rate(), 3),
+            "streaks": self.streaks(today)
+        }
+
+
+def lttb(xs, ys, threshold):
+    """Largest-Triangle-Three-Buckets 다운샘플링 - 남길 점의 인덱스 목록 (처음/끝 포함)
+
+    가운데 점들을 threshold - 2개의 구간으로 나누고, 구간마다 이전에 고른 점과 다음 구간 평균점으로
+    만든 삼각형의 넓이가 가장 큰 점 하나를 남긴다 (봉우리/골짜기 모양 유지, 전체 O(n)).
+    """
+    n = len(ys)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+    every = (n - 2) / (threshold - 2)
+    indices = [0]
+    a = 0
+    for i in range(threshold - 2):
+        # 다음 구간의 평균점 (마지막 구간이면 끝점)
+        next_start = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        span = next_end - next_start
+        avg_x = sum(xs[next_start:next_end]) / span
+        avg_y = sum(ys[next_start:next_end]) / span
+
+        ax, ay = xs[a], ys[a]
+        best, best_area = -1, -1.0
+        for j in range(int(i * every) + 1, int((i + 1) * every) + 1):
+            area = abs((ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        indices.append(best)
+        a = best
+    indices.append(n - 1)
+    return indices
+
+
+# 벤치마크 (10만 세션)
+if __name__ == "__main__":
+    columns = SessionColumns()
+    start = time.time() - 400 * 86400
+    for i in range(100000):
+        columns.append(start + i * 345.6, 30 + i % 40, i % 17 == 0, i % 9 == 0)
+    started = time.perf_counter()
+    result = columns.summary()
+    columns.totals_by_hour()
+    print(f"{'NumPy' if np is not None else '순수 파이썬'}: {(time.perf_counter() - started) * 1000:.1f}ms {result}")
@@ -0,0 +1,146 @@
+"""
+ClockApp Ver2 - 휴식 기록 보관소
+오래된 휴식 세션을 월별 압축 조각(segment)으로 옮겨 실시간 저널이 계속 커지지 않게 함
+
+- 조각: rest-YYYY-MM.jsonl.xz (lzma, 없으면 gzip) - 저널과 같은 한 줄 JSON 기록, 시작 시각 순
+- 색인: archive_index.json - 조각별 시간 범위/세션 수/합계 (json_store)
+- 기간 조회는 색인으로 겹치는 조각만 압축을 풂, 시작할 때는 보관소를 읽지 않음
+"""
+
+import bisect
+import json
+import os
+from datetime import datetime
+
+import json_store
+from file_lock import lock_for
+
+try:
+    import lzma as _codec
+    SEGMENT_SUFFIX = ".jsonl.xz"
+except ImportError:  # lzma 없이 빌드된 파이썬
+    import gzip as _codec
+    SEGMENT_SUFFIX = ".jsonl.gz"
+
+INDEX_FILE_NAME = "archive_index.json"
+DEFAULT_KEEP_MONTHS = 3  # 저널에 남길 최근 개월 수 (이번 달 포함)
+
+
+def month_key(epoch):
+    """epoch -> "YYYY-MM" (로컬 시각)"""
+    return datetime.fromtimestamp(epoch).strftime("%Y-%m")
+
+
+def archive_cutoff(keep_months=DEFAULT_KEEP_MONTHS, now=None):
+    """이 시각 이전에 시작한 세션은 보관 대상 (이번 달 포함 keep_months개월 전 1일 0시)"""
+    today = datetime.fromtimestamp(now) if now is not None else datetime.now()
+    months = today.year * 12 + today.month - 1 - (max(1, keep_months) - 1)
+    return datetime(months // 12, months % 12 + 1, 1).timestamp()
+
+
+class RestArchive:
+    """월별 압축 조각 + 시간 범위 색인"""
+
+    def __init__(self, folder):
+        self.folder = folder
+        self.index_path = os.path.join(folder, INDEX_FILE_NAME)
+        self._segments = None  # 색인 (처음 조회할 때 읽음), start 순
+        self.stats = {"segments_read": 0, "segments_written": 0}
+
+    @property
+    def segments(self):
+        if self._segments is None:
+            index = json_store.load(self.index_path, default={}, strict=True)
+            self._segments = sorted(index.get("segments", []), key=lambda seg: seg["start"])
+        return self._segments
+
+    def _segment_path(self, month):
+        return os.path.join(self.folder, f"rest-{month}{SEGMENT_SUFFIX}")
+
+    def _read_segment(self, month):
+        self.stats["segments_read"] += 1
+        path = self._segment_path(month)
+        if not os.path.exists(path):
+            return []
+        with _codec.open(path, 'rt', encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def _write_segment(self, month, records):
+        """조각 쓰기 (임시 파일에 압축해서 fsync 후 교체)"""
+        json_store.ensure_dir(self.folder)
+        path = self._segment_path(month)
+        temp_path = path + ".tmp"
+        with open(temp_path, 'wb') as raw:
+            with _codec.open(raw, 'wt', encoding='utf-8') as f:
+                for record in records:
+                    f.write(json.dumps(record, separators=(',', ':')) + "\n")
+            raw.flush()
+            os.fsync(raw.fileno())
+        os.replace(temp_path, path)
+        self.stats["segments_written"] += 1
+
+    def add(self, records):
+        """세션 기록을 월별 조각에 추가 - 추가한 세션 수
+
+        같은 달 조각이 이미 있으면 합쳐서 다시 쓴다 (같은 기록은 한 번만 - 저널 정리 전에 종료된 경우 대비).
+        조각을 모두 쓴 뒤 색인을 저장하므로, 도중에 종료되어도 저널에는 아직 원래 기록이 남아 있다.
+        다른 프로세스와 조각/색인을 덮어쓰지 않도록 색인 잠금 안에서 최신 색인을 다시 읽고 쓴다.
+        """
+        by_month = {}
+        for record in records:
+            by_month.setdefault(month_key(record["s"]), []).append(record)
+        if not by_month:
+            return 0
+
+        with lock_for(self.index_path):
+            self._segments = None
+            return self._add(by_month)
+
+    def _add(self, by_month):
+        segments = {seg["month"]: seg for seg in self.segments}
+        added = 0
+        for month, new_records in sorted(by_month.items()):
+            existing = self._read_segment(month) if month in segments else []
+            seen = {tuple(sorted(r.items())) for r in existing}
+            merged = list(existing)
+            for record in new_records:
+                key = tuple(sorted(record.items()))
+                if key not in seen:
+                    seen.add(key)
+                    merged.append(record)
+                    added += 1
+            merged.sort(key=lambda r: r["s"])
+            self._write_segment(month, merged)
+            segments[month] = {
+                "month": month,
+                "file": os.path.basename(self._segment_path(month)),
+                "start": merged[0]["s"],
+                "end": merged[-1]["s"],
+                "sessions": len(merged),
+                "seconds": sum(int(r.get("d", 0)) for r in merged)
+            }
+
+        self._segments = sorted(segments.values(), key=lambda seg: seg["start"])
+        json_store.save(self.index_path, {"version": 1, "segments": self._segments})
+        return added
+
+    def query(self, start=None, end=None):
+        """기간 [start, end)의 보관된 세션 (시작 시각 순) - 겹치는 조각만 압축을 풂"""
+        segments = self.segments
+        if not segments:
+            return
+        start = float("-inf") if start is None else start
+        end = float("inf") if end is None else end
+        # 조각은 달 단위라 범위가 겹치지 않으므로 end 순서도 start 순서와 같음
+        first = bisect.bisect_left([seg["end"] for seg in segments], start)
+        for seg in segments[first:]:
+            if seg["start"] >= end:
+                break
+            for record in self._read_segment(seg["month"]):
+                if start <= record["s"] < end:
+                    yield record
+
+    def totals(self):
+        """보관된 전체 (세션 수, 휴식 초) - 색인만 사용"""
+        return (sum(seg["sessions"] for seg in self.segments),
+                sum(seg["seconds"] for seg in self.segments))
@@ -0,0 +1,253 @@
+"""
+ClockApp Ver2 - 휴식 기록 저널
+휴식 세션을 한 줄짜리 JSON으로 파일 끝에 덧붙이기만 하고 (전체 다시 쓰기 없음),
+주기적으로 누적값 스냅샷(rest_level_data.json)을 남겨 시작 시 스냅샷 + 이후 기록만 읽음
+
+저널 한 줄 형식 (공백 없는 JSON):
+    {"s": 시작 epoch, "d": 휴식 시간(초), "m": 식사시간 여부(0/1), "e": 일찍 닫음(0/1)}
+스냅샷 형식 (기존 레벨 데이터 파일과 호환):
+    {"level": 레벨, "total_seconds": 누적 초, "sessions": 세션 수, "journal_offset": 반영한 저널 바이트 위치,
+     "journal_generation": 저널 정리 횟수}
+오래된 세션을 보관소로 옮기면 (compact) 저널 첫 줄에 옮긴 누적값을 남김:
+    {"base": 누적 초, "n": 세션 수}
+"""
+
+import json
+import logging
+import os
+import time
+
+import json_store
+from file_lock import lock_for
+
+log = logging.getLogger("clockapp.rest_journal")
+
+SNAPSHOT_EVERY = 20  # 세션 몇 개마다 스냅샷을 남길지
+
+
+class RestJournal:
+    """추가 전용 휴식 세션 저널 + 주기적 스냅샷"""
+
+    def __init__(self, journal_path, snapshot_path, level_func=None, snapshot_every=SNAPSHOT_EVERY,
+                 snapshot_writer=None):
+        self.journal_path = journal_path
+        self.snapshot_path = snapshot_path
+        self.level_func = level_func  # 누적 초 -> 레벨 (스냅샷에 레벨도 함께 기록)
+        self.snapshot_every = snapshot_every
+        self.snapshot_writer = snapshot_writer or json_store.save  # (경로, 데이터) 저장 함수
+        self.total_seconds = 0
+        self.sessions = 0
+        self._offset = 0          # 스냅샷에 반영된 저널 위치 (바이트)
+        self._read_pos = 0        # 누적값에 반영한 저널 위치 (바이트)
+        self._generation = 0      # 저널 정리 세대 (잠금 파일의 세대 번호)
+        self._since_snapshot = 0  # 마지막 스냅샷 이후 추가한 세션 수
+        self.load()
+
+    @property
+    def level(self):
+        return self.level_func(self.total_seconds) if self.level_func else None
+
+    def load(self):
+        """스냅샷 읽기 + 스냅샷 이후의 저널 꼬리만 재생"""
+        snapshot = {}
+        try:
+            # 체크섬이 맞지 않으면 이전 스냅샷(.bak), 그것도 없으면 저널 처음부터 재생
+            snapshot = json_store.load(self.snapshot_path, default={}, strict=True)
+        except Exception as e:
+            log.warning("휴식 기록 스냅샷 로드 실패: %s", e)
+
+        # 저널이 정리(compact)된 뒤에는 이전 세대 스냅샷의 위치가 맞지 않음 -> 첫 줄(base)부터 재생
+        self._generation = lock_for(self.journal_path).read_generation()
+        if snapshot and int(snapshot.get("journal_generation", 0)) != self._generation:
+            log.info("휴식 기록 스냅샷이 저널 정리 전 기준 - 저널 처음부터 재생")
+            snapshot = {}
+
+        self.total_seconds = int(snapshot.get("total_seconds", 0))
+        self.sessions = int(snapshot.get("sessions", 0))
+        self._offset = self._read_pos = int(snapshot.get("journal_offset", 0))
+        self._since_snapshot = 0
+
+        try:
+            # 잘린 줄 정리는 다른 프로세스가 쓰는 중이 아닐 때만 (잠금 안에서)
+            with lock_for(self.journal_path):
+                self._catch_up(repair=True)
+        except Exception as e:
+            log.warning("휴식 기록 저널 로드 실패: %s", e)
+
+    def _catch_up(self, repair=False):
+        """읽은 위치 이후의 완전한 줄을 반영 (다른 프로세스가 추가한 세션 포함) - 반영한 세션 수
+
+        repair는 저널 잠금을 잡은 상태에서만: 마지막 줄이 잘렸으면 (쓰는 도중 종료) 잘린 부분을 버린다.
+        """
+        if lock_for(self.journal_path).read_generation() != self._generation:
+            # 다른 프로세스가 저널을 정리함 - 새 저널 기준으로 다시 읽기
+            before = self.sessions
+            self.load()
+            return self.sessions - before
+        if not os.path.exists(self.journal_path):
+            return 0
+        size = os.path.getsize(self.journal_path)
+        if self._read_pos > size:
+            # 저널이 지워졌거나 교체됨 - 스냅샷 누적값만 유지
+            log.info("휴식 기록 저널이 스냅샷보다 짧음 (%s < %s) - 새로 시작", size, self._read_pos)
+            self._offset = self._read_pos = size
+            if repair:
+                self.snapshot()
+            return 0
+        if self._read_pos == size:
+            return 0
+
+        with open(self.journal_path, 'rb') as f:
+            f.seek(self._read_pos)
+            tail = f.read(size - self._read_pos)
+
+        complete = tail.rfind(b"\n") + 1
+        if repair and complete < len(tail):
+            log.info("휴식 기록 저널 끝의 잘린 기록 제거 (%s bytes)", len(tail) - complete)
+            with open(self.journal_path, 'r+b') as f:
+                f.truncate(self._read_pos + complete)
+
+        applied = 0
+        for line in tail[:complete].splitlines():
+            try:
+                self._apply(json.loads(line))
+                applied += 1
+            except ValueError:
+                continue
+        self._read_pos += complete
+        self._since_snapshot += applied
+        return applied
+
+    def refresh(self):
+        """다른 프로세스가 추가한 세션 반영 (잠금 없이 완전한 줄만 읽음) - 반영한 세션 수"""
+        try:
+            return self._catch_up()
+        except Exception as e:
+            log.warning("휴식 기록 저널 갱신 실패: %s", e)
+            return 0
+
+    def _apply(self, record):
+        """세션 하나(또는 보관소로 옮긴 누적값)를 누적값에 반영"""
+        if "base" in record:
+            self.total_seconds += int(record["base"])
+            self.sessions += int(record.get("n", 0))
+            return
+        self.total_seconds += int(record.get("d", 0))
+        self.sessions += 1
+
+    def append(self, start, duration, meal=False, early=False):
+        """휴식 세션 하나 기록 (짧은 한 줄 추가) - 성공하면 True
+
+        같은 저널을 쓰는 다른 프로세스(Ver1/Ver2 동시 실행, 여러 세션)가 있어도 누적값이 어긋나지 않도록
+        잠금 안에서 그 사이 추가된 줄을 먼저 반영하고 덧붙인다.
+        """
+        record = {"s": round(start, 1), "d": int(duration), "m": int(bool(meal)), "e": int(bool(early))}
+        line = (json.dumps(record, separators=(',', ':')) + "\n").encode('utf-8')
+        try:
+            with lock_for(self.journal_path):
+                self._catch_up(repair=True)
+                with open(self.journal_path, 'ab') as f:
+                    f.write(line)
+                self._read_pos += len(line)
+        except Exception as e:
+            log.warning("휴식 기록 저장 실패: %s", e)
+            return False
+
+        self._apply(record)
+        self._since_snapshot += 1
+        if self._since_snapshot >= self.snapshot_every:
+            self.snapshot()
+        return True
+
+    def snapshot(self):
+        """현재 누적값 스냅샷 저장 - 성공하면 True
+
+        저널 위치는 누적값에 반영한 줄까지이므로 스냅샷 쓰기가 늦어지거나 (지연 쓰기)
+        다른 프로세스의 더 오래된 스냅샷이 나중에 기록되어도 스냅샷 + 꼬리로 같은 누적값이 복원된다.
+        """
+        try:
+            with lock_for(self.journal_path):
+                self._catch_up(repair=True)
+                data = {
+                    "level": self.level if self.level_func else 1,
+                    "total_seconds": self.total_seconds,
+                    "sessions": self.sessions,
+                    "journal_offset": self._read_pos,
+                    "journal_generation": self._generation,
+                    "snapshot_at": time.strftime("%Y-%m-%d %H:%M:%S")
+                }
+            self.snapshot_writer(self.snapshot_path, data)
+            self._offset = data["journal_offset"]
+            self._since_snapshot = 0
+            return True
+        except Exception as e:
+            log.warning("휴식 기록 스냅샷 저장 실패: %s", e)
+            return False
+
+    def flush(self):
+        """스냅샷 이후 기록이 있으면 스냅샷 저장 (종료 시 호출)"""
+        if self._since_snapshot:
+            return self.snapshot()
+        return True
+
+    def iter_sessions(self):
+        """저널의 모든 세션 (dict) - 통계/분석용"""
+        if not os.path.exists(self.journal_path):
+            return
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.endswith("\n"):
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if "base" not in record:
+                        yield record
+
+    def compact(self, before, archive):
+        """before 이전에 시작한 세션을 archive(RestArchive)로 옮기고 저널을 남은 세션만으로 다시 씀
+
+        누적값은 그대로이고 옮긴 세션의 합계는 저널 첫 줄(base)에 남는다. 저널 세대 번호를 올려
+        다른 프로세스가 새 저널 기준으로 다시 읽게 한다. 옮긴 세션 수 반환.
+        """
+        with lock_for(self.journal_path) as lock:
+            self._catch_up(repair=True)
+            if not os.path.exists(self.journal_path):
+                return 0
+
+            base = {"base": 0, "n": 0}
+            old, kept = [], []
+            with open(self.journal_path, 'rb') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if "base" in record:
+                        base["base"] += int(record["base"])
+                        base["n"] += int(record.get("n", 0))
+                    elif record.get("s", 0) < before:
+                        old.append(record)
+                    elif not old:
+                        return 0  # 시간 순으로 쌓이므로 첫 세션이 기준 이후면 옮길 것 없음
+                    else:
+                        kept.append(line)
+            if not old:
+                return 0
+
+            archive.add(old)
+            base["base"] += sum(int(record.get("d", 0)) for record in old)
+            base["n"] += len(old)
+            content = (json.dumps(base, separators=(',', ':')) + "\n").encode('utf-8') + b"".join(kept)
+
+            temp_path = self.journal_path + ".tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.journal_path)
+            self._generation = lock.bump_generation()
+            self._offset = self._read_pos = len(content)
+            self.snapshot()
+        log.info("휴식 기록 %s개를 보관소로 이동 (저널 %s bytes)", len(old), len(content))
+        return len(old)
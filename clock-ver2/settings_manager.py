@@ -3,12 +3,17 @@ ClockApp Ver2 - 설정 관리 시스템
 설정 파일 호환성 및 마이그레이션 기능 구현
 """
 
+import logging
 import os
 import json
 import shutil
 from datetime import datetime
 from pathlib import Path
 
+import json_store
+
+log = logging.getLogger("clockapp.settings_manager")
+
 class SettingsManager:
     """설정 파일 관리 및 마이그레이션 클래스"""
     
@@ -70,9 +75,9 @@ class SettingsManager:
             self.backup_dir.mkdir(exist_ok=True)
             self.cache_dir.mkdir(exist_ok=True)
             self.logs_dir.mkdir(exist_ok=True)
-            print(f"✓ 디렉터리 생성 완료: {self.app_data_dir}")
+            log.info("✓ 디렉터리 생성 완료: %s", self.app_data_dir)
         except Exception as e:
-            print(f"❌ 디렉터리 생성 실패: {e}")
+            log.error("❌ 디렉터리 생성 실패: %s", e)
             
     def check_ver1_settings(self):
         """Ver1 설정 파일 존재 여부 확인"""
@@ -81,7 +86,7 @@ class SettingsManager:
     def migrate_from_ver1(self):
         """Ver1 설정을 Ver2 형식으로 마이그레이션"""
         if not self.check_ver1_settings():
-            print("Ver1 설정 파일이 없습니다.")
+            log.info("Ver1 설정 파일이 없습니다.")
             return False
             
         try:
@@ -89,7 +94,7 @@ class SettingsManager:
             with open(self.ver1_settings, 'r', encoding='utf-8') as f:
                 ver1_data = json.load(f)
                 
-            print(f"Ver1 설정 발견: {ver1_data}")
+            log.info("Ver1 설정 발견: %s", ver1_data)
             
             # Ver2 형식으로 변환
             migrated_settings = self.default_settings.copy()
@@ -129,13 +134,13 @@ class SettingsManager:
             backup_file = self.backup_dir / f'settings_v1_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
             shutil.copy2(self.ver1_settings, backup_file)
             
-            print(f"✅ Ver1 → Ver2 마이그레이션 완료!")
-            print(f"   백업 위치: {backup_file}")
+            log.info("✅ Ver1 → Ver2 마이그레이션 완료!")
+            log.info("   백업 위치: %s", backup_file)
             
             return True
             
         except Exception as e:
-            print(f"❌ 마이그레이션 실패: {e}")
+            log.error("❌ 마이그레이션 실패: %s", e)
             return False
             
     def load_settings(self):
@@ -144,21 +149,21 @@ class SettingsManager:
         # 1. Ver2 설정 파일 확인
         if self.settings_file.exists():
             try:
-                with open(self.settings_file, 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
-                print(f"✓ Ver2 설정 로드: {self.settings_file}")
-                return settings
+                settings = json_store.load(str(self.settings_file))
+                if settings is not None:
+                    log.info("✓ Ver2 설정 로드: %s", self.settings_file)
+                    return settings
             except Exception as e:
-                print(f"Ver2 설정 로드 실패: {e}")
+                log.warning("Ver2 설정 로드 실패: %s", e)
                 
         # 2. Ver1 설정 자동 마이그레이션
         if self.check_ver1_settings():
-            print("Ver1 설정 발견 - 자동 마이그레이션 시작")
+            log.info("Ver1 설정 발견 - 자동 마이그레이션 시작")
             if self.migrate_from_ver1():
                 return self.load_settings()  # 마이그레이션 후 재시도
                 
         # 3. 기본값 사용
-        print("기본 설정값 사용")
+        log.info("기본 설정값 사용")
         return self.default_settings
         
     def save_settings(self, settings):
@@ -168,11 +173,10 @@ class SettingsManager:
             settings["version"] = "2.0"
             settings["last_updated"] = datetime.now().isoformat()
             
-            # 설정 파일 저장
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=4, ensure_ascii=False)
+            # 설정 파일 저장 (임시 파일 + fsync + 교체, 체크섬 포함)
+            json_store.save(str(self.settings_file), settings, indent=4)
                 
-            print(f"✅ 설정 저장 완료: {self.settings_file}")
+            log.info("✅ 설정 저장 완료: %s", self.settings_file)
             
             # 백업 생성
             self._create_backup(settings)
@@ -180,16 +184,15 @@ class SettingsManager:
             return True
             
         except Exception as e:
-            print(f"❌ 설정 저장 실패: {e}")
+            log.error("❌ 설정 저장 실패: %s", e)
             return False
             
     def _create_backup(self, settings):
         """설정 백업 생성"""
         try:
             backup_file = self.backup_dir / f'settings_backup_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
-            with open(backup_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=4, ensure_ascii=False)
-                
+            json_store.save(str(backup_file), settings, indent=4, backup=False, lock=False)
+
             # 오래된 백업 파일 정리 (최대 10개 보관)
             backup_files = sorted(self.backup_dir.glob('settings_backup_*.json'))
             if len(backup_files) > 10:
@@ -197,7 +200,7 @@ class SettingsManager:
                     old_file.unlink()
                     
         except Exception as e:
-            print(f"백업 생성 실패: {e}")
+            log.warning("백업 생성 실패: %s", e)
             
     def get_ver1_compatible_settings(self, ver2_settings):
         """Ver2 설정을 Ver1 형식으로 변환 (역호환성)"""
@@ -218,31 +221,29 @@ class SettingsManager:
         """설정 내보내기"""
         try:
             settings = self.load_settings()
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=4, ensure_ascii=False)
-            print(f"✅ 설정 내보내기 완료: {export_path}")
+            json_store.save(str(export_path), settings, indent=4, backup=False, lock=False)
+            log.info("✅ 설정 내보내기 완료: %s", export_path)
             return True
         except Exception as e:
-            print(f"❌ 설정 내보내기 실패: {e}")
+            log.error("❌ 설정 내보내기 실패: %s", e)
             return False
             
     def import_settings(self, import_path):
         """설정 가져오기"""
         try:
-            with open(import_path, 'r', encoding='utf-8') as f:
-                imported_settings = json.load(f)
-                
+            imported_settings = json_store.load(str(import_path))
+
             # 설정 유효성 검증
             if self._validate_settings(imported_settings):
                 self.save_settings(imported_settings)
-                print(f"✅ 설정 가져오기 완료: {import_path}")
+                log.info("✅ 설정 가져오기 완료: %s", import_path)
                 return True
             else:
-                print("❌ 유효하지 않은 설정 파일")
+                log.error("❌ 유효하지 않은 설정 파일")
                 return False
                 
         except Exception as e:
-            print(f"❌ 설정 가져오기 실패: {e}")
+            log.error("❌ 설정 가져오기 실패: %s", e)
             return False
             
     def _validate_settings(self, settings):
@@ -260,11 +261,11 @@ class SettingsManager:
                 
             # 기본값으로 초기화
             self.save_settings(self.default_settings.copy())
-            print("✅ 설정이 초기화되었습니다")
+            log.info("✅ 설정이 초기화되었습니다")
             return True
             
         except Exception as e:
-            print(f"❌ 설정 초기화 실패: {e}")
+            log.error("❌ 설정 초기화 실패: %s", e)
             return False
             
     def get_settings_info(self):
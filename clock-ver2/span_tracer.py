@@ -0,0 +1,167 @@
+"""
+ClockApp Ver2 - 구간(span) 추적
+휴식 팝업/시작 과정의 단계별 소요 시간을 기록해서 Chrome 추적 형식(JSON)으로 저장
+(chrome://tracing 또는 https://ui.perfetto.dev 에서 열기)
+
+    with tracer.span("load_level_data"):
+        ...
+    span = tracer.begin("startup")   # 들여쓰기 없이 긴 구간
+    ...
+    span.end()
+
+- 꺼져 있으면 span()/begin()은 같은 빈 객체를 돌려줌 (시각 측정, 기록 없음)
+- 켜져 있으면 최근 MAX_EVENTS개만 메모리에 보관하고 종료 시 한 번 파일로 저장
+"""
+
+import atexit
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+TRACE_FILE_NAME = "clockapp_trace.json"
+MAX_EVENTS = 20000  # 보관할 최대 구간 수 (오래된 것부터 버림)
+
+log = logging.getLogger("clockapp.span_tracer")
+
+
+class _NullSpan:
+    """추적이 꺼져 있을 때 쓰는 빈 구간"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def end(self, **args):
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """진행 중인 구간 - end() 또는 with 블록이 끝날 때 기록"""
+    __slots__ = ("tracer", "name", "category", "args", "start")
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = time.perf_counter_ns()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.end()
+        return False
+
+    def end(self, **args):
+        """구간 종료 (두 번째 호출은 무시) - args는 추적 파일의 구간 정보에 추가"""
+        if self.start is None:
+            return
+        self.args.update(args)
+        self.tracer._record(self, time.perf_counter_ns())
+        self.start = None
+
+
+class Tracer:
+    """구간 기록기 (기본은 꺼짐)"""
+
+    def __init__(self, max_events=MAX_EVENTS):
+        self.enabled = False
+        self.path = None
+        self._events = deque(maxlen=max_events)
+        self._threads = {}
+        self._origin = time.perf_counter_ns()
+        self._pid = os.getpid()
+        self._atexit = False
+
+    def enable(self, path):
+        """추적 시작 - 종료 시(또는 write()) path에 저장"""
+        self.path = path
+        self.enabled = True
+        if not self._atexit:
+            atexit.register(self._write_at_exit)
+            self._atexit = True
+
+    def disable(self):
+        """추적 중지 (종료 시 자동 저장도 하지 않음)"""
+        self.enabled = False
+
+    def _write_at_exit(self):
+        if self.enabled:
+            try:
+                self.write()
+            except OSError as e:
+                log.warning("구간 추적 저장 실패: %s", e)
+
+    def span(self, name, category="app", **args):
+        """구간 시작 (with 블록 또는 end()로 종료)"""
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, name, category, args)
+
+    begin = span
+
+    def traced(self, name=None, category="app"):
+        """함수 전체를 구간으로 기록하는 데코레이터 (꺼져 있으면 enabled 확인만)"""
+        def decorator(func):
+            span_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with Span(self, span_name, category, {}):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def _record(self, span, end_ns):
+        thread = threading.current_thread()
+        self._threads.setdefault(thread.ident, thread.name)
+        event = {
+            "name": span.name,
+            "cat": span.category,
+            "ph": "X",
+            "ts": (span.start - self._origin) / 1000,  # 마이크로초
+            "dur": (end_ns - span.start) / 1000,
+            "pid": self._pid,
+            "tid": thread.ident
+        }
+        if span.args:
+            event["args"] = span.args
+        self._events.append(event)
+
+    def events(self):
+        """기록된 구간 + 스레드 이름 (Chrome 추적 이벤트 목록)"""
+        metadata = [{"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid, "args": {"name": name}}
+                    for tid, name in list(self._threads.items())]
+        metadata.append({"name": "process_name", "ph": "M", "pid": self._pid, "args": {"name": "ClockApp Ver2"}})
+        return metadata + list(self._events)
+
+    def write(self, path=None):
+        """추적 파일 저장 (임시 파일에 쓰고 교체) - 저장한 경로, 꺼져 있거나 기록이 없으면 None"""
+        path = path or self.path
+        if not path or not self._events:
+            return None
+        trace = {"traceEvents": self.events(), "displayTimeUnit": "ms"}
+        temp_path = path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(trace, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp_path, path)
+        return path
+
+
+# 앱 전체에서 쓰는 기록기
+tracer = Tracer()
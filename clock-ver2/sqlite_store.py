@@ -0,0 +1,343 @@
+"""
+ClockApp Ver2 - SQLite 상태 저장소
+흩어진 JSON 파일(설정, 레벨 데이터, 휴식 메시지, 날씨 캐시, SettingsManager 백업 폴더) 대신
+하나의 SQLite 데이터베이스(WAL 모드)를 쓰는 저장소 백엔드
+
+- 연결 하나를 계속 사용하고 SQL은 고정 문자열(연결의 prepared statement 캐시 재사용)
+- documents: 파일 이름 -> JSON 문서 (json_store.save/load와 같은 호출 형식)
+- rest_sessions: 휴식 세션 (시작 시각 인덱스로 기간 조회)
+- settings_history: 설정 변경 이력 (백업 폴더 대신)
+- 처음 열 때 한 번만 기존 JSON 파일을 가져옴 (meta 테이블에 표시)
+"""
+
+import glob
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import json_store
+
+log = logging.getLogger("clockapp.sqlite_store")
+
+SCHEMA_VERSION = 1
+SETTINGS_FILE_NAME = "clock_settings_ver2.json"  # 저장할 때마다 이력도 남기는 문서
+SETTINGS_HISTORY_KEEP = 10  # 설정 이력 보관 개수 (SettingsManager 백업과 동일)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS documents (
+    name TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rest_sessions (
+    id INTEGER PRIMARY KEY,
+    start REAL NOT NULL,
+    duration INTEGER NOT NULL,
+    meal INTEGER NOT NULL DEFAULT 0,
+    early INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS rest_sessions_start ON rest_sessions (start);
+CREATE TABLE IF NOT EXISTS settings_history (
+    id INTEGER PRIMARY KEY,
+    saved_at REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS settings_history_saved_at ON settings_history (saved_at);
+"""
+
+SQL_GET_META = "SELECT value FROM meta WHERE key = ?"
+SQL_SET_META = "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)"
+SQL_GET_DOCUMENT = "SELECT data FROM documents WHERE name = ?"
+SQL_PUT_DOCUMENT = "INSERT OR REPLACE INTO documents (name, data, updated_at) VALUES (?, ?, ?)"
+SQL_ADD_SESSION = "INSERT INTO rest_sessions (start, duration, meal, early) VALUES (?, ?, ?, ?)"
+SQL_SESSION_TOTALS = "SELECT COUNT(*), COALESCE(SUM(duration), 0) FROM rest_sessions"
+SQL_SESSIONS_RANGE = ("SELECT start, duration, meal, early FROM rest_sessions "
+                      "WHERE start >= ? AND start < ? ORDER BY start")
+SQL_DELETE_SESSIONS_BEFORE = "DELETE FROM rest_sessions WHERE start < ?"
+SQL_ADD_SETTINGS_HISTORY = "INSERT INTO settings_history (saved_at, data) VALUES (?, ?)"
+SQL_TRIM_SETTINGS_HISTORY = ("DELETE FROM settings_history WHERE id NOT IN "
+                             "(SELECT id FROM settings_history ORDER BY saved_at DESC, id DESC LIMIT ?)")
+SQL_SETTINGS_HISTORY = "SELECT saved_at, data FROM settings_history ORDER BY saved_at DESC, id DESC LIMIT ?"
+
+
+class SqliteStore:
+    """SQLite(WAL) 상태 저장소 - 스레드 간에 연결 하나를 잠금으로 공유"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        json_store.ensure_dir(os.path.dirname(db_path))
+        # isolation_level=None: 트랜잭션은 transaction()에서 직접 BEGIN/COMMIT
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None,
+                                     cached_statements=64)
+        self._lock = threading.RLock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")  # WAL에서는 커밋마다 fsync하지 않아도 손상 없음
+        self._conn.executescript(SCHEMA)
+        with self.transaction() as db:
+            if db.execute(SQL_GET_META, ("schema_version",)).fetchone() is None:
+                db.execute(SQL_SET_META, ("schema_version", str(SCHEMA_VERSION)))
+        self.stats = {"reads": 0, "writes": 0, "sessions_added": 0}
+
+    @contextmanager
+    def transaction(self):
+        """쓰기 트랜잭션 (블록이 끝나면 커밋, 예외면 롤백)"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _get_meta(self, key, default=None):
+        with self._lock:
+            row = self._conn.execute(SQL_GET_META, (key,)).fetchone()
+        return row[0] if row else default
+
+    # ===== 문서 (json_store.save/load 대체) =====
+
+    @staticmethod
+    def _name(path):
+        """문서 이름 = 파일 이름 (폴더와 무관)"""
+        return os.path.basename(path)
+
+    def load(self, path, default=None, strict=False):
+        """문서 로드 (없으면 default)"""
+        with self._lock:
+            row = self._conn.execute(SQL_GET_DOCUMENT, (self._name(path),)).fetchone()
+        self.stats["reads"] += 1
+        return json.loads(row[0]) if row else default
+
+    def _put(self, db, path, data):
+        name = self._name(path)
+        now = time.time()
+        text = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+        db.execute(SQL_PUT_DOCUMENT, (name, text, now))
+        if name == SETTINGS_FILE_NAME:
+            db.execute(SQL_ADD_SETTINGS_HISTORY, (now, text))
+            db.execute(SQL_TRIM_SETTINGS_HISTORY, (SETTINGS_HISTORY_KEEP,))
+        self.stats["writes"] += 1
+
+    def save(self, path, data, **options):
+        """문서 저장 (indent 등 파일 형식 옵션은 무시)"""
+        with self.transaction() as db:
+            self._put(db, path, data)
+
+    def save_many(self, items):
+        """여러 문서를 한 트랜잭션으로 저장 - items: [(경로, 데이터, 옵션), ...]"""
+        with self.transaction() as db:
+            for path, data, _options in items:
+                self._put(db, path, data)
+
+    def settings_history(self, limit=SETTINGS_HISTORY_KEEP):
+        """최근 설정 이력 [(저장 시각 epoch, 설정), ...] (최신순)"""
+        with self._lock:
+            rows = self._conn.execute(SQL_SETTINGS_HISTORY, (limit,)).fetchall()
+        return [(saved_at, json.loads(data)) for saved_at, data in rows]
+
+    # ===== 휴식 세션 =====
+
+    def add_session(self, start, duration, meal=False, early=False):
+        """휴식 세션 하나 추가"""
+        with self.transaction() as db:
+            db.execute(SQL_ADD_SESSION, (float(start), int(duration), int(bool(meal)), int(bool(early))))
+        self.stats["sessions_added"] += 1
+
+    def session_totals(self):
+        """(세션 수, 휴식 초 합계)"""
+        with self._lock:
+            return tuple(self._conn.execute(SQL_SESSION_TOTALS).fetchone())
+
+    def sessions(self, start=None, end=None):
+        """기간 [start, end) 휴식 세션 목록 (저널 기록과 같은 dict: s, d, m, e) - 시작 시각 인덱스 사용"""
+        start = float("-inf") if start is None else start
+        end = float("inf") if end is None else end
+        with self._lock:
+            rows = self._conn.execute(SQL_SESSIONS_RANGE, (start, end)).fetchall()
+        return [{"s": s, "d": d, "m": m, "e": e} for s, d, m, e in rows]
+
+    def archive_sessions(self, before, archive):
+        """before 이전 세션을 archive(RestArchive)로 옮기고 행 삭제 (누적값은 기준값으로 유지) - 옮긴 세션 수
+
+        조회, 보관, 삭제, 기준값 갱신을 한 쓰기 트랜잭션에서 처리하므로 여러 프로세스가 동시에 정리해도
+        먼저 잡은 쪽만 행을 옮기고, 기준값에는 실제로 지운 행만 더한다.
+        """
+        with self.transaction() as db:
+            old = self.sessions(None, before)
+            if not old:
+                return 0
+            archive.add(old)
+            deleted = db.execute(SQL_DELETE_SESSIONS_BEFORE, (before,)).rowcount
+            if deleted != len(old):
+                raise RuntimeError(f"휴식 기록 정리 중 행 수 불일치 ({deleted} != {len(old)})")
+            for key, value in (("baseline_seconds", sum(r["d"] for r in old)), ("baseline_sessions", deleted)):
+                row = db.execute(SQL_GET_META, (key,)).fetchone()
+                db.execute(SQL_SET_META, (key, str(int(row[0] if row else 0) + value)))
+        log.info("휴식 기록 %s개를 보관소로 이동", deleted)
+        return deleted
+
+    def journal(self, level_func=None):
+        """RestJournal과 같은 인터페이스의 휴식 기록"""
+        return SqliteJournal(self, level_func)
+
+    # ===== 기존 JSON 파일 가져오기 =====
+
+    def import_json(self, document_paths, journal_path=None, snapshot_path=None, backup_dir=None):
+        """기존 JSON 파일을 한 번만 가져오기 (이미 가져왔으면 None, 아니면 가져온 개수)
+
+        레벨 스냅샷의 누적값 중 저널에 없는 부분 (저널 이전의 예전 레벨 파일)은 기준값으로 보관한다.
+        """
+        if self._get_meta("json_imported") is not None:
+            return None
+
+        counts = {"documents": 0, "sessions": 0, "settings_history": 0}
+        with self.transaction() as db:
+            # 같이 시작한 다른 인스턴스가 먼저 가져왔으면 쓰기 잠금을 잡은 뒤 다시 확인해서 건너뜀
+            if db.execute(SQL_GET_META, ("json_imported",)).fetchone() is not None:
+                return None
+            for path in document_paths:
+                data = json_store.load(path)
+                if data is not None:
+                    self._put(db, path, data)
+                    counts["documents"] += 1
+
+            records, (base_sessions, base_seconds), covered = _read_journal(journal_path)
+            db.executemany(SQL_ADD_SESSION, [(float(r.get("s", 0)), int(r.get("d", 0)),
+                                              int(r.get("m", 0)), int(r.get("e", 0))) for r in records])
+            counts["sessions"] = len(records)
+
+            # 저널 정리로 보관소에 옮긴 세션(첫 줄 base)은 행이 없으므로 기준값으로
+            snapshot = json_store.load(snapshot_path, default={}, strict=True) if snapshot_path else {}
+            if snapshot:
+                offset = int(snapshot.get("journal_offset", 0))
+                covered_sessions, covered_seconds = covered(offset)
+                base_seconds += max(0, int(snapshot.get("total_seconds", 0)) - covered_seconds)
+                base_sessions += max(0, int(snapshot.get("sessions", 0)) - covered_sessions)
+            if snapshot or base_sessions or base_seconds:
+                db.execute(SQL_SET_META, ("baseline_seconds", str(base_seconds)))
+                db.execute(SQL_SET_META, ("baseline_sessions", str(base_sessions)))
+
+            backup_files = sorted(glob.glob(os.path.join(backup_dir, "settings_backup_*.json"))) if backup_dir else []
+            for backup_file in backup_files:
+                data = json_store.load(backup_file)
+                if data is None:
+                    continue
+                stamp = os.path.basename(backup_file)[len("settings_backup_"):-len(".json")]
+                try:
+                    saved_at = datetime.strptime(stamp, "%Y%m%d_%H%M%S").timestamp()
+                except ValueError:
+                    saved_at = os.path.getmtime(backup_file)
+                db.execute(SQL_ADD_SETTINGS_HISTORY, (saved_at, json.dumps(data, ensure_ascii=False)))
+                counts["settings_history"] += 1
+
+            db.execute(SQL_SET_META, ("json_imported", time.strftime("%Y-%m-%d %H:%M:%S")))
+        log.info("기존 JSON 파일 가져오기 완료: %s", counts)
+        return counts
+
+    def close(self):
+        """연결 닫기 (WAL 내용을 본 파일에 반영)"""
+        with self._lock:
+            try:
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            finally:
+                self._conn.close()
+
+
+def _read_journal(journal_path):
+    """저널 파일의 완전한 세션 목록, 정리로 옮긴 누적값 (세션 수, 초),
+    (바이트 위치 -> 그 위치까지의 세션 수/합계, base 줄 포함) 함수"""
+    records = []
+    ends = []  # 각 기록이 끝나는 바이트 위치
+    if journal_path and os.path.exists(journal_path):
+        position = 0
+        with open(journal_path, 'rb') as f:
+            for line in f:
+                position += len(line)
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    records.append(json.loads(line))
+                    ends.append(position)
+                except ValueError:
+                    continue
+
+    def covered(offset):
+        count = seconds = 0
+        for record, end in zip(records, ends):
+            if end > offset:
+                break
+            if "base" in record:
+                count += int(record.get("n", 0))
+                seconds += int(record["base"])
+            else:
+                count += 1
+                seconds += int(record.get("d", 0))
+        return count, seconds
+
+    base = [record for record in records if "base" in record]
+    sessions = [record for record in records if "base" not in record]
+    return sessions, (sum(int(r.get("n", 0)) for r in base), sum(int(r["base"]) for r in base)), covered
+
+
+class SqliteJournal:
+    """SQLite 휴식 기록 (RestJournal과 같은 인터페이스)
+
+    세션 추가는 행 하나 INSERT, 누적값은 시작할 때 한 번 SUM 후 메모리에서 갱신한다.
+    """
+
+    def __init__(self, store, level_func=None):
+        self.store = store
+        self.level_func = level_func
+        self.load()
+
+    @property
+    def level(self):
+        return self.level_func(self.total_seconds) if self.level_func else None
+
+    def load(self):
+        """누적값 계산 (가져온 예전 기준값 + 세션 합계)"""
+        sessions, seconds = self.store.session_totals()
+        self.total_seconds = int(self.store._get_meta("baseline_seconds", 0)) + int(seconds)
+        self.sessions = int(self.store._get_meta("baseline_sessions", 0)) + int(sessions)
+
+    def refresh(self):
+        """다른 프로세스가 추가한 세션 반영 - 반영한 세션 수"""
+        before = self.sessions
+        self.load()
+        return self.sessions - before
+
+    def append(self, start, duration, meal=False, early=False):
+        """휴식 세션 하나 기록 - 성공하면 True"""
+        try:
+            self.store.add_session(start, duration, meal, early)
+        except Exception as e:
+            log.warning("휴식 기록 저장 실패: %s", e)
+            return False
+        self.total_seconds += int(duration)
+        self.sessions += 1
+        return True
+
+    def compact(self, before, archive):
+        """before 이전 세션을 보관소로 옮김 - 옮긴 세션 수"""
+        return self.store.archive_sessions(before, archive)
+
+    def snapshot(self):
+        """커밋마다 반영되므로 따로 스냅샷이 필요 없음"""
+        return True
+
+    def flush(self):
+        return True
+
+    def iter_sessions(self, start=None, end=None):
+        """기간 [start, end)의 세션 (dict: s, d, m, e)"""
+        return iter(self.store.sessions(start, end))
@@ -0,0 +1,157 @@
+"""
+ClockApp Ver2 - UI 멈춤 감시
+Tk 메인 루프가 주기적으로 beat()를 호출하고, 감시 스레드는 마지막 beat 이후 THRESHOLD_MS가 지나면
+메인 스레드의 현재 스택(sys._current_frames)을 잡아 파일에 남김
+(큰 스트레칭 이미지 LANCZOS 축소, 느린 공유 폴더의 JSON 저장 등 시계를 멈추게 한 코드 경로 확인용)
+
+- 멈춤 하나당 스택은 감지 시점에 한 번만 잡고, 풀리면 전체 멈춤 시간을 기록
+- 파일(ui_stalls.json)에는 최근 MAX_RECORDS개만 보관 (재시작해도 이어서 순환)
+- 절전/최대 절전에서 깨어난 경우처럼 감시 스레드 자신도 늦게 깨어나면 멈춤으로 보지 않음
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+
+import json_store
+
+STALL_FILE_NAME = "ui_stalls.json"
+THRESHOLD_MS = 250     # 이 시간 동안 beat가 없으면 멈춤
+HEARTBEAT_MS = 100     # Tk 쪽 beat() 호출 주기 (기준보다 충분히 짧게)
+MAX_RECORDS = 50       # 파일에 보관할 최근 멈춤 수
+MAX_STACK_DEPTH = 40   # 기록할 스택 깊이 (안쪽부터)
+
+log = logging.getLogger("clockapp.stall_watchdog")
+
+
+def format_stack(frame, limit=MAX_STACK_DEPTH):
+    """프레임의 스택을 "파일:줄 함수 - 코드" 목록으로 (바깥쪽부터)"""
+    lines = []
+    for entry in traceback.extract_stack(frame, limit=limit):
+        text = f"{os.path.basename(entry.filename)}:{entry.lineno} {entry.name}"
+        if entry.line:
+            text += f" - {entry.line}"
+        lines.append(text)
+    return lines
+
+
+class StallWatchdog:
+    """메인 스레드 멈춤 감시 스레드"""
+
+    def __init__(self, path, threshold_ms=THRESHOLD_MS, max_records=MAX_RECORDS, thread_id=None):
+        self.path = path
+        self.threshold = threshold_ms / 1000
+        self.max_records = max_records
+        self.thread_id = thread_id or threading.main_thread().ident
+        self.stats = {"stalls": 0, "longest_ms": 0.0}
+        self._last_beat = time.monotonic()
+        self._stall = None  # 진행 중인 멈춤 기록
+        self._stall_beat = None  # 멈춤 직전 마지막 beat 시각
+        self._resumed = None     # 멈춤 후 첫 beat 시각
+        self._stop = threading.Event()
+        self._thread = None
+        self._records = None
+
+    def beat(self):
+        """메인 루프가 살아 있음 (Tk 스레드에서 주기적으로 호출)"""
+        self._last_beat = time.monotonic()
+        if self._stall is not None and self._resumed is None:
+            self._resumed = self._last_beat
+
+    def start(self):
+        """감시 시작"""
+        if self._thread is not None:
+            return
+        self.records()  # 이전 실행의 기록에 이어서 순환
+        self.beat()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stall-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """감시 종료 (진행 중인 멈춤이 있으면 지금까지의 시간으로 기록)"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout=2)
+        self._thread = None
+
+    def records(self):
+        """파일에 저장된 최근 멈춤 기록"""
+        if self._records is None:
+            try:
+                data = json_store.load(self.path) or {}
+            except (OSError, ValueError) as e:
+                log.warning("UI 멈춤 기록 읽기 실패: %s", e)
+                data = {}
+            self._records = list(data.get("stalls", []))[-self.max_records:]
+        return self._records
+
+    def check(self, now=None):
+        """한 번 확인 - 새 멈춤을 감지하면 그 기록 반환 (감시 스레드에서 주기적으로 호출)"""
+        now = time.monotonic() if now is None else now
+        last_beat = self._last_beat
+        silent = now - last_beat
+        if self._stall is not None:
+            if silent < self.threshold:
+                self._finish(now)
+            return None
+        if silent < self.threshold:
+            return None
+
+        frame = sys._current_frames().get(self.thread_id)
+        stall = {
+            "at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "detected_ms": round(silent * 1000),
+            "duration_ms": None,  # 풀리면 채움 (끝까지 안 풀리면 None으로 남음)
+            "stack": format_stack(frame) if frame is not None else []
+        }
+        self._stall_beat = last_beat
+        self._resumed = None
+        self._stall = stall  # 이후의 beat()부터 멈춤 해제 시각으로 기록
+        self.stats["stalls"] += 1
+        log.warning("UI 멈춤 감지 (%dms): %s", stall["detected_ms"],
+                    stall["stack"][-1] if stall["stack"] else "스택 없음")
+        self._append(stall)
+        return stall
+
+    def _finish(self, now):
+        """멈춤이 풀림 - 전체 시간 기록"""
+        stall, self._stall = self._stall, None
+        # 멈춤 직전 beat부터 멈춤 후 첫 beat까지 (종료 시 아직 멈춰 있으면 지금까지)
+        resumed = self._resumed if self._resumed is not None else now
+        stall["duration_ms"] = round((resumed - self._stall_beat) * 1000)
+        self.stats["longest_ms"] = max(self.stats["longest_ms"], stall["duration_ms"])
+        log.info("UI 멈춤 해제: %dms", stall["duration_ms"])
+        self._save()
+
+    def _append(self, stall):
+        records = self.records()
+        records.append(stall)
+        del records[:-self.max_records]
+        self._save()
+
+    def _save(self):
+        try:
+            json_store.save(self.path, {"stalls": self.records()}, compact=True, backup=False, lock=False)
+        except OSError as e:
+            log.warning("UI 멈춤 기록 저장 실패: %s", e)
+
+    def _run(self):
+        interval = self.threshold / 2
+        last_wake = time.monotonic()
+        while not self._stop.wait(interval):
+            now = time.monotonic()
+            if now - last_wake > self.threshold * 4 and self._stall is None:
+                # 감시 스레드도 늦게 깨어남 - 절전 복귀 등 (앱 멈춤이 아님)
+                self.beat()
+            last_wake = now
+            try:
+                self.check(now)
+            except Exception as e:
+                log.error("UI 멈춤 확인 오류: %s", e)
+        if self._stall is not None:
+            self._finish(time.monotonic())
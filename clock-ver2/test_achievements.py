@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+업적 / 연속 기록 테스트 - 하루 목표와 연속 일수, 끊긴 연속 기록, 마일스톤은 한 번만,
+저장 상태 복원, 처음부터 다시 계산한 결과가 세션마다 갱신한 카운터와 같은지 확인
+"""
+
+import random
+from datetime import datetime
+
+from achievements import AchievementTracker, local_day
+
+
+def at(day, hour=10):
+    """2025-03-<day> <hour>시 epoch"""
+    return datetime(2025, 3, day, hour, 0).timestamp()
+
+
+def test_daily_goal_and_streak():
+    """하루 목표를 연속으로 달성하면 연속 일수 증가, 3일째에 마일스톤"""
+    tracker = AchievementTracker(daily_goal=2)
+    titles = []
+    for day in (1, 2, 3):
+        for hour in (10, 11):
+            titles += [a["title"] for a in tracker.record(at(day, hour), 300)]
+        assert tracker.progress(local_day(at(day)))["goal_met"]
+    progress = tracker.progress(local_day(at(3)))
+    assert progress["streak"] == 3 and progress["today_completed"] == 2
+    assert sum("오늘 목표 달성" in t for t in titles) == 3
+    assert any(a["id"] == "streak-3" for a in tracker.unlocked)
+    print("✅ 하루 목표 / 연속 기록")
+
+
+def test_early_meal_and_broken_streak():
+    """일찍 끝낸 휴식/식사는 목표에 들지 않고, 하루를 건너뛰면 연속 기록이 끊김"""
+    tracker = AchievementTracker(daily_goal=2)
+    tracker.record(at(1, 10), 300)
+    tracker.record(at(1, 11), 120, early=True)
+    tracker.record(at(1, 12), 1800, meal=True)
+    assert tracker.progress(local_day(at(1)))["today_completed"] == 1
+    tracker.record(at(1, 13), 300)
+    assert tracker.streak == 1
+
+    assert tracker.progress(local_day(at(2)))["streak"] == 1   # 어제 달성 - 아직 이어짐
+    assert tracker.progress(local_day(at(3)))["streak"] == 0   # 하루 건너뜀 - 끊김
+    tracker.record(at(3, 10), 300)
+    tracker.record(at(3, 11), 300)
+    assert tracker.streak == 1 and tracker.longest_streak == 1
+    print("✅ 끊긴 연속 기록")
+
+
+def test_milestones_fire_once():
+    """마일스톤은 기준을 넘는 세션에서 한 번만"""
+    tracker = AchievementTracker()
+    fired = []
+    for i in range(60):
+        fired += [a["id"] for a in tracker.record(at(1 + i // 20, 8) + (i % 20) * 600, 600)]
+    assert fired.count("sessions-10") == 1 and fired.count("sessions-50") == 1
+    assert fired.count("hours-1") == 1 and fired.count("hours-5") == 1
+    assert len(tracker.take_unannounced()) == len(fired)
+    assert tracker.take_unannounced() == []
+    print(f"✅ 마일스톤: {sorted(set(i for i in fired if not i.startswith('goal')))}")
+
+
+def test_state_round_trip_and_rebuild():
+    """저장 상태로 이어서 기록한 결과 == 처음부터 다시 계산한 결과"""
+    rng = random.Random(7)
+    records = []
+    start = datetime(2025, 1, 1, 9, 0).timestamp()
+    for _ in range(400):
+        start += rng.choice((1800, 3600, 7200, 86400))
+        records.append({"s": start, "d": rng.randint(0, 900), "m": rng.random() < 0.05,
+                        "e": rng.random() < 0.2})
+
+    tracker = AchievementTracker(daily_goal=3)
+    for i, r in enumerate(records):
+        if i == 200:  # 중간에 저장했다가 복원 (앱 재시작)
+            tracker = AchievementTracker.from_state(tracker.export_state(), daily_goal=3)
+        tracker.record(r["s"], r["d"], meal=r["m"], early=r["e"])
+
+    rebuilt = AchievementTracker.rebuild(records, daily_goal=3)
+    assert rebuilt.export_state() == tracker.export_state()
+    assert rebuilt.unannounced == []
+    assert AchievementTracker.from_state(tracker.export_state(), daily_goal=4) is None  # 목표가 바뀌면 다시 계산
+    print(f"✅ 복원/재계산 일치: 최장 {rebuilt.longest_streak}일, 업적 {len(rebuilt.unlocked)}개")
+
+
+if __name__ == "__main__":
+    test_daily_goal_and_streak()
+    test_early_meal_and_broken_streak()
+    test_milestones_fire_once()
+    test_state_round_trip_and_rebuild()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로그 테스트 - 기록은 백그라운드 스레드가 파일에 쓰고, DEBUG가 꺼져 있으면 메시지를 만들지도 않으며,
+크기 기준으로 순환하는지 확인
+"""
+
+import glob
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+import app_log
+
+
+class Expensive:
+    """문자열로 만들 때마다 횟수를 셈"""
+    formatted = 0
+
+    def __str__(self):
+        Expensive.formatted += 1
+        return "expensive"
+
+
+def read_log(folder):
+    with open(os.path.join(folder, app_log.LOG_FILE_NAME), encoding="utf-8") as f:
+        return f.read()
+
+
+def test_background_writer_and_levels():
+    folder = tempfile.mkdtemp()
+    try:
+        app_log.setup(folder, debug=False, console=False)
+        log = app_log.get_logger("test")
+        writer_threads = set()
+
+        class ThreadRecorder(logging.Handler):
+            def emit(self, record):
+                writer_threads.add(threading.get_ident())
+
+        app_log._listener.handlers += (ThreadRecorder(),)
+
+        log.debug("안 보임 %s", Expensive())  # 인자 객체는 만들어지지만 문자열로 바꾸지 않음
+        assert Expensive.formatted == 0 and not app_log.debug_enabled()
+        log.info("휴식 세션 기록: %s초", 30)
+        app_log.set_debug(True)
+        log.debug("보임 %s", Expensive())
+
+        started = time.perf_counter()
+        for i in range(2000):
+            log.info("반복 %d", i)
+        elapsed = time.perf_counter() - started
+
+        app_log.shutdown()  # 큐에 남은 기록 모두 쓰기
+        text = read_log(folder)
+        assert "휴식 세션 기록: 30초" in text and "보임 expensive" in text and "안 보임" not in text
+        assert "clockapp.test" in text and "반복 1999" in text
+        assert writer_threads and threading.get_ident() not in writer_threads
+        print(f"✅ 백그라운드 기록: 2000줄 넣기 {elapsed * 1000:.1f}ms")
+    finally:
+        app_log.shutdown()
+        app_log.set_debug(False)
+        shutil.rmtree(folder)
+
+
+def test_rotation():
+    folder = tempfile.mkdtemp()
+    try:
+        app_log.setup(folder, console=False, max_bytes=4096, backup_count=2)
+        log = app_log.get_logger()
+        for i in range(500):
+            log.info("순환 테스트 %04d %s", i, "x" * 40)
+        app_log.shutdown()
+        files = sorted(glob.glob(os.path.join(folder, app_log.LOG_FILE_NAME + "*")))
+        assert len(files) == 3, files  # clockapp.log + .1 + .2
+        assert all(os.path.getsize(path) <= 4096 for path in files)
+        assert "순환 테스트 0499" in read_log(folder)
+        print(f"✅ 크기 기준 순환: {[os.path.basename(path) for path in files]}")
+    finally:
+        app_log.shutdown()
+        shutil.rmtree(folder)
+
+
+if __name__ == "__main__":
+    test_background_writer_and_levels()
+    test_rotation()
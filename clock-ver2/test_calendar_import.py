@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+회의 캘린더 (.ics) 가져오기 테스트
+반복 일정 전개, 예외 회차, 휴식 알림 억제, mtime 기반 재파싱, 대량 일정 성능 확인
+"""
+
+import os
+import tempfile
+import time
+from datetime import datetime
+
+from break_scheduler import BreakScheduler, VirtualClock
+from calendar_import import IcsCalendar, parse_ics
+
+SAMPLE_ICS = """BEGIN:VCALENDAR
+VERSION:2.0
+BEGIN:VEVENT
+UID:standup
+SUMMARY:팀 스탠드업
+DTSTART:20250106T100000
+DTEND:20250106T101500
+RRULE:FREQ=WEEKLY;BYDAY=MO,WE,FR
+EXDATE:20250108T100000
+END:VEVENT
+BEGIN:VEVENT
+UID:standup
+RECURRENCE-ID:20250110T100000
+SUMMARY:팀 스탠드업 (변경)
+DTSTART:20250110T110000
+DURATION:PT30M
+END:VEVENT
+BEGIN:VEVENT
+UID:review
+SUMMARY:월간 리뷰
+DTSTART:20250101T150000
+DTEND:20250101T160000
+RRULE:FREQ=MONTHLY;BYDAY=-1FR;COUNT=3
+END:VEVENT
+BEGIN:VEVENT
+UID:holiday
+SUMMARY:휴가
+DTSTART;VALUE=DATE:20250107
+DTEND;VALUE=DATE:20250108
+END:VEVENT
+END:VCALENDAR
+"""
+
+
+def write_ics(text):
+    handle, path = tempfile.mkstemp(suffix=".ics")
+    with os.fdopen(handle, 'w', encoding='utf-8') as f:
+        f.write(text)
+    return path
+
+
+def at(*args):
+    return datetime(*args).timestamp()
+
+
+def test_recurrence_expansion():
+    """반복 규칙, EXDATE, RECURRENCE-ID, 종일 일정 제외"""
+    path = write_ics(SAMPLE_ICS)
+    try:
+        clock = VirtualClock(datetime(2025, 1, 6, 9, 0))
+        calendar = IcsCalendar(path, window_days=60, clock=clock)
+
+        assert calendar.find(at(2025, 1, 6, 10, 5)) == (("calendar", "팀 스탠드업"),)
+        assert calendar.find(at(2025, 1, 8, 10, 5)) == ()                 # EXDATE
+        assert calendar.find(at(2025, 1, 10, 10, 5)) == ()                # 옮겨진 회차
+        assert calendar.find(at(2025, 1, 10, 11, 20)) == (("calendar", "팀 스탠드업 (변경)"),)
+        assert calendar.find(at(2025, 1, 7, 12, 0)) == ()                 # 종일 일정은 무시
+        assert calendar.find(at(2025, 1, 31, 15, 30)) == (("calendar", "월간 리뷰"),)  # 마지막 금요일
+        assert calendar.run_end(at(2025, 1, 13, 10, 0)) == at(2025, 1, 13, 10, 15)
+        print(f"✅ 반복 일정 전개: {calendar.stats}")
+    finally:
+        os.remove(path)
+
+
+def test_scheduler_suppression():
+    """회의 중 도래한 휴식은 회의가 끝난 뒤로 미뤄짐"""
+    path = write_ics(SAMPLE_ICS)
+    try:
+        clock = VirtualClock(datetime(2025, 1, 6, 9, 50))
+        scheduler = BreakScheduler({
+            "time_interval": 20,
+            "lunch_enabled": False,
+            "dinner_enabled": False,
+            "calendar_ics_path": path
+        }, clock=clock)
+
+        # 10:10 휴식 예정 -> 스탠드업(10:00~10:15) 중이므로 10:15로
+        clock.set(scheduler.next_deadline())
+        assert scheduler.poll() == []
+        assert scheduler.active_suppressions() == (("calendar", "팀 스탠드업"),)
+        assert scheduler.next_deadline() == at(2025, 1, 6, 10, 15)
+        clock.set(scheduler.next_deadline())
+        assert [kind for kind, _ in scheduler.poll()] == ["break"]
+        print("✅ 회의 중 휴식 억제")
+    finally:
+        os.remove(path)
+
+
+def test_reparse_only_on_mtime_change():
+    """파일이 바뀌었을 때만 다시 파싱"""
+    path = write_ics(SAMPLE_ICS)
+    try:
+        clock = VirtualClock(datetime(2025, 1, 6, 9, 0))
+        calendar = IcsCalendar(path, clock=clock)
+        for _ in range(10):
+            clock.advance(3600)
+            calendar.find(clock.time())
+        assert calendar.stats["parses"] == 1
+
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(SAMPLE_ICS.replace("팀 스탠드업", "데일리"))
+        os.utime(path, (time.time() + 10, time.time() + 10))
+        clock.set(at(2025, 1, 13, 10, 0))
+        assert calendar.find(clock.time()) == (("calendar", "데일리"),)
+        assert calendar.stats["parses"] == 2
+        print(f"✅ mtime 기반 재파싱: {calendar.stats}")
+    finally:
+        os.remove(path)
+
+
+def test_many_recurring_events():
+    """반복 일정 수천 개 - 오래된 일정도 빠르게 전개되고 조회는 O(log n)"""
+    lines = ["BEGIN:VCALENDAR"]
+    for i in range(3000):
+        hour, minute = 8 + i % 10, (i * 7) % 60
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:event-{i}",
+            f"SUMMARY:회의 {i}",
+            f"DTSTART:2015{1 + i % 12:02d}01T{hour:02d}{minute:02d}00",
+            "DURATION:PT30M",
+            ["RRULE:FREQ=WEEKLY;BYDAY=MO,TH", "RRULE:FREQ=DAILY;INTERVAL=3",
+             "RRULE:FREQ=MONTHLY;BYMONTHDAY=-1"][i % 3],
+            "END:VEVENT"
+        ]
+    lines.append("END:VCALENDAR")
+    path = write_ics("\n".join(lines))
+    try:
+        clock = VirtualClock(datetime(2025, 1, 6, 9, 0))
+        calendar = IcsCalendar(path, clock=clock)
+        started = time.perf_counter()
+        calendar.refresh()
+        build = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for minute in range(14 * 24 * 60):
+            calendar.find(clock.time() + minute * 60)
+        lookup = (time.perf_counter() - started) / (14 * 24 * 60)
+
+        # 윈도우 절반이 지나면 이어서 전개 (다시 파싱하지 않음)
+        clock.advance(8 * 86400)
+        calendar.find(clock.time())
+        assert calendar.stats["parses"] == 1 and calendar.stats["extends"] == 2
+
+        print(f"✅ 반복 일정 3000개: 파싱+전개 {build:.3f}초, 회차 {calendar.stats['occurrences']}개, "
+              f"조회 {lookup * 1e6:.1f}µs")
+        assert build < 5.0, f"전개가 너무 느림: {build:.3f}초"
+    finally:
+        os.remove(path)
+
+
+def test_parse_counts():
+    """취소된 회차는 원래 회차를 지움"""
+    events = parse_ics(SAMPLE_ICS.replace("SUMMARY:팀 스탠드업 (변경)", "SUMMARY:취소\nSTATUS:CANCELLED"))
+    assert len(events) == 2
+    standup = [event for event in events if event.uid == "standup"][0]
+    assert at(2025, 1, 10, 10, 0) in standup.exdates
+    print("✅ 취소된 회차 처리")
+
+
+if __name__ == "__main__":
+    test_recurrence_expansion()
+    test_scheduler_suppression()
+    test_reparse_only_on_mtime_change()
+    test_many_recurring_events()
+    test_parse_counts()
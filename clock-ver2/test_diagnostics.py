@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+진단 정보 테스트 - 메모리/크기 표기, 느린 콜백 기록, 대기 중인 after 콜백의 창별 묶음 확인
+"""
+
+import time
+
+from diagnostics import SlowCallbackLog, format_bytes, pending_after, process_rss, thread_names
+
+
+class FakeTk:
+    """Tcl "after info" 응답만 흉내 내는 인터프리터"""
+
+    def __init__(self, afters):
+        self.afters = afters  # after id -> 명령 이름
+
+    def call(self, *args):
+        if args == ("after", "info"):
+            return tuple(self.afters)
+        return (self.afters[args[2]], "timer")
+
+    def splitlist(self, value):
+        return tuple(value)
+
+
+class FakeWidget:
+    """tkinter 위젯처럼 _tclCommands / children / 최상위 창을 가진 객체"""
+
+    def __init__(self, title, commands=(), children=(), toplevel=None):
+        self._title = title
+        self._tclCommands = list(commands)
+        self.children = {str(i): child for i, child in enumerate(children)}
+        self._toplevel = toplevel
+
+    def winfo_toplevel(self):
+        return self._toplevel or self
+
+    def title(self):
+        return self._title
+
+
+def test_process_info():
+    rss = process_rss()
+    assert rss is None or rss > 1024 * 1024
+    assert format_bytes(None) == "알 수 없음"
+    assert format_bytes(512) == "512 B" and format_bytes(42 * 1024 * 1024) == "42.0 MB"
+    assert "MainThread" in thread_names()
+    print(f"✅ 메모리 {format_bytes(rss)}, 스레드 {len(thread_names())}개")
+
+
+def test_slow_callbacks():
+    slow = SlowCallbackLog(threshold_ms=50, keep=3)
+    slow.record("update_clock", 0.002)  # 기준 미만은 버림
+    for i in range(5):
+        slow.record(f"update_timer {i}", 0.08)
+    recent = slow.recent()
+    assert slow.total == 5 and len(recent) == 3
+    assert recent[0][1] == "update_timer 4" and abs(recent[0][2] - 80) < 1e-6
+    assert recent[0][0] <= time.time()
+    print("✅ 느린 콜백 최근 기록")
+
+
+def test_pending_after_by_window():
+    root = FakeWidget("ClockApp Ver2", commands=["140001_fire", "140002<lambda>"])
+    popup = FakeWidget("휴식 시간", commands=["140003update_timer"])
+    button = FakeWidget("", commands=["140004close_popup"], toplevel=popup)
+    popup.children = {"button": button}
+    root.children = {"popup": popup}
+    root.tk = FakeTk({"after#1": "140001_fire", "after#2": "140003update_timer",
+                      "after#3": "140004close_popup", "after#4": "140003update_timer",
+                      "after#5": "999unknown"})
+
+    windows = pending_after(root)
+    assert windows == {
+        "ClockApp Ver2": ["_fire"],
+        "휴식 시간": ["update_timer", "close_popup", "update_timer"],
+        "(기타)": ["unknown"]
+    }, windows
+    print(f"✅ 창별 after 콜백: {windows}")
+
+
+if __name__ == "__main__":
+    test_process_info()
+    test_slow_callbacks()
+    test_pending_after_by_window()
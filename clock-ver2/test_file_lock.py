@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+프로세스 간 파일 잠금 스트레스 테스트 - 같은 프로필을 여러 프로세스가 동시에 써도
+total_seconds와 설정 갱신이 사라지지 않는지, 세대 번호로 바뀐 파일만 다시 읽는지 확인
+"""
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+
+import json_store
+from file_lock import FileLock, LockTimeout, lock_for
+from rest_journal import RestJournal
+
+WORKERS = 8
+ROUNDS = 40
+
+
+def increment_worker(path, rounds):
+    """설정 파일의 카운터를 잠금 안에서 읽고-고치고-저장"""
+    def bump(data):
+        data["count"] += 1
+        return data
+
+    for _ in range(rounds):
+        json_store.update(path, bump, default={"count": 0}, indent=4)
+
+
+def journal_worker(folder, worker, rounds):
+    """각 프로세스가 자기 RestJournal로 세션 추가 (스냅샷도 자주)"""
+    journal = RestJournal(os.path.join(folder, "rest_journal.jsonl"),
+                          os.path.join(folder, "rest_level_data.json"), snapshot_every=7)
+    for i in range(rounds):
+        journal.append(1700000000 + worker * 100000 + i * 600, worker + 1)
+    journal.flush()
+
+
+def hold_lock_worker(path, ready, release):
+    with lock_for(path):
+        ready.set()
+        release.wait(5)
+
+
+def run_workers(target, args_list):
+    processes = [multiprocessing.Process(target=target, args=args) for args in args_list]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(60)
+        assert process.exitcode == 0, f"작업 프로세스 실패: {process.exitcode}"
+
+
+def test_concurrent_updates():
+    """여러 프로세스의 읽고-고치고-저장이 하나도 사라지지 않음"""
+    folder = tempfile.mkdtemp()
+    try:
+        path = os.path.join(folder, "clock_settings_ver2.json")
+        started = time.perf_counter()
+        run_workers(increment_worker, [(path, ROUNDS)] * WORKERS)
+        elapsed = time.perf_counter() - started
+        assert json_store.load(path, strict=True) == {"count": WORKERS * ROUNDS}
+        assert lock_for(path).read_generation() == WORKERS * ROUNDS
+        print(f"✅ 동시 갱신 {WORKERS}x{ROUNDS}: 손실 없음 ({elapsed:.2f}s)")
+    finally:
+        shutil.rmtree(folder)
+
+
+def test_concurrent_journal():
+    """여러 프로세스가 같은 저널에 추가하고 스냅샷을 남겨도 누적값이 정확함"""
+    folder = tempfile.mkdtemp()
+    try:
+        run_workers(journal_worker, [(folder, worker, ROUNDS) for worker in range(WORKERS)])
+        expected = sum(worker + 1 for worker in range(WORKERS)) * ROUNDS
+
+        journal = RestJournal(os.path.join(folder, "rest_journal.jsonl"),
+                              os.path.join(folder, "rest_level_data.json"))
+        assert journal.total_seconds == expected and journal.sessions == WORKERS * ROUNDS
+        assert len(list(journal.iter_sessions())) == WORKERS * ROUNDS
+
+        # 다른 프로세스가 나중에 추가한 세션은 refresh()로 반영
+        run_workers(journal_worker, [(folder, 0, 3)])
+        assert journal.refresh() == 3 and journal.total_seconds == expected + 3
+        print(f"✅ 동시 저널 기록: {journal.sessions} 세션, {journal.total_seconds}초")
+    finally:
+        shutil.rmtree(folder)
+
+
+def test_generation_detects_same_size_rewrite():
+    """크기와 mtime이 같아도 세대 번호가 바뀌면 다시 읽고, 그대로면 파싱하지 않음"""
+    folder = tempfile.mkdtemp()
+    try:
+        path = os.path.join(folder, "rest_messages.json")
+        json_store.save(path, {"used_messages": ["a"]})
+        st = os.stat(path)
+        reads = json_store.stats["reads"]
+        for _ in range(50):
+            assert json_store.load(path) == {"used_messages": ["a"]}
+        assert json_store.stats["reads"] == reads
+
+        # 다른 프로세스가 같은 크기로 덮어쓰고 mtime 해상도 때문에 시각도 같은 경우
+        raw = json_store.encode({"used_messages": ["b"]})
+        with lock_for(path) as lock:
+            with open(path, 'wb') as f:
+                f.write(raw)
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+            lock.bump_generation()
+        assert os.path.getsize(path) == st.st_size
+        assert json_store.load(path) == {"used_messages": ["b"]}
+        print("✅ 세대 번호로 변경 감지")
+    finally:
+        shutil.rmtree(folder)
+
+
+def test_lock_timeout():
+    """다른 프로세스가 잠금을 놓지 않으면 시간 초과"""
+    folder = tempfile.mkdtemp()
+    try:
+        path = os.path.join(folder, "clock_settings_ver2.json")
+        ready, release = multiprocessing.Event(), multiprocessing.Event()
+        holder = multiprocessing.Process(target=hold_lock_worker, args=(path, ready, release))
+        holder.start()
+        assert ready.wait(10)
+        try:
+            with FileLock(path, timeout=0.2):
+                raise AssertionError("잠금이 겹쳐서 잡힘")
+        except LockTimeout:
+            pass
+        finally:
+            release.set()
+            holder.join(10)
+        with FileLock(path, timeout=2):
+            pass
+        print("✅ 잠금 시간 초과")
+    finally:
+        shutil.rmtree(folder)
+
+
+if __name__ == "__main__":
+    test_concurrent_updates()
+    test_concurrent_journal()
+    test_generation_detects_same_size_rewrite()
+    test_lock_timeout()
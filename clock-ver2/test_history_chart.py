@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+휴식 기록 차트 테스트 - 이미지 크기, 같은 크기/기간은 캐시된 층 재사용, 몇 년치 기록도 빠르게 그림
+"""
+
+import random
+import time
+from datetime import date
+
+from history_chart import HistoryChart, nice_ceiling
+
+
+def make_chart(years=6):
+    rng = random.Random(3)
+    return HistoryChart(date(2019, 1, 1), [rng.randint(0, 3600) for _ in range(365 * years)])
+
+
+def test_render_size_and_cache():
+    """창 크기를 바꿨다 돌아오면 다시 그리지 않고, 데이터가 바뀌면 데이터 층만 다시 그림"""
+    chart = make_chart()
+    assert chart.render(720, 320).size == (720, 320)
+    drawn = chart.stats["layers_drawn"]
+    chart.render(900, 400)
+    chart.render(720, 320)
+    assert chart.stats["layers_drawn"] == drawn + 2  # 900x400의 배경/데이터 층만
+
+    chart.set_series(chart.first_day, [60] * len(chart.minutes))
+    drawn = chart.stats["layers_drawn"]
+    chart.render(720, 320)
+    assert chart.stats["layers_drawn"] == drawn + 2  # y축 최대값이 바뀌어 배경도 다시 그림
+    print(f"✅ 층 캐시: {chart.stats}")
+
+
+def test_multi_year_speed():
+    """6년치 (약 2200일) - 크기마다 새로 그려도 수십 ms 이내"""
+    chart = make_chart()
+    started = time.perf_counter()
+    for width in range(400, 1400, 100):
+        chart.render(width, 360)
+    elapsed = (time.perf_counter() - started) / 10
+    for days in (92, 366, None):
+        chart.render(760, 330, days=days)
+    print(f"✅ 6년치 차트: 크기별 {elapsed * 1000:.1f}ms")
+    assert elapsed < 0.1, f"차트 그리기가 너무 느림: {elapsed:.3f}초"
+
+
+def test_empty_and_ticks():
+    assert HistoryChart(date(2025, 1, 1), []).render(300, 200).size == (300, 200)
+    assert [nice_ceiling(v) for v in (0, 7, 42, 60, 130)] == [10, 8, 50, 60, 150]
+    print("✅ 빈 기록 / 눈금")
+
+
+if __name__ == "__main__":
+    test_render_size_and_cache()
+    test_multi_year_speed()
+    test_empty_and_ticks()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JSON 파일 저장소 테스트 - 체크섬 검증, 잘린/손상된 파일 감지와 백업 복구, 변경 없는 파일 재파싱 없음
+"""
+
+import json
+import os
+import shutil
+import tempfile
+
+import json_store
+
+
+def test_checksum_roundtrip():
+    """들여쓰기/공백 없는 형식 모두 체크섬 포함 저장 후 그대로 복원"""
+    folder = tempfile.mkdtemp()
+    try:
+        data = {"level": 7, "total_seconds": 12345, "메시지": ["휴식", "식사"]}
+        for options in ({}, {"indent": 4}, {"compact": True}):
+            path = os.path.join(folder, "state.json")
+            json_store.save(path, data, **options)
+            with open(path, 'r', encoding='utf-8') as f:
+                raw = json.load(f)
+            assert json_store.CHECKSUM_KEY in raw
+            json_store.invalidate()
+            assert json_store.load(path, strict=True) == data
+
+        json_store.save(path, {})
+        json_store.invalidate()
+        assert json_store.load(path, strict=True) == {}
+        print("✅ 체크섬 저장/복원")
+    finally:
+        shutil.rmtree(folder)
+
+
+def test_corruption_falls_back_to_backup():
+    """잘렸거나 값이 바뀐 파일은 감지하고 이전 파일(.bak)로 복구"""
+    folder = tempfile.mkdtemp()
+    try:
+        path = os.path.join(folder, "rest_level_data.json")
+        json_store.save(path, {"level": 3, "total_seconds": 200})
+        json_store.save(path, {"level": 4, "total_seconds": 300})
+
+        with open(path, 'rb') as f:
+            raw = f.read()
+        with open(path, 'wb') as f:
+            f.write(raw[:len(raw) // 2])  # 쓰는 도중 종료
+        json_store.invalidate()
+        assert json_store.load(path, strict=True) == {"level": 3, "total_seconds": 200}
+
+        with open(path, 'wb') as f:
+            f.write(raw.replace(b"300", b"900"))  # JSON은 정상이지만 내용 손상
+        json_store.invalidate()
+        assert json_store.load(path, strict=True) == {"level": 3, "total_seconds": 200}
+        # 사용자가 직접 고칠 수 있는 파일은 경고만 하고 그대로 사용
+        assert json_store.load(path)["total_seconds"] == 900
+
+        os.remove(path + ".bak")
+        json_store.invalidate()
+        with open(path, 'wb') as f:
+            f.write(raw[:10])
+        assert json_store.load(path, default={"level": 1}, strict=True) == {"level": 1}
+        print(f"✅ 손상 감지 및 백업 복구: {json_store.stats['corrupt']}회 감지")
+    finally:
+        shutil.rmtree(folder)
+
+
+def test_legacy_and_unchanged():
+    """체크섬 없는 예전 파일은 그대로 읽고, 바뀌지 않은 파일은 다시 파싱하지 않음"""
+    folder = tempfile.mkdtemp()
+    try:
+        path = os.path.join(folder, "clock_settings_ver2.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"time_interval": 20}, f)
+
+        reads = json_store.stats["reads"]
+        first = json_store.load(path, strict=True)
+        first["time_interval"] = 99
+        for _ in range(100):
+            assert json_store.load(path, strict=True) == {"time_interval": 20}
+        assert json_store.stats["reads"] == reads + 1
+
+        json_store.save(os.path.join(folder, "새 폴더", "a.json"), {"x": 1})
+        assert not os.path.exists(os.path.join(folder, "새 폴더", "a.json.tmp"))
+        assert json_store.load(os.path.join(folder, "missing.json")) is None
+        print(f"✅ 예전 형식 호환 + 재파싱 없음: {json_store.stats}")
+    finally:
+        shutil.rmtree(folder)
+
+
+if __name__ == "__main__":
+    test_checksum_roundtrip()
+    test_corruption_falls_back_to_backup()
+    test_legacy_and_unchanged()
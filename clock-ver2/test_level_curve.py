@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+레벨 곡선 엔진 테스트 - 기존 2배 곡선과 결과가 같은지, 설정 곡선과 조회 성능 확인
+"""
+
+import time
+
+from level_curve import make_curve
+
+
+def legacy_level(total_seconds):
+    """기존 calculate_level_from_seconds (2배 반복문)"""
+    level = 1
+    required_seconds = 30
+    accumulated_seconds = 0
+    while accumulated_seconds + required_seconds <= total_seconds:
+        accumulated_seconds += required_seconds
+        level += 1
+        required_seconds *= 2
+    return level, accumulated_seconds
+
+
+def test_doubling_matches_legacy():
+    """기본 곡선은 기존 계산과 완전히 같아야 함"""
+    curve = make_curve()
+    for total in list(range(0, 5000)) + [30690, 30689, 10 ** 6, 10 ** 8]:
+        assert curve.level_for(total) == legacy_level(total), total
+    for level in range(1, 30):
+        assert curve.required_for(level) == 30 * 2 ** (level - 1)
+    print(f"✅ 2배 곡선 호환: {len(curve)}레벨 기준표")
+
+
+def test_configured_curves():
+    """linear / polynomial / table 곡선"""
+    linear = make_curve({"type": "linear", "base": 30, "step": 30})
+    assert linear.level_for(89) == (2, 30)
+    assert linear.level_for(90) == (3, 90)
+
+    polynomial = make_curve({"type": "polynomial", "base": 30, "exponent": 2})
+    assert [polynomial.required_for(level) for level in (1, 2, 3)] == [30, 120, 270]
+    assert polynomial.level_for(150) == (3, 150)
+
+    table = make_curve({"type": "table", "steps": [10, 20, 60]})
+    assert table.level_for(29) == (2, 10)
+    assert table.level_for(90) == (4, 90)
+    assert table.level_for(150) == (5, 150)  # 마지막 값 반복
+
+    fallback = make_curve({"type": "table", "steps": []})
+    assert fallback.name == "doubling"
+    print("✅ 설정 곡선")
+
+
+def test_lookup_speed():
+    """매 초 조회 비용 - 기준표 조회는 레벨이 높아도 일정"""
+    curve = make_curve({"type": "linear", "base": 30, "step": 5})
+    started = time.perf_counter()
+    for total in range(0, 10 ** 8, 1000):
+        curve.level_for(total)
+    elapsed = (time.perf_counter() - started) / 10 ** 5
+    print(f"✅ 조회 {elapsed * 1e6:.2f}µs/회 ({len(curve)}레벨 기준표)")
+    assert elapsed < 20e-6
+
+
+if __name__ == "__main__":
+    test_doubling_matches_legacy()
+    test_configured_curves()
+    test_lookup_speed()
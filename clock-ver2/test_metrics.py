@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+성능 지표 테스트 - Prometheus 텍스트 형식, 히스토그램 누적 버킷, 수집 시점 콜백,
+localhost HTTP 서버 응답 확인
+"""
+
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from metrics import CONTENT_TYPE, CallbackMetric, MetricsServer, Registry
+from tick_timer import LatencyHistogram
+
+
+def test_counter_gauge_render():
+    registry = Registry()
+    popups = registry.counter("clockapp_popups_total", "팝업 횟수", ("kind", "event"))
+    popups.inc(kind="break", event="shown")
+    popups.inc(kind="break", event="shown")
+    popups.inc(kind='say "hi"\\', event="dismissed")
+    assert registry.counter("clockapp_popups_total", "팝업 횟수", ("kind", "event")) is popups
+    registry.gauge("clockapp_ratio", "비율").set(0.75)
+    try:
+        popups.inc(kind="break")
+        assert False, "레이블이 빠지면 오류"
+    except ValueError:
+        pass
+
+    text = registry.render()
+    assert text.endswith("\n")
+    assert "# TYPE clockapp_popups_total counter" in text
+    assert 'clockapp_popups_total{kind="break",event="shown"} 2' in text
+    assert 'clockapp_popups_total{kind="say \\"hi\\"\\\\",event="dismissed"} 1' in text
+    assert "clockapp_ratio 0.75" in text
+    print("✅ 카운터/게이지 텍스트 형식")
+
+
+def test_histogram_buckets_and_timing():
+    registry = Registry()
+    seconds = registry.histogram("clockapp_tk_callback_seconds", "콜백 시간", ("callback",), buckets=(0.01, 0.1, 1))
+    for value in (0.005, 0.05, 0.05, 5):
+        seconds.observe(value, callback="update_clock")
+
+    @seconds.timed(callback="update_timer")
+    def update_timer():
+        time.sleep(0.002)
+
+    update_timer()
+    text = registry.render()
+    assert 'clockapp_tk_callback_seconds_bucket{callback="update_clock",le="0.01"} 1' in text
+    assert 'clockapp_tk_callback_seconds_bucket{callback="update_clock",le="0.1"} 3' in text
+    assert 'clockapp_tk_callback_seconds_bucket{callback="update_clock",le="1"} 3' in text
+    assert 'clockapp_tk_callback_seconds_bucket{callback="update_clock",le="+Inf"} 4' in text
+    assert 'clockapp_tk_callback_seconds_count{callback="update_clock"} 4' in text
+    count, total = seconds.summary(callback="update_timer")
+    assert count == 1 and total >= 0.002
+    print("✅ 히스토그램 누적 버킷 / 데코레이터 시간 기록")
+
+
+def test_callback_metrics():
+    registry = Registry()
+    lateness = LatencyHistogram()
+    for value_ms in (0.5, 3, 30, 9000):
+        lateness.record(value_ms)
+    registry.register(CallbackMetric("clockapp_tick_lateness_seconds", "histogram", "틱 지연",
+                                     lateness.prometheus_samples))
+    writes = {"writes": 0}
+    registry.register(CallbackMetric("clockapp_file_writes_total", "counter", "쓰기 횟수",
+                                     lambda: [("", {}, writes["writes"])]))
+    registry.register(CallbackMetric("clockapp_broken", "gauge", "실패하는 콜백", lambda: 1 / 0))
+
+    writes["writes"] = 7  # 수집할 때 읽으므로 등록 후 바뀐 값이 보여야 함
+    text = registry.render()
+    assert "clockapp_file_writes_total 7" in text
+    assert 'clockapp_tick_lateness_seconds_bucket{le="0.001"} 1' in text
+    assert 'clockapp_tick_lateness_seconds_bucket{le="0.005"} 2' in text
+    assert 'clockapp_tick_lateness_seconds_bucket{le="+Inf"} 4' in text
+    assert "clockapp_tick_lateness_seconds_count 4" in text
+    assert "clockapp_broken" not in text  # 실패한 지표만 빠짐
+    print("✅ 수집 시점 콜백 지표")
+
+
+def test_localhost_server():
+    registry = Registry()
+    counter = registry.counter("clockapp_weather_cache_lookups_total", "캐시 조회", ("result",))
+    server = MetricsServer(registry, 0)
+    port = server.start()
+    try:
+        assert server.host == "127.0.0.1" and port > 0
+
+        # 다른 스레드에서 값을 올리는 동안 수집
+        workers = [threading.Thread(target=lambda: [counter.inc(result="hit") for _ in range(1000)])
+                   for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+            body = response.read().decode("utf-8")
+        assert 'clockapp_weather_cache_lookups_total{result="hit"} 4000' in body
+
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=5)
+            assert False, "/metrics 외에는 404"
+        except urllib.error.HTTPError as e:
+            assert e.code == 404
+        print(f"✅ localhost 지표 서버 (포트 {port})")
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    test_counter_gauge_render()
+    test_histogram_buckets_and_timing()
+    test_callback_metrics()
+    test_localhost_server()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+알림 큐 테스트 - 한 번에 팝업 하나만 표시되고, 겹치는 알림은 합치거나 버리는지 확인
+"""
+
+from notification_queue import NotificationQueue
+
+
+class FakePopups:
+    """팝업 대신 표시 기록만 남기는 가짜 표시기"""
+
+    def __init__(self):
+        self.shown = []
+        self.open = []
+
+    def show(self, kind, payload):
+        handle = object()
+        self.shown.append((kind, payload))
+        self.open.append(handle)
+        return handle
+
+
+def test_one_popup_at_a_time():
+    """12:10 - 식사와 휴식이 같은 틱에 도래하면 식사만 표시"""
+    popups = FakePopups()
+    queue = NotificationQueue(popups.show)
+
+    queue.push("meal", "점심")
+    assert not queue.push("break", {"name": "휴식", "rest_seconds": 30})
+    assert popups.shown == [("meal", "점심")]
+    assert len(popups.open) == 1
+
+    # 같은 식사 알림 중복 제거
+    assert not queue.push("meal", "점심")
+    queue.done(popups.open[0])
+    assert len(queue) == 0
+    print(f"✅ 한 번에 하나: {queue.stats}")
+
+
+def test_levelup_waits_and_merges():
+    """휴식 중 레벨업은 휴식 팝업이 닫힌 뒤 가장 높은 레벨 하나만 표시"""
+    popups = FakePopups()
+    queue = NotificationQueue(popups.show)
+
+    queue.push("break", {"name": "휴식", "rest_seconds": 30})
+    queue.push("levelup", 3)
+    queue.push("levelup", 4)
+    assert popups.shown == [("break", {"name": "휴식", "rest_seconds": 30})]
+
+    # 휴식 중 다른 휴식 타이머 도래 - 버림
+    assert not queue.push("break", {"name": "눈 휴식", "rest_seconds": 20})
+
+    # 이전 팝업의 늦은 done()은 무시
+    queue.done(object())
+    assert len(popups.shown) == 1
+
+    queue.done(popups.open[0])
+    assert popups.shown[-1] == ("levelup", 4)
+    assert queue.stats == {"shown": 2, "merged": 1, "dropped": 1}
+    print(f"✅ 레벨업 합치기: {queue.stats}")
+
+
+def test_priority_and_dead_popup():
+    """대기 중에는 식사 > 휴식 > 레벨업 순서, 사라진 팝업은 자동 정리"""
+    popups = FakePopups()
+    closed = set()
+    queue = NotificationQueue(popups.show, alive=lambda handle: handle not in closed)
+
+    queue.push("levelup", 2)
+    queue.push("levelup", 5)  # 표시 중인 레벨업과 별개로 대기
+    queue.push("break", {"name": "스트레칭", "rest_seconds": 30})
+    queue.push("break", {"name": "걷기", "rest_seconds": 60})  # 더 긴 휴식으로 합침
+    queue.push("meal", "저녁")  # 대기 중인 휴식은 버림
+    assert popups.shown == [("levelup", 2)]
+
+    # done() 호출 없이 창이 닫혀도 다음 push에서 정리되고 식사 알림부터 표시
+    closed.add(popups.open[0])
+    queue.push("levelup", 3)
+    assert popups.shown[1] == ("meal", "저녁")
+    queue.done(popups.open[1])
+    assert popups.shown[2] == ("levelup", 5)
+    print(f"✅ 우선순위: {[kind for kind, _ in popups.shown]}")
+
+
+if __name__ == "__main__":
+    test_one_popup_at_a_time()
+    test_levelup_waits_and_merges()
+    test_priority_and_dead_popup()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+휴식 기록 분석 테스트 - 열 단위 집계가 세션별 datetime 계산과 같은지, 10만 세션 처리 속도,
+차트용 일별 배열과 LTTB 다운샘플링 확인
+"""
+
+import time
+from datetime import date, datetime, timedelta
+
+import rest_analytics
+from rest_analytics import SessionColumns, lttb
+
+
+def make_records(count, start=datetime(2024, 1, 1, 8, 0)):
+    """테스트용 세션 기록 (저널 형식)"""
+    base = start.timestamp()
+    return [{"s": base + i * 3457.0, "d": 20 + i % 50, "m": int(i % 13 == 0), "e": int(i % 7 == 0)}
+            for i in range(count)]
+
+
+def reference_totals(records):
+    """세션마다 datetime으로 계산한 기준값"""
+    by_day, by_hour = {}, [0] * 24
+    for record in records:
+        when = datetime.fromtimestamp(record["s"])
+        by_day[when.date()] = by_day.get(when.date(), 0) + record["d"]
+        by_hour[when.hour] += record["d"]
+    return by_day, by_hour
+
+
+def test_totals_match_reference():
+    records = make_records(5000)
+    columns = SessionColumns.from_records(records)
+    by_day, by_hour = reference_totals(records)
+
+    assert columns.totals_by_day() == by_day
+    assert columns.totals_by_hour() == by_hour
+    weeks = {}
+    for day, seconds in by_day.items():
+        monday = day - timedelta(days=day.weekday())
+        weeks[monday] = weeks.get(monday, 0) + seconds
+    assert columns.totals_by_week() == weeks
+    expected_rate = 1 - sum(r["e"] for r in records) / len(records)
+    assert abs(columns.completion_rate() - expected_rate) < 1e-9
+    print(f"✅ 집계 일치 ({'NumPy' if rest_analytics.np is not None else '순수 파이썬'})")
+
+
+def test_streaks():
+    columns = SessionColumns()
+    for day in (1, 2, 3, 5, 6, 7, 8, 10, 11):
+        columns.append(datetime(2025, 3, day, 10, 0).timestamp(), 30)
+    columns.append(datetime(2025, 3, 12, 10, 0).timestamp(), 5, early=True)  # 일찍 닫은 날은 제외
+
+    assert columns.streaks(today=date(2025, 3, 11)) == {"current": 2, "longest": 4}
+    assert columns.streaks(today=date(2025, 3, 12)) == {"current": 2, "longest": 4}
+    assert columns.streaks(today=date(2025, 3, 14)) == {"current": 0, "longest": 4}
+    assert SessionColumns().streaks() == {"current": 0, "longest": 0}
+    print("✅ 연속 기록")
+
+
+def test_daily_series():
+    """빈 날은 0으로 채우고, until까지 늘림"""
+    records = make_records(2000)
+    columns = SessionColumns.from_records(records)
+    by_day, _ = reference_totals(records)
+    first, series = columns.daily_series(until=max(by_day) + timedelta(days=5))
+    assert first == min(by_day) and len(series) == (max(by_day) - first).days + 6
+    assert {first + timedelta(days=i): s for i, s in enumerate(series) if s} == by_day
+    assert list(series[-5:]) == [0] * 5
+    print(f"✅ 일별 배열: {len(series)}일")
+
+
+def test_lttb():
+    """처음/끝 유지, 점 수 = threshold, 튀는 값(봉우리)은 남김, 5년치 일별도 빠름"""
+    ys = [10.0] * 3650
+    ys[1234] = 500.0
+    xs = list(range(len(ys)))
+    started = time.perf_counter()
+    indices = lttb(xs, ys, 700)
+    elapsed = time.perf_counter() - started
+    assert len(indices) == 700 and indices[0] == 0 and indices[-1] == len(ys) - 1
+    assert indices == sorted(set(indices))
+    assert 1234 in indices
+    assert lttb(xs[:50], ys[:50], 700) == list(range(50))  # 점이 적으면 그대로
+    print(f"✅ LTTB 3650 -> 700: {elapsed * 1000:.1f}ms")
+    assert elapsed < 0.5
+
+
+def test_speed_100k():
+    columns = SessionColumns.from_records(make_records(100000))
+    started = time.perf_counter()
+    columns.summary()
+    columns.totals_by_hour()
+    elapsed = time.perf_counter() - started
+    print(f"✅ 10만 세션 집계: {elapsed * 1000:.1f}ms")
+    assert elapsed < 0.5, f"집계가 너무 느림: {elapsed:.3f}초"
+
+
+if __name__ == "__main__":
+    test_totals_match_reference()
+    test_streaks()
+    test_daily_series()
+    test_lttb()
+    test_speed_100k()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+휴식 기록 보관소 테스트 - 월별 압축 조각으로 옮긴 뒤에도 누적값 유지, 기간 조회는 겹치는 조각만 읽음,
+저널 정리 후 다른 인스턴스/이전 스냅샷도 같은 누적값, SQLite 백엔드 보관과 동시 정리
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+from datetime import datetime
+
+import json_store
+from rest_archive import RestArchive, archive_cutoff
+from rest_journal import RestJournal
+from sqlite_store import SqliteStore
+
+NOW = datetime(2025, 9, 15, 12, 0).timestamp()
+
+
+def make_journal(folder, **kwargs):
+    return RestJournal(os.path.join(folder, "rest_journal.jsonl"),
+                       os.path.join(folder, "rest_level_data.json"), **kwargs)
+
+
+def fill(journal):
+    """2025-01 ~ 2025-09, 매일 3회 휴식 - (세션 수, 합계)"""
+    count = seconds = 0
+    day = datetime(2025, 1, 1, 9, 0).timestamp()
+    while day < NOW:
+        for i in range(3):
+            journal.append(day + i * 3600, 30 + i)
+            count += 1
+            seconds += 30 + i
+        day += 86400
+    return count, seconds
+
+
+def test_rollover_and_range_query():
+    """오래된 달은 조각으로, 저널은 최근 달만, 기간 조회는 필요한 조각만"""
+    folder = tempfile.mkdtemp()
+    try:
+        journal = make_journal(folder)
+        count, seconds = fill(journal)
+        size_before = os.path.getsize(journal.journal_path)
+        other = make_journal(folder)  # 같은 저널을 쓰는 다른 인스턴스 (다른 프로세스 역할)
+
+        archive = RestArchive(os.path.join(folder, "rest_archive"))
+        cutoff = archive_cutoff(3, now=NOW)
+        assert cutoff == datetime(2025, 7, 1).timestamp()
+        moved = journal.compact(cutoff, archive)
+        assert moved == 3 * 181  # 1월 ~ 6월
+        assert (journal.sessions, journal.total_seconds) == (count, seconds)
+        assert os.path.getsize(journal.journal_path) < size_before / 2
+        assert [seg["month"] for seg in archive.segments] == [f"2025-0{m}" for m in range(1, 7)]
+        assert archive.totals()[0] == moved
+        assert all(s["s"] >= cutoff for s in journal.iter_sessions())
+
+        # 새로 시작해도, 정리 전부터 열려 있던 인스턴스도 같은 누적값
+        assert (make_journal(folder).sessions, make_journal(folder).total_seconds) == (count, seconds)
+        other.append(NOW, 40)
+        assert other.total_seconds == seconds + 40
+        assert make_journal(folder).total_seconds == seconds + 40
+
+        # 3월만 조회하면 3월 조각 하나만 압축 해제
+        fresh = RestArchive(archive.folder)
+        march = list(fresh.query(datetime(2025, 3, 1).timestamp(), datetime(2025, 4, 1).timestamp()))
+        assert len(march) == 93 and fresh.stats["segments_read"] == 1
+        assert len(list(fresh.query())) == moved
+
+        assert journal.compact(cutoff, archive) == 0  # 옮길 것 없으면 첫 세션만 보고 끝
+        print(f"✅ 월별 보관: {moved}개 이동, 저널 {size_before} -> {os.path.getsize(journal.journal_path)} bytes")
+    finally:
+        shutil.rmtree(folder)
+
+
+def test_stale_snapshot_and_interrupted_rollover():
+    """정리 전 스냅샷이 늦게 기록되거나, 조각만 쓰고 종료되어도 누적값/보관 기록이 맞음"""
+    folder = tempfile.mkdtemp()
+    try:
+        journal = make_journal(folder)
+        count, seconds = fill(journal)
+        journal.flush()
+        old_snapshot = json_store.load(journal.snapshot_path)
+
+        archive = RestArchive(os.path.join(folder, "rest_archive"))
+        cutoff = archive_cutoff(3, now=NOW)
+        old_records = [s for s in journal.iter_sessions() if s["s"] < cutoff]
+        archive.add(old_records[:100])  # 조각 일부를 쓰고 저널 정리 전에 종료된 경우
+        journal.compact(cutoff, archive)
+        assert archive.totals()[0] == len(old_records)
+
+        json_store.save(journal.snapshot_path, old_snapshot)  # 다른 프로세스의 늦은 지연 쓰기
+        reloaded = make_journal(folder)
+        assert (reloaded.sessions, reloaded.total_seconds) == (count, seconds)
+        print("✅ 늦은 스냅샷 / 중단된 보관 복구")
+    finally:
+        shutil.rmtree(folder)
+
+
+def test_sqlite_archive():
+    """SQLite 백엔드도 오래된 행을 보관소로 옮기고 누적값 유지"""
+    folder = tempfile.mkdtemp()
+    try:
+        store = SqliteStore(os.path.join(folder, "clock_state.db"))
+        journal = store.journal()
+        count, seconds = fill(journal)
+        archive = RestArchive(os.path.join(folder, "rest_archive"))
+        moved = journal.compact(archive_cutoff(3, now=NOW), archive)
+        assert moved == 3 * 181 and len(store.sessions()) == count - moved
+        assert (store.journal().sessions, store.journal().total_seconds) == (count, seconds)
+        store.close()
+        print("✅ SQLite 보관")
+    finally:
+        shutil.rmtree(folder)
+
+
+def test_concurrent_sqlite_compaction():
+    """두 인스턴스가 동시에 정리해도 한 번만 옮기고 누적값은 그대로 (기준값 이중 합산 없음)"""
+    folder = tempfile.mkdtemp()
+    try:
+        db_path = os.path.join(folder, "clock_state.db")
+        first = SqliteStore(db_path)
+        count, seconds = fill(first.journal())
+        second = SqliteStore(db_path)  # 다른 프로세스처럼 별도 연결
+        cutoff = archive_cutoff(3, now=NOW)
+        moved = []
+        workers = [threading.Thread(target=lambda s=store: moved.append(
+                       s.journal().compact(cutoff, RestArchive(os.path.join(folder, "rest_archive")))))
+                   for store in (first, second)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert sorted(moved) == [0, 3 * 181], moved
+        for store in (first, second):
+            journal = store.journal()
+            assert (journal.sessions, journal.total_seconds) == (count, seconds)
+        assert RestArchive(os.path.join(folder, "rest_archive")).totals()[0] == 3 * 181
+        first.close()
+        second.close()
+        print("✅ 동시 정리 - 한 번만 이동, 누적값 유지")
+    finally:
+        shutil.rmtree(folder)
+
+
+if __name__ == "__main__":
+    test_rollover_and_range_query()
+    test_stale_snapshot_and_interrupted_rollover()
+    test_sqlite_archive()
+    test_concurrent_sqlite_compaction()
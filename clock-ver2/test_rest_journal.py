@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+휴식 기록 저널 테스트 - 추가 전용 기록, 스냅샷 + 꼬리 재생, 잘린 기록 복구, 기존 레벨 파일 호환
+"""
+
+import json
+import os
+import shutil
+import tempfile
+
+from rest_journal import RestJournal
+
+
+def make_journal(folder, **kwargs):
+    return RestJournal(os.path.join(folder, "rest_journal.jsonl"),
+                       os.path.join(folder, "rest_level_data.json"), **kwargs)
+
+
+def test_snapshot_and_tail():
+    """스냅샷 이후 기록만 다시 읽어도 누적값이 같아야 함"""
+    folder = tempfile.mkdtemp()
+    try:
+        journal = make_journal(folder, snapshot_every=5)
+        for i in range(12):
+            journal.append(1700000000 + i * 1200, 30, meal=(i == 3), early=(i % 4 == 0))
+        assert journal.total_seconds == 360 and journal.sessions == 12
+
+        with open(journal.snapshot_path, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+        assert snapshot["sessions"] == 10  # 5개마다 스냅샷
+
+        reloaded = make_journal(folder)
+        assert (reloaded.total_seconds, reloaded.sessions) == (360, 12)
+        assert reloaded._since_snapshot == 2  # 꼬리 2줄만 재생
+        sessions = list(reloaded.iter_sessions())
+        assert len(sessions) == 12 and sessions[3]["m"] == 1 and sessions[4]["e"] == 1
+        print(f"✅ 스냅샷 + 꼬리: {os.path.getsize(journal.journal_path)} bytes / 12 세션")
+    finally:
+        shutil.rmtree(folder)
+
+
+def test_truncated_tail():
+    """쓰는 도중 종료되어 마지막 줄이 잘렸으면 버리고 이어서 기록"""
+    folder = tempfile.mkdtemp()
+    try:
+        journal = make_journal(folder)
+        journal.append(1700000000, 30)
+        with open(journal.journal_path, 'a', encoding='utf-8') as f:
+            f.write('{"s":1700001200,"d":3')
+
+        reloaded = make_journal(folder)
+        assert reloaded.total_seconds == 30
+        reloaded.append(1700002400, 45)
+        assert [s["d"] for s in reloaded.iter_sessions()] == [30, 45]
+        print("✅ 잘린 기록 복구")
+    finally:
+        shutil.rmtree(folder)
+
+
+def test_legacy_level_file():
+    """기존 rest_level_data.json (level, total_seconds)에서 이어서 누적"""
+    folder = tempfile.mkdtemp()
+    try:
+        with open(os.path.join(folder, "rest_level_data.json"), 'w', encoding='utf-8') as f:
+            json.dump({"level": 3, "total_seconds": 200}, f)
+        journal = make_journal(folder, level_func=lambda seconds: 1 + seconds // 100)
+        assert journal.total_seconds == 200
+        journal.append(1700000000, 30)
+        journal.flush()
+
+        with open(journal.snapshot_path, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+        assert snapshot["level"] == 3 and snapshot["total_seconds"] == 230
+        assert make_journal(folder).total_seconds == 230
+        print("✅ 기존 레벨 파일 호환")
+    finally:
+        shutil.rmtree(folder)
+
+
+if __name__ == "__main__":
+    test_snapshot_and_tail()
+    test_truncated_tail()
+    test_legacy_level_file()
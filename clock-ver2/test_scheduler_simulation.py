@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+휴식/식사 스케줄링 엔진 시뮬레이션 테스트 및 벤치마크
+가상 시계로 1년치 스케줄(간격 변경, 식사시간, 날짜 변경)을 재생
+"""
+
+import time
+from datetime import datetime
+
+from break_scheduler import BreakScheduler, VirtualClock
+
+INTERVALS = [20, 45, 30, 60, 15]  # 매주 바뀌는 휴식 간격 (분)
+
+
+def simulate_year(start=datetime(2025, 1, 1, 0, 0)):
+    """1년치 스케줄 시뮬레이션 - (이벤트 목록, 처리한 데드라인 수) 반환"""
+    clock = VirtualClock(start)
+    settings = {
+        "time_interval": INTERVALS[0],
+        "lunch_hour": 12,
+        "lunch_minute": 10,
+        "dinner_hour": 18,
+        "dinner_minute": 0,
+        "break_enabled": True,
+        "lunch_enabled": True,
+        "dinner_enabled": True,
+        "suppression_windows": [
+            {"name": "스탠드업", "start": "09:30", "duration": 15},
+            {"name": "집중 시간", "start": "14:00", "duration": 90}
+        ]
+    }
+    scheduler = BreakScheduler(settings, clock=clock)
+    end = clock.time() + 365 * 24 * 3600
+    next_settings_change = clock.time() + 7 * 24 * 3600
+    week = 0
+
+    events = []
+    deadlines = 0
+    while True:
+        deadline = scheduler.next_deadline()
+        if deadline is None or deadline > end:
+            break
+
+        # 매주 설정 변경 (휴식 간격 변경)
+        if deadline >= next_settings_change:
+            clock.set(next_settings_change)
+            week += 1
+            settings["time_interval"] = INTERVALS[week % len(INTERVALS)]
+            scheduler.update_settings(settings)
+            next_settings_change += 7 * 24 * 3600
+            continue
+
+        clock.set(deadline)
+        deadlines += 1
+        for kind, meal in scheduler.poll():
+            events.append((clock.now(), kind, meal))
+
+    return events, deadlines
+
+
+def test_year_simulation():
+    """1년 시뮬레이션 결과 검증 및 초당 이벤트 수 출력"""
+    started = time.perf_counter()
+    events, deadlines = simulate_year()
+    elapsed = time.perf_counter() - started
+
+    meals = [e for e in events if e[1] == "meal"]
+    breaks = [e for e in events if e[1] == "break"]
+
+    # 식사 알림은 하루에 점심/저녁 한 번씩
+    assert len(meals) == 365 * 2, f"식사 알림 개수 오류: {len(meals)}"
+
+    # 식사시간(1시간) 안에는 휴식 알림이 없어야 함
+    for when, _, _ in breaks:
+        minutes = when.hour * 60 + when.minute
+        assert not (12 * 60 + 10 <= minutes < 13 * 60 + 10), f"점심시간 중 휴식 알림: {when}"
+        assert not (18 * 60 <= minutes < 19 * 60), f"저녁시간 중 휴식 알림: {when}"
+        assert not (9 * 60 + 30 <= minutes < 9 * 60 + 45), f"스탠드업 중 휴식 알림: {when}"
+        assert not (14 * 60 <= minutes < 15 * 60 + 30), f"집중 시간 중 휴식 알림: {when}"
+
+    print(f"✅ 1년 시뮬레이션 완료: 휴식 {len(breaks)}회, 식사 {len(meals)}회, 데드라인 {deadlines}개")
+    print(f"   소요 시간: {elapsed:.3f}초 ({deadlines / elapsed:,.0f} events/sec)")
+    assert elapsed < 1.0, f"시뮬레이션이 너무 느림: {elapsed:.3f}초"
+
+
+def test_multiple_timers():
+    """여러 휴식 타이머 - 동시에 도래하면 가장 긴 휴식 하나로 합쳐지는지 확인"""
+    clock = VirtualClock(datetime(2025, 1, 6, 9, 0))
+    scheduler = BreakScheduler({
+        "lunch_enabled": False,
+        "dinner_enabled": False,
+        "break_timers": [
+            {"name": "눈 휴식", "interval": 20, "rest_seconds": 20},
+            {"name": "스트레칭", "interval": 45, "rest_seconds": 30},
+            {"name": "걷기", "interval": 60, "rest_seconds": 60}
+        ]
+    }, clock=clock)
+    end = clock.time() + 3 * 3600
+
+    fired = []
+    while scheduler.next_deadline() <= end:
+        clock.set(scheduler.next_deadline())
+        for kind, timer in scheduler.poll():
+            fired.append((clock.now().strftime("%H:%M"), timer["name"]))
+
+    # 10:00, 11:00, 12:00에는 눈 휴식과 걷기가 겹치므로 걷기 하나만 표시
+    assert ("10:00", "걷기") in fired and ("10:00", "눈 휴식") not in fired, fired
+    assert len([f for f in fired if f[0] == "12:00"]) == 1, fired
+    # 다음 휴식은 가장 가까운 타이머
+    due, timer = scheduler.next_break()
+    assert due == scheduler.next_deadline()
+    print(f"✅ 다중 휴식 타이머: {len(fired)}회 알림, 다음 휴식 {timer['name']}")
+
+
+def test_state_restore():
+    """상태 저장/복원 - 재시작해도 휴식 카운트다운과 식사 알림 여부가 유지되는지 확인"""
+    import json
+
+    settings = {"time_interval": 30, "lunch_hour": 12, "lunch_minute": 10}
+    clock = VirtualClock(datetime(2025, 1, 6, 11, 50))
+    scheduler = BreakScheduler(settings, clock=clock)
+    clock.set(datetime(2025, 1, 6, 12, 10).timestamp())
+    assert ("meal", "lunch") in scheduler.poll()
+    expected = (scheduler.next_deadline(), scheduler.next_break()[0])
+
+    # 같은 날 12:10:30에 재시작 - 점심 알림을 다시 띄우지 않고 데드라인을 그대로 이어감
+    state = json.loads(json.dumps(scheduler.export_state()))
+    clock.set(datetime(2025, 1, 6, 12, 10, 30).timestamp())
+    restored = BreakScheduler(settings, clock=clock)
+    assert restored.restore_state(state)
+    assert (restored.next_deadline(), restored.next_break()[0]) == expected
+    assert restored.poll() == []
+
+    # 다음 날 자동 시작 - 휴식 타이머는 지금부터 새로 시작
+    clock.set(datetime(2025, 1, 7, 9, 0).timestamp())
+    next_day = BreakScheduler(settings, clock=clock)
+    assert next_day.restore_state(state)
+    assert next_day.remaining_break_seconds() == 30 * 60
+
+    # 설정이 바뀌었으면 마지막 알림 시각만 이어받고 데드라인은 재계산
+    clock = VirtualClock(datetime(2025, 1, 6, 12, 10, 30))
+    changed = BreakScheduler(dict(settings, time_interval=20), clock=clock)
+    assert changed.restore_state(state)
+    assert changed.timers["휴식"]["last"] == scheduler.timers["휴식"]["last"]
+    # 11:50 + 20분은 이미 지났고 점심시간이므로 점심시간이 끝나는 13:10에 휴식
+    assert changed.next_break()[0] == datetime(2025, 1, 6, 13, 10).timestamp()
+    print(f"✅ 상태 복원: {len(json.dumps(state))} bytes")
+
+
+if __name__ == "__main__":
+    test_year_simulation()
+    test_multiple_timers()
+    test_state_restore()
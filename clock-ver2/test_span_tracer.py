@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+구간 추적 테스트 - 꺼져 있을 때 비용, 중첩 구간과 Chrome 추적 파일 형식, 예외/보관 개수 제한 확인
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from span_tracer import NULL_SPAN, Tracer
+
+
+def test_disabled_is_cheap():
+    """꺼져 있으면 같은 빈 객체, 기록 없음, 구간 하나에 수 µs 미만"""
+    tracer = Tracer()
+    assert tracer.span("load_level_data") is NULL_SPAN
+    count = 100000
+    started = time.perf_counter()
+    for _ in range(count):
+        with tracer.span("load_level_data", "popup"):
+            pass
+    per_span = (time.perf_counter() - started) / count
+    assert tracer.events()[-1]["ph"] == "M" and tracer.write("unused.json") is None
+    print(f"✅ 꺼진 추적: 구간당 {per_span * 1e9:.0f}ns")
+    assert per_span < 5e-6
+
+
+def test_nested_spans_to_chrome_trace():
+    folder = tempfile.mkdtemp()
+    try:
+        tracer = Tracer()
+        tracer.enable(os.path.join(folder, "trace.json"))
+
+        @tracer.traced()
+        def create_widgets():
+            time.sleep(0.002)
+
+        outer = tracer.begin("RestPopup.__init__", "popup", break_name="눈 휴식")
+        with tracer.span("load_level_data", "popup"):
+            time.sleep(0.001)
+        create_widgets()
+        outer.end(stretch_image=False)
+        outer.end()  # 두 번째 종료는 무시
+
+        worker = threading.Thread(target=lambda: tracer.span("weather").end(), name="weather")
+        worker.start()
+        worker.join()
+
+        with open(tracer.write(), encoding="utf-8") as f:
+            trace = json.load(f)
+        spans = {e["name"]: e for e in trace["traceEvents"] if e["ph"] == "X"}
+        assert set(spans) == {"RestPopup.__init__", "load_level_data",
+                              "test_nested_spans_to_chrome_trace.<locals>.create_widgets", "weather"}
+        outer_event, inner = spans["RestPopup.__init__"], spans["load_level_data"]
+        assert outer_event["ts"] <= inner["ts"] and inner["ts"] + inner["dur"] <= outer_event["ts"] + outer_event["dur"]
+        assert inner["dur"] >= 1000  # 마이크로초
+        assert outer_event["args"] == {"break_name": "눈 휴식", "stretch_image": False}
+        names = {e["args"]["name"] for e in trace["traceEvents"] if e["name"] == "thread_name"}
+        assert {"MainThread", "weather"} <= names
+        print(f"✅ Chrome 추적 파일: {len(trace['traceEvents'])}개 이벤트")
+    finally:
+        tracer.disable()
+        shutil.rmtree(folder)
+
+
+def test_error_and_bounded_buffer():
+    tracer = Tracer(max_events=10)
+    tracer.enable(None)
+    try:
+        with tracer.span("load_stretch_image"):
+            raise OSError("broken png")
+    except OSError:
+        pass
+    assert tracer.events()[-1]["args"] == {"error": "OSError"}
+    for i in range(50):
+        tracer.span(f"tick {i}").end()
+    spans = [e for e in tracer.events() if e["ph"] == "X"]
+    assert len(spans) == 10 and spans[-1]["name"] == "tick 49"
+    tracer.disable()
+    print("✅ 예외 기록 / 최근 구간만 보관")
+
+
+if __name__ == "__main__":
+    test_disabled_is_cheap()
+    test_nested_spans_to_chrome_trace()
+    test_error_and_bounded_buffer()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SQLite 상태 저장소 테스트 - 기존 JSON 파일 한 번만 가져오기, 문서 일괄 저장, 휴식 세션 기간 조회, 설정 이력
+"""
+
+import os
+import shutil
+import tempfile
+
+import json_store
+from rest_archive import RestArchive
+from rest_journal import RestJournal
+from sqlite_store import SETTINGS_HISTORY_KEEP, SqliteStore
+from write_behind import WriteBehindStore
+
+
+def make_json_profile(folder):
+    """예전 JSON 파일들: 설정, 휴식 메시지, 레벨 스냅샷 + 저널, SettingsManager 백업"""
+    json_store.save(os.path.join(folder, "clock_settings_ver2.json"), {"time_interval": 25})
+    json_store.save(os.path.join(folder, "rest_messages.json"), {"messages": ["휴식"], "used_messages": []})
+    # 저널 이전의 예전 레벨 파일 (300초) + 저널 3개 중 2개가 스냅샷에 반영됨
+    json_store.save(os.path.join(folder, "rest_level_data.json"), {"level": 3, "total_seconds": 300})
+    journal = RestJournal(os.path.join(folder, "rest_journal.jsonl"),
+                          os.path.join(folder, "rest_level_data.json"), snapshot_every=2)
+    for i in range(3):
+        journal.append(1700000000 + i * 86400, 30 + i)
+    backup_dir = os.path.join(folder, "backup")
+    json_store.save(os.path.join(backup_dir, "settings_backup_20250101_120000.json"), {"time_interval": 40})
+    return backup_dir
+
+
+def open_store(folder, backup_dir=None):
+    store = SqliteStore(os.path.join(folder, "clock_state.db"))
+    result = store.import_json([os.path.join(folder, "clock_settings_ver2.json"),
+                                os.path.join(folder, "rest_messages.json"),
+                                os.path.join(folder, "weather_cache.json")],
+                               journal_path=os.path.join(folder, "rest_journal.jsonl"),
+                               snapshot_path=os.path.join(folder, "rest_level_data.json"),
+                               backup_dir=backup_dir)
+    return store, result
+
+
+def test_import_once():
+    """처음 한 번만 가져오고, 예전 레벨 누적값은 기준값으로 유지"""
+    folder = tempfile.mkdtemp()
+    try:
+        backup_dir = make_json_profile(folder)
+        store, result = open_store(folder, backup_dir)
+        assert result == {"documents": 2, "sessions": 3, "settings_history": 1}
+        journal = store.journal()
+        assert journal.total_seconds == 300 + 30 + 31 + 32 and journal.sessions == 3
+        assert store.load("clock_settings_ver2.json") == {"time_interval": 25}
+        assert [data["time_interval"] for _, data in store.settings_history()] == [25, 40]
+        store.close()
+
+        json_store.save(os.path.join(folder, "clock_settings_ver2.json"), {"time_interval": 99})
+        store, result = open_store(folder, backup_dir)
+        assert result is None  # 이미 가져옴
+        assert store.load("clock_settings_ver2.json") == {"time_interval": 25}
+        assert store.journal().total_seconds == 393
+        store.close()
+        print("✅ JSON 파일 한 번만 가져오기")
+    finally:
+        shutil.rmtree(folder)
+
+
+def test_concurrent_first_import():
+    """같이 시작한 두 인스턴스가 모두 아직 안 가져왔다고 본 경우에도 한 번만 가져옴"""
+    folder = tempfile.mkdtemp()
+    try:
+        backup_dir = make_json_profile(folder)
+        first = SqliteStore(os.path.join(folder, "clock_state.db"))
+        second = SqliteStore(os.path.join(folder, "clock_state.db"))
+        second._get_meta = lambda key, default=None: None  # 첫 번째가 커밋하기 전에 확인한 상황
+        paths = [os.path.join(folder, "clock_settings_ver2.json")]
+        options = dict(journal_path=os.path.join(folder, "rest_journal.jsonl"),
+                       snapshot_path=os.path.join(folder, "rest_level_data.json"), backup_dir=backup_dir)
+        assert first.import_json(paths, **options) is not None
+        assert second.import_json(paths, **options) is None
+        assert len(first.sessions()) == 3 and len(first.settings_history()) == 2
+        first.close()
+        second.close()
+        print("✅ 동시 첫 가져오기 - 한 번만")
+    finally:
+        shutil.rmtree(folder)
+
+
+def test_import_compacted_journal():
+    """정리된 저널의 첫 줄(base)은 세션 행이 아니라 기준값으로 가져옴"""
+    folder = tempfile.mkdtemp()
+    try:
+        json_store.save(os.path.join(folder, "rest_level_data.json"), {"level": 3, "total_seconds": 300})
+        journal = RestJournal(os.path.join(folder, "rest_journal.jsonl"),
+                              os.path.join(folder, "rest_level_data.json"), snapshot_every=3)
+        for i in range(8):
+            journal.append(1700000000 + i * 86400, 30 + i)
+        assert journal.compact(1700000000 + 4 * 86400, RestArchive(os.path.join(folder, "rest_archive"))) == 4
+        journal.append(1700000000 + 8 * 86400, 38)
+
+        store, result = open_store(folder)
+        assert result["sessions"] == 5, result
+        sessions = store.sessions()
+        assert len(sessions) == 5 and min(s["s"] for s in sessions) == 1700000000 + 4 * 86400
+        restored = store.journal()
+        assert restored.sessions == 9 and restored.total_seconds == 300 + sum(range(30, 39))
+        store.close()
+        print("✅ 정리된 저널 가져오기 - base 줄은 기준값")
+    finally:
+        shutil.rmtree(folder)
+
+
+def test_sessions_and_documents():
+    """세션 기간 조회 + 지연 쓰기 일괄 저장 (트랜잭션 하나) + 설정 이력 보관 개수"""
+    folder = tempfile.mkdtemp()
+    try:
+        store, _ = open_store(folder)
+        journal = store.journal(level_func=lambda seconds: 1 + seconds // 100)
+        day = 86400
+        for i in range(100):
+            journal.append(1700000000 + i * day / 4, 60, meal=(i % 10 == 0), early=(i % 3 == 0))
+        assert journal.total_seconds == 6000 and journal.level == 61
+
+        week = store.sessions(1700000000 + 7 * day, 1700000000 + 14 * day)
+        assert len(week) == 28 and week[0]["s"] == 1700000000 + 7 * day
+        assert len(list(journal.iter_sessions())) == 100
+
+        state = WriteBehindStore(interval=60, writer=store.save, reader=store.load,
+                                 batch_writer=store.save_many)
+        for i in range(SETTINGS_HISTORY_KEEP + 5):
+            state.put(os.path.join(folder, "clock_settings_ver2.json"), {"time_interval": i})
+            state.put("weather_cache.json", {"data": {"temp": i}})
+            state.flush()
+        assert state.load("weather_cache.json") == {"data": {"temp": SETTINGS_HISTORY_KEEP + 4}}
+        history = store.settings_history(limit=100)
+        assert len(history) == SETTINGS_HISTORY_KEEP
+        assert history[0][1]["time_interval"] == SETTINGS_HISTORY_KEEP + 4
+        store.close()
+
+        reopened, _ = open_store(folder)
+        assert reopened.journal().total_seconds == 6000
+        reopened.close()
+        print(f"✅ 세션 기간 조회 + 일괄 저장: {store.stats}")
+    finally:
+        shutil.rmtree(folder)
+
+
+if __name__ == "__main__":
+    test_import_once()
+    test_concurrent_first_import()
+    test_import_compacted_journal()
+    test_sessions_and_documents()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI 멈춤 감시 테스트 - 메인 스레드가 멈추면 그 순간의 스택과 멈춘 시간을 파일에 남기고,
+파일에는 최근 기록만 순환 보관하는지 확인
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+import json_store
+from stall_watchdog import StallWatchdog
+
+
+def resize_stretch_image():
+    """큰 이미지 축소처럼 메인 스레드를 붙잡는 작업"""
+    time.sleep(1.0)
+
+
+def test_captures_main_thread_stack():
+    folder = tempfile.mkdtemp()
+    path = os.path.join(folder, "ui_stalls.json")
+    watchdog = StallWatchdog(path, threshold_ms=300, thread_id=threading.get_ident())
+    try:
+        watchdog.start()
+        # 정상 동작: 20ms마다 beat
+        for _ in range(15):
+            watchdog.beat()
+            time.sleep(0.02)
+
+        watchdog.beat()
+        resize_stretch_image()
+        for _ in range(10):  # 다시 살아나서 beat
+            watchdog.beat()
+            time.sleep(0.02)
+        watchdog.stop()
+
+        # 느린 CI에서는 다른 짧은 멈춤도 잡힐 수 있으므로 이미지 작업 중의 멈춤을 찾아서 확인
+        stalls = [stall for stall in json_store.load(path)["stalls"]
+                  if any("resize_stretch_image" in line for line in stall["stack"])]
+        assert len(stalls) == 1 and watchdog.stats["stalls"] >= 1, json_store.load(path)
+        stall = stalls[0]
+        assert stall["stack"][-1].startswith("test_stall_watchdog.py") and "time.sleep" in stall["stack"][-1]
+        assert 300 <= stall["detected_ms"] <= stall["duration_ms"]
+        assert stall["duration_ms"] >= 900, stall["duration_ms"]  # 상한은 두지 않음 (느린 호스트)
+        print(f"✅ 멈춤 감지 {stall['detected_ms']}ms, 전체 {stall['duration_ms']}ms: {stall['stack'][-2]}")
+    finally:
+        watchdog.stop()
+        shutil.rmtree(folder)
+
+
+def test_ring_buffer_on_disk():
+    folder = tempfile.mkdtemp()
+    path = os.path.join(folder, "ui_stalls.json")
+    try:
+        for run in range(2):  # 재시작해도 이전 기록에 이어서 순환
+            watchdog = StallWatchdog(path, threshold_ms=100, max_records=3)
+            watchdog.records()
+            for _ in range(4):
+                watchdog.beat()
+                assert watchdog.check() is None
+                stall = watchdog.check(now=time.monotonic() + 0.3)
+                assert stall is not None and stall["duration_ms"] is None
+                assert watchdog.check(now=time.monotonic() + 0.4) is None  # 같은 멈춤은 한 번만
+                watchdog.beat()
+                watchdog.check()
+                assert stall["duration_ms"] is not None
+            assert watchdog.stats["stalls"] == 4
+        stalls = json_store.load(path)["stalls"]
+        assert len(stalls) == 3 and all(s["duration_ms"] is not None for s in stalls)
+        print(f"✅ 최근 {len(stalls)}개만 보관")
+    finally:
+        shutil.rmtree(folder)
+
+
+if __name__ == "__main__":
+    test_captures_main_thread_stack()
+    test_ring_buffer_on_disk()
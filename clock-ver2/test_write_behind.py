@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+지연 쓰기 상태 저장소 테스트 - 여러 번 저장해도 경로당 한 번만 기록되는지, 실패 시 재시도, 종료 시 기록 확인
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import json_store
+from write_behind import WriteBehindStore
+
+
+class CountingWriter:
+    """기록 횟수를 세는 writer (fail_once면 첫 기록 실패)"""
+
+    def __init__(self, fail_once=False):
+        self.calls = []
+        self.fail_once = fail_once
+
+    def __call__(self, path, data, **options):
+        self.calls.append(os.path.basename(path))
+        if self.fail_once:
+            self.fail_once = False
+            raise OSError("네트워크 공유 폴더 연결 끊김")
+        json_store.save(path, data, **options)
+
+
+def test_coalesced_writes():
+    """한 번의 휴식에서 여러 번 저장해도 기록 주기에 파일당 한 번"""
+    folder = tempfile.mkdtemp()
+    try:
+        writer = CountingWriter()
+        store = WriteBehindStore(interval=60, writer=writer)
+        messages = os.path.join(folder, "rest_messages.json")
+        settings = os.path.join(folder, "sub", "clock_settings_ver2.json")
+
+        for i in range(10):
+            store.put(messages, {"used_messages": list(range(i))})
+        store.put(settings, {"time_interval": 20}, indent=4)
+        assert writer.calls == [] and not os.path.exists(messages)
+        assert store.load(messages) == {"used_messages": list(range(9))}  # 메모리 상태
+
+        assert store.flush() == 2
+        assert sorted(writer.calls) == ["clock_settings_ver2.json", "rest_messages.json"]
+        assert store.flush() == 0
+        json_store.invalidate()
+        assert json_store.load(settings, strict=True) == {"time_interval": 20}
+        print(f"✅ 쓰기 합치기: {store.stats}")
+    finally:
+        shutil.rmtree(folder)
+
+
+def test_load_unchanged_and_copy():
+    """파일이 바뀌지 않았으면 다시 파싱하지 않고, 돌려준 값을 고쳐도 저장된 상태는 그대로"""
+    folder = tempfile.mkdtemp()
+    try:
+        path = os.path.join(folder, "weather_cache.json")
+        json_store.save(path, {"data": {"temp": 21}})
+        store = WriteBehindStore(interval=60)
+        reads = json_store.stats["reads"]
+        first = store.load(path)
+        first["data"]["temp"] = 99
+        assert store.load(path) == {"data": {"temp": 21}}
+        assert json_store.stats["reads"] == reads  # 방금 저장한 파일은 파싱 캐시 사용
+
+        # 기록이 끝나면 메모리 상태 대신 파일을 따름 (다른 프로그램이 고친 내용 반영)
+        store.put(path, {"data": {"temp": 22}})
+        store.flush()
+        assert store._state == {}
+        json_store.save(path, {"data": {"temp": 23}})
+        assert store.load(path) == {"data": {"temp": 23}}
+        assert store.load(os.path.join(folder, "missing.json"), default={}) == {}
+        print("✅ 변경 없는 파일 재파싱 없음")
+    finally:
+        shutil.rmtree(folder)
+
+
+def test_retry_and_close():
+    """기록 실패는 다음 주기에 재시도, close()는 남은 변경을 기록"""
+    folder = tempfile.mkdtemp()
+    try:
+        writer = CountingWriter(fail_once=True)
+        store = WriteBehindStore(interval=0.05, writer=writer)
+        path = os.path.join(folder, "rest_level_data.json")
+        store.start()
+        store.put(path, {"level": 2, "total_seconds": 40})
+
+        deadline = time.time() + 2
+        while not os.path.exists(path) and time.time() < deadline:
+            time.sleep(0.02)
+        assert os.path.exists(path) and store.stats["errors"] == 1
+
+        store.put(path, {"level": 3, "total_seconds": 100})
+        store.close()
+        with open(path, 'r', encoding='utf-8') as f:
+            assert json.load(f)["level"] == 3
+        print(f"✅ 재시도 및 종료 시 기록: {writer.calls}")
+    finally:
+        shutil.rmtree(folder)
+
+
+def test_flush_one_path():
+    """설정 저장처럼 한 파일만 바로 기록 - 실패하면 변경 표시가 남아 호출한 쪽이 알 수 있음"""
+    folder = tempfile.mkdtemp()
+    try:
+        writer = CountingWriter(fail_once=True)
+        store = WriteBehindStore(interval=60, writer=writer)
+        settings = os.path.join(folder, "clock_settings_ver2.json")
+        messages = os.path.join(folder, "rest_messages.json")
+        store.put(messages, {"messages": ["휴식"]})
+        store.put(settings, {"time_interval": 25})
+
+        assert store.flush(settings) == 0 and store.is_dirty(settings)  # 실패 -> 다시 시도 대기
+        assert store.flush(settings) == 1 and not store.is_dirty(settings)
+        assert writer.calls == ["clock_settings_ver2.json"] * 2 and store.is_dirty(messages)
+        with open(settings, 'r', encoding='utf-8') as f:
+            assert json.load(f)["time_interval"] == 25
+        assert store.flush(settings) == 0  # 기록할 것 없음
+        print("✅ 한 파일만 바로 기록")
+    finally:
+        shutil.rmtree(folder)
+
+
+if __name__ == "__main__":
+    test_coalesced_writes()
+    test_load_unchanged_and_copy()
+    test_retry_and_close()
+    test_flush_one_path()
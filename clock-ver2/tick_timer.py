@@ -0,0 +1,123 @@
+"""
+ClockApp Ver2 - 벽시계 경계 정렬 타이머
+after() 체인의 누적 지연(drift) 없이 다음 초/분 경계에 맞춰 깨어나고,
+매 틱의 지연(lateness)을 히스토그램으로 기록
+"""
+
+import math
+import time
+
+import json_store
+
+
+def next_boundary(period=1.0, now=None):
+    """now 이후 첫 period 배수 시각 (epoch) - 예: 다음 초/분 경계"""
+    now = time.time() if now is None else now
+    return (math.floor(now / period) + 1) * period
+
+
+class LatencyHistogram:
+    """지연 시간 히스토그램 (ms 단위 고정 버킷)"""
+
+    # 각 버킷의 상한 (ms) - 마지막 버킷은 그 이상 전부
+    BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value_ms):
+        """지연 시간 하나 기록"""
+        value_ms = max(0.0, value_ms)
+        index = len(self.BUCKETS)
+        for i, upper in enumerate(self.BUCKETS):
+            if value_ms <= upper:
+                index = i
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value_ms
+        self.max = max(self.max, value_ms)
+
+    def percentile(self, p):
+        """p 백분위 값 (해당 버킷의 상한, 마지막 버킷이면 최댓값)"""
+        if not self.count:
+            return 0.0
+        target = math.ceil(self.count * p / 100.0)
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return float(self.BUCKETS[i]) if i < len(self.BUCKETS) else self.max
+        return self.max
+
+    def summary(self):
+        """요약 통계 (ms)"""
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 2) if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+            "max": round(self.max, 2)
+        }
+
+    def prometheus_samples(self):
+        """Prometheus 히스토그램 형식 (초 단위 누적 버킷) - [(접미사, 레이블, 값), ...]"""
+        samples = []
+        cumulative = 0
+        for upper, bucket_count in zip(self.BUCKETS, self.counts):
+            cumulative += bucket_count
+            samples.append(("_bucket", {"le": str(upper / 1000)}, cumulative))
+        samples.append(("_bucket", {"le": "+Inf"}, self.count))
+        samples.append(("_sum", {}, self.total / 1000))
+        samples.append(("_count", {}, self.count))
+        return samples
+
+    def dump(self, path):
+        """요약과 버킷별 개수를 JSON 파일로 저장"""
+        data = {
+            "saved_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "summary": self.summary(),
+            "buckets_ms": {f"<={upper}": count for upper, count in zip(self.BUCKETS, self.counts)},
+            "overflow": self.counts[-1]
+        }
+        json_store.save(path, data, backup=False, lock=False)
+
+
+class AlignedTicker:
+    """지정한 벽시계 시각에 맞춰 after() 하나만 예약하는 타이머
+
+    매번 목표 시각까지 남은 시간을 새로 계산하므로 콜백 실행 시간이 주기에 누적되지 않는다.
+    실제 호출 시각과 목표 시각의 차이를 lateness 히스토그램에 기록한다.
+    """
+
+    def __init__(self, widget, callback, histogram=None):
+        self.widget = widget
+        self.callback = callback
+        self.lateness = histogram or LatencyHistogram()
+        self._after_id = None
+        self._target = None
+
+    def arm(self, deadline):
+        """deadline(epoch)에 콜백이 호출되도록 예약 (기존 예약은 취소)"""
+        self.cancel()
+        self._target = deadline
+        delay_ms = max(0, math.ceil((deadline - time.time()) * 1000))
+        self._after_id = self.widget.after(delay_ms, self._fire)
+
+    def cancel(self):
+        """예약 취소"""
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def _fire(self):
+        self._after_id = None
+        if self._target is not None:
+            self.lateness.record((time.time() - self._target) * 1000)
+        self.callback()
@@ -0,0 +1,160 @@
+"""
+ClockApp Ver2 - 지연 쓰기(write-behind) 상태 저장소
+JSON 상태(설정, 레벨 스냅샷, 휴식 메시지, 날씨 캐시 등)를 메모리에 두고 변경 표시만 한 뒤,
+백그라운드 스레드가 일정 주기마다 / 종료 시 한 번에 파일로 기록
+(AppData가 네트워크 공유 폴더여도 Tk 스레드가 파일 쓰기로 멈추지 않음)
+"""
+
+import atexit
+import copy
+import logging
+import os
+import threading
+
+import json_store
+
+log = logging.getLogger("clockapp.write_behind")
+
+DEFAULT_FLUSH_INTERVAL = 30.0  # 기본 기록 주기 (초)
+
+
+class WriteBehindStore:
+    """경로별 JSON 상태를 메모리에 유지하고 변경분만 모아서 기록
+
+    load()는 기록 대기 중인 메모리 상태가 있으면 그것을, 없으면 파일을 돌려주며 (json_store가
+    파일이 바뀌지 않았으면 다시 파싱하지 않음), put()은 메모리만 갱신하고 파일 쓰기는
+    flush()에서 경로당 한 번으로 합쳐진다.
+    interval이 0 이하이면 put() 즉시 기록한다 (write-through).
+    batch_writer가 있으면 한 주기의 변경을 한 번에 넘긴다 (예: SQLite 트랜잭션 하나).
+    """
+
+    def __init__(self, interval=DEFAULT_FLUSH_INTERVAL, writer=json_store.save, reader=json_store.load,
+                 batch_writer=None):
+        self.interval = interval
+        self._writer = writer
+        self._reader = reader
+        self._batch_writer = batch_writer  # [(경로, 데이터, 옵션), ...] 전체를 기록 (전부 성공/실패)
+        self._state = {}    # 경로 -> 데이터 (아직 파일에 기록되지 않은 메모리 상태)
+        self._dirty = {}    # 경로 -> 쓰기 옵션 (기록 대기)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread = None
+        self.stats = {"puts": 0, "writes": 0, "coalesced": 0, "loads": 0, "errors": 0}
+
+    def load(self, path, default=None):
+        """경로의 상태 (복사본) - 기록 대기 중이면 메모리에서, 아니면 파일에서"""
+        with self._lock:
+            if path in self._state:
+                return copy.deepcopy(self._state[path])
+        try:
+            data = self._reader(path)
+        except Exception as e:
+            log.warning("상태 파일 읽기 실패 (%s): %s", os.path.basename(path), e)
+            data = None
+        self.stats["loads"] += 1
+        with self._lock:
+            # 읽는 동안 다른 스레드가 put() 했으면 그 값을 우선
+            if path in self._state:
+                return copy.deepcopy(self._state[path])
+        return default if data is None else data
+
+    def put(self, path, data, **options):
+        """상태 갱신 + 변경 표시 (options는 writer에 전달, 예: indent=4)"""
+        snapshot = copy.deepcopy(data)
+        with self._lock:
+            if path in self._dirty:
+                self.stats["coalesced"] += 1
+            self._state[path] = snapshot
+            self._dirty[path] = options
+            self.stats["puts"] += 1
+        if self.interval <= 0:
+            self.flush()
+
+    def is_dirty(self, path=None):
+        """기록 대기 중인 변경이 있는지"""
+        with self._lock:
+            return bool(self._dirty) if path is None else path in self._dirty
+
+    def flush(self, path=None):
+        """대기 중인 변경을 기록 (path가 있으면 그 파일만) - 기록한 파일 수 반환
+
+        실패한 파일은 다음 주기에 다시 시도하도록 변경 표시를 남긴다 (is_dirty(path)로 확인).
+        """
+        with self._flush_lock:
+            with self._lock:
+                if path is None:
+                    pending = [(p, self._state[p], options) for p, options in self._dirty.items()]
+                    self._dirty = {}
+                elif path in self._dirty:
+                    pending = [(path, self._state[path], self._dirty.pop(path))]
+                else:
+                    pending = []
+
+            if self._batch_writer is not None and pending:
+                try:
+                    self._batch_writer(pending)
+                except Exception as e:
+                    self.stats["errors"] += 1
+                    log.warning("상태 일괄 기록 실패 (%s개): %s", len(pending), e)
+                    self._requeue(pending)
+                    return 0
+                self.stats["writes"] += len(pending)
+                self._written(pending)
+                return len(pending)
+
+            written = 0
+            for path, data, options in pending:
+                try:
+                    self._writer(path, data, **options)
+                    written += 1
+                    self.stats["writes"] += 1
+                    self._written([(path, data, options)])
+                except Exception as e:
+                    self.stats["errors"] += 1
+                    log.warning("상태 파일 기록 실패 (%s): %s", os.path.basename(path), e)
+                    self._requeue([(path, data, options)])
+            return written
+
+    def _written(self, items):
+        """기록 중 새 변경이 없으면 메모리 상태를 내려놓음 (이후 load()는 파일/저장소에서)"""
+        with self._lock:
+            for path, data, _options in items:
+                if path not in self._dirty and self._state.get(path) is data:
+                    del self._state[path]
+
+    def _requeue(self, items):
+        """그 사이 새 변경이 없으면 다음 주기에 다시 시도"""
+        with self._lock:
+            for path, _data, options in items:
+                self._dirty.setdefault(path, options)
+
+    def start(self, interval=None):
+        """백그라운드 기록 스레드 시작 (이미 실행 중이면 주기만 변경)"""
+        if interval is not None:
+            self.interval = interval
+        if self._thread is None and self.interval > 0:
+            self._stopped = False
+            self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+        self._wake.set()  # 새 주기 바로 반영
+
+    def _run(self):
+        while not self._stopped:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            if self._stopped:
+                break
+            if self.is_dirty():
+                self.flush()
+
+    def close(self):
+        """스레드 정지 + 남은 변경 기록 (종료 시 호출)"""
+        self._stopped = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+        return self.flush()